@@ -0,0 +1 @@
+from Benchmarks.suite import BENCHMARKS, compare, run_benchmarks  # noqa: F401
@@ -0,0 +1,46 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from Benchmarks.suite import BENCHMARKS, compare, run_benchmarks
+
+BASELINE: Path = Path(__file__).with_name("baseline.json")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks", description="Benchmark COM-bound hot paths on the simulator")
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run, defaults to all: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--latency", type=float, default=0.0001, help="Simulated seconds per scripting call")
+    parser.add_argument("--json", type=Path, help="Write the results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Call count baseline to check against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the measured call counts as the new baseline")
+    args = parser.parse_args()
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_benchmarks(latency=args.latency, names=args.names or None)
+    for name, result in results["benchmarks"].items():
+        print(
+            f"{name:<28} {result['seconds'] * 1000:>10.2f} ms {result['calls']:>8} calls "
+            f"{result['roundtrips']:>5} round trips {result.get('peak_bytes', 0) / 1024:>10.1f} KiB peak"
+        )
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.update_baseline:
+        args.baseline.write_text(
+            json.dumps(
+                {n: {"calls": r["calls"], "roundtrips": r["roundtrips"]} for n, r in results["benchmarks"].items()},
+                indent=2,
+            )
+            + "\n"
+        )
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text()))
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+import contextlib
+import io
+import platform
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+from SapScript.Backend import Button, Field, Grid, SimScreen, SimulatorBackend
+from SapScript.Core.action import Actions
+from SapScript.Core.sap import SAP
+from SapScript.Gui.elements import DEFAULT_PROPERTIES, Table
+from SapScript.Gui.vkeys import VKEYS, VKeys
+from SapScript.Utils.systems import Systems
+
+GRID_ID: str = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+GRID_ROWS: int = 200
+GRID_COLUMNS: list[str] = [f"COL{c}" for c in range(8)]
+FIELD_IDS: list[str] = [f"wnd[0]/usr/txtFIELD{i:02d}" for i in range(30)]
+
+#: name -> setup function, the setup receives the simulator and returns the callable to measure
+BENCHMARKS: dict[str, Callable[[SimulatorBackend], Callable[[], Any]]] = {}
+
+#: Temporary directories created by setup functions, removed once their benchmark finished
+_temp_dirs: list[tempfile.TemporaryDirectory[str]] = []
+
+
+def benchmark(name: str) -> Callable[[Callable[[SimulatorBackend], Callable[[], Any]]], Any]:
+    """Registers a benchmark setup function under a name"""
+
+    def register(setup: Callable[[SimulatorBackend], Callable[[], Any]]) -> Callable[[SimulatorBackend], Callable[[], Any]]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def simulator(latency: float = 0.0) -> SimulatorBackend:
+    """Returns a simulator with the BENCH transaction: 30 fields, a button and a 200 x 8 lazy grid"""
+    _sim = SimulatorBackend(latency=latency)
+    _sim.add_screen(
+        SimScreen(
+            "BENCH",
+            "SAPLBENCH",
+            100,
+            elements=[Field(i.rsplit("/", 1)[-1]) for i in FIELD_IDS]
+            + [Button("btnEXECUTE"), Grid(GRID_ID[11:], GRID_COLUMNS, GRID_ROWS, visible_rows=25, lazy=True)],
+        ),
+        transaction="ZBENCH",
+    )
+    return _sim
+
+
+def _sap(sim: SimulatorBackend) -> SAP:
+    _sap = SAP("DEV", backend=sim)
+    _sap.start_transaction("ZBENCH")
+    return _sap
+
+
+def _table(sim: SimulatorBackend) -> Table:
+    return Table(element=_sap(sim).get_element(GRID_ID, cached=False).value)
+
+
+@benchmark("table.get_cell_value")
+def _table_get_cell_value(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+    return lambda: [_t.get_cell_value(r, c) for r in range(GRID_ROWS) for c in GRID_COLUMNS[:2]]
+
+
+@benchmark("table.get_row_data")
+def _table_get_row_data(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+    return lambda: [_t.get_row_data(r) for r in range(GRID_ROWS)]
+
+
+@benchmark("table.iter")
+def _table_iter(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+    return lambda: [row.COL0 for row in _t]
+
+
+@benchmark("table.iter_rows")
+def _table_iter_rows(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+    return lambda: list(_t.iter_rows())
+
+
+@benchmark("table.read_all")
+def _table_read_all(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+    return lambda: _t.read_all()
+
+
+@benchmark("table.pprint")
+def _table_pprint(sim: SimulatorBackend) -> Callable[[], Any]:
+    _t = _table(sim)
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _t.pprint()
+
+    return run
+
+
+@benchmark("sap.get_element")
+def _sap_get_element(sim: SimulatorBackend) -> Callable[[], Any]:
+    _s = _sap(sim)
+    return lambda: [_s.get_element(i, cached=True) for _ in range(10) for i in FIELD_IDS]
+
+
+@benchmark("sap.get_element.uncached")
+def _sap_get_element_uncached(sim: SimulatorBackend) -> Callable[[], Any]:
+    _s = _sap(sim)
+    return lambda: [_s.get_element(i, cached=False) for _ in range(10) for i in FIELD_IDS]
+
+
+@benchmark("element.properties")
+def _element_properties(sim: SimulatorBackend) -> Callable[[], Any]:
+    _s = _sap(sim)
+    _elements = [_s.get_element(i, cached=True).value for i in FIELD_IDS]
+    return lambda: [[getattr(e, p) for p in DEFAULT_PROPERTIES] for _ in range(3) for e in _elements]
+
+
+@benchmark("element.fetch")
+def _element_fetch(sim: SimulatorBackend) -> Callable[[], Any]:
+    _s = _sap(sim)
+    _elements = [_s.get_element(i, cached=True).value for i in FIELD_IDS]
+    return lambda: [e.fetch() and [getattr(e, p) for p in DEFAULT_PROPERTIES] for _ in range(3) for e in _elements]
+
+
+@benchmark("actions.press")
+def _actions_press(sim: SimulatorBackend) -> Callable[[], Any]:
+    _button = _sap(sim).get_element("wnd[0]/usr/btnEXECUTE").value
+    return lambda: [Actions.press(_button) for _ in range(50)]
+
+
+@benchmark("actions.select")
+def _actions_select(sim: SimulatorBackend) -> Callable[[], Any]:
+    _field = _sap(sim).get_element(FIELD_IDS[0]).value
+    return lambda: [Actions.select(_field) for _ in range(50)]
+
+
+@benchmark("vkeys.get_key_id")
+def _vkeys_get_key_id(sim: SimulatorBackend) -> Callable[[], Any]:
+    _keys = ["ENTER", "F3", "ctrl+s", "Shift + F4", "CONTROL+F10", "ESC", "SHIFT+DELETE", "CTRL+#"] * 250
+    return lambda: [VKeys().get_key_id(k) for k in _keys]
+
+
+@benchmark("vkeys.get_key_id.linear")
+def _vkeys_get_key_id_linear(sim: SimulatorBackend) -> Callable[[], Any]:
+    _keys = ["ENTER", "F3", "Shift + F4", "CONTROL+F10", "SHIFT+DELETE", "CTRL+#"] * 250
+
+    def _linear(key: str) -> int:
+        _search = key.strip().upper().replace(" ", "").replace("CONTROL", "CTRL").replace("DELETE", "DEL")
+        return list(VKEYS).index(_search.replace("INSERT", "INS"))
+
+    return lambda: [_linear(k) for k in _keys]
+
+
+def _landscape_files() -> Path:
+    _tmp = tempfile.TemporaryDirectory(prefix="sapscript-bench-")
+    _temp_dirs.append(_tmp)
+    _dir = Path(_tmp.name)
+    _services = "".join(
+        f'<Service type="SAPGUI" uuid="s{i}" name="SYS{i:04d}" systemid="S{i % 100:02d}" server="host{i}:32{i % 100:02d}"/>'
+        for i in range(2000)
+    )
+    (_dir / "include.xml").write_text(f'<?xml version="1.0"?><Landscape><Services>{_services}</Services></Landscape>')
+    _landscape = _dir / "SAPUILandscape.xml"
+    _landscape.write_text(
+        f'<?xml version="1.0"?><Landscape><Services>{_services}</Services>'
+        f'<Includes><Include url="{(_dir / "include.xml").as_uri()}" index="0"/></Includes></Landscape>'
+    )
+    return _landscape
+
+
+@benchmark("systems.parse")
+def _systems_parse(sim: SimulatorBackend) -> Callable[[], Any]:
+    _landscape = _landscape_files()
+    return lambda: Systems(landscape_file=_landscape, use_cache=False).available_systems()
+
+
+@benchmark("systems.parse.cached")
+def _systems_parse_cached(sim: SimulatorBackend) -> Callable[[], Any]:
+    _landscape = _landscape_files()
+    Systems(landscape_file=_landscape, cache_dir=_landscape.parent / "cache")
+    return lambda: Systems(landscape_file=_landscape, cache_dir=_landscape.parent / "cache").available_systems()
+
+
+def run_benchmarks(
+    latency: float = 0.0, names: Optional[list[str]] = None, allocations: bool = True
+) -> dict[str, Any]:
+    """
+    Runs the benchmarks against a fresh simulator each
+
+    Args:
+        latency: Seconds of simulated latency per scripting call
+        names: Names of the benchmarks to run, defaults to all
+        allocations: Also measure peak traced memory in a second, untimed pass
+
+    Returns:
+        Machine-readable results: meta data and per benchmark seconds, calls, round trips,
+        calls by member name and peak allocated bytes
+    """
+    _results: dict[str, Any] = {}
+    for _name in names if names is not None else list(BENCHMARKS):
+        try:
+            _sim = simulator(latency=latency)
+            _run = BENCHMARKS[_name](_sim)
+            _sim.reset_counters()
+            _start = time.perf_counter()
+            _run()
+            _seconds = time.perf_counter() - _start
+            _result: dict[str, Any] = {
+                "seconds": round(_seconds, 6),
+                "calls": _sim.total_calls,
+                "roundtrips": _sim.roundtrips,
+                "calls_by_member": dict(sorted(_sim.calls.items())),
+            }
+            if allocations:
+                _sim = simulator(latency=0.0)
+                _run = BENCHMARKS[_name](_sim)
+                tracemalloc.start()
+                try:
+                    _run()
+                    _result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+            _results[_name] = _result
+        finally:
+            while _temp_dirs:
+                _temp_dirs.pop().cleanup()
+    return {
+        "meta": {"python": platform.python_version(), "latency": latency, "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "benchmarks": _results,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """
+    Compares benchmark results with a baseline of scripting call counts
+
+    Args:
+        results: Output of run_benchmarks
+        baseline: Mapping of benchmark name to {'calls': int, 'roundtrips': int}
+
+    Returns:
+        One message per benchmark that needs more calls or round trips than its baseline
+    """
+    _regressions = []
+    for _name, _expected in baseline.items():
+        _actual = results["benchmarks"].get(_name)
+        if _actual is None:
+            continue
+        for _key in ("calls", "roundtrips"):
+            if _key in _expected and _actual[_key] > _expected[_key]:
+                _regressions.append(f"{_name}: {_key} {_actual[_key]} > baseline {_expected[_key]}")
+    return _regressions
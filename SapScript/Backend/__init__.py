@@ -0,0 +1,45 @@
+from typing import TYPE_CHECKING, Any
+from SapScript.Backend.base import Backend, Dispatch, get_backend, set_backend  # noqa: F401
+
+if TYPE_CHECKING:
+    from SapScript.Backend.instrument import (  # noqa: F401
+        Histogram,
+        Instrumentation,
+        InstrumentedBackend,
+        JsonLinesSink,
+        OpenTelemetrySink,
+        SummarySink,
+    )
+    from SapScript.Backend.simulator import Button, Field, Grid, SimScreen, SimulatorBackend  # noqa: F401
+    from SapScript.Backend.win32 import Win32Backend  # noqa: F401
+
+#: Public name -> module it is imported from on first access
+_LAZY: dict[str, str] = {
+    "Histogram": "SapScript.Backend.instrument",
+    "Instrumentation": "SapScript.Backend.instrument",
+    "InstrumentedBackend": "SapScript.Backend.instrument",
+    "JsonLinesSink": "SapScript.Backend.instrument",
+    "OpenTelemetrySink": "SapScript.Backend.instrument",
+    "SummarySink": "SapScript.Backend.instrument",
+    "Button": "SapScript.Backend.simulator",
+    "Field": "SapScript.Backend.simulator",
+    "Grid": "SapScript.Backend.simulator",
+    "SimScreen": "SapScript.Backend.simulator",
+    "SimulatorBackend": "SapScript.Backend.simulator",
+    "Win32Backend": "SapScript.Backend.win32",
+}
+
+
+def __getattr__(name: str) -> Any:
+    _module = _LAZY.get(name)
+    if _module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    _value = getattr(importlib.import_module(_module), name)
+    globals()[name] = _value
+    return _value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
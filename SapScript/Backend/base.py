@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+#: A SAP GUI scripting object, a win32com CDispatch or a simulator object
+Dispatch = Any
+
+
+class Backend(ABC):
+    """
+    Backend - Source of the SAP GUI scripting objects
+
+    SAP reaches the SAP GUI scripting API only through get_object, so the
+    Windows COM implementation can be swapped for the in-memory simulator.
+    """
+
+    name: str = "base"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def get_object(self, name: str) -> Dispatch:
+        """
+        Returns a registered scripting object, e.g. 'SAPGUI'
+
+        Args:
+            name: The name of the object in the running object table
+        """
+
+    def initialize(self) -> None:
+        """Prepares the calling thread or process for using the backend"""
+
+    def uninitialize(self) -> None:
+        """Releases what initialize acquired for the calling thread or process"""
+
+
+_default_backend: Optional[Backend] = None
+
+
+def get_backend() -> Backend:
+    """
+    Returns the process-wide default backend, the Windows COM backend unless set_backend was called
+    """
+    global _default_backend
+    if _default_backend is None:
+        from .win32 import Win32Backend
+
+        _default_backend = Win32Backend()
+    return _default_backend
+
+
+def set_backend(backend: Optional[Backend]) -> None:
+    """
+    Sets the process-wide default backend used by SAP instances created without one
+
+    Args:
+        backend: The backend to use, None restores the Windows COM backend
+    """
+    global _default_backend
+    _default_backend = backend
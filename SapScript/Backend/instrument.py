@@ -0,0 +1,429 @@
+from abc import ABC, abstractmethod
+import json
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO
+from .base import Backend, Dispatch
+
+#: Values returned by the scripting API that are passed through without a proxy
+PRIMITIVES: tuple[type, ...] = (str, int, float, bool, bytes, type(None), tuple, list, dict)
+
+#: Methods whose first argument is an element id, used to label the returned element
+FIND_METHODS: frozenset[str] = frozenset({"findbyid", "findbyname", "findbynameex", "findallbyname", "findallbynameex"})
+
+_METHOD_TYPES = (types.MethodType, types.FunctionType, types.BuiltinFunctionType)
+
+
+class CallEvent:
+    """
+    CallEvent - One timed call on the scripting API
+    """
+
+    __slots__ = ("time", "member", "id", "kind", "seconds", "error")
+
+    def __init__(self, time: float, member: str, id: str, kind: str, seconds: float, error: Optional[str] = None) -> None:
+        self.time: float = time
+        self.member: str = member
+        self.id: str = id
+        self.kind: str = kind
+        self.seconds: float = seconds
+        self.error: str | None = error
+
+    def __repr__(self) -> str:
+        return f"CallEvent({self.kind} {self.id}.{self.member}, {self.seconds * 1000:.3f}ms)"
+
+    def __str__(self) -> str:
+        return f"CallEvent({self.kind} {self.id}.{self.member}, {self.seconds * 1000:.3f}ms)"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the event as a JSON-serializable dictionary"""
+        return {f: getattr(self, f) for f in self.__slots__}
+
+
+class Histogram:
+    """
+    Histogram - Latency histogram with power-of-two microsecond buckets
+
+    Bucket i counts latencies below 2**i microseconds (and at least 2**(i-1)),
+    so recording is one bit_length and one list increment.
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets: list[int] = [0] * 32
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram({self.count} calls, p50={self.percentile(50) * 1000:.3f}ms, p99={self.percentile(99) * 1000:.3f}ms)"
+
+    def __str__(self) -> str:
+        return f"Histogram({self.count} calls, p50={self.percentile(50) * 1000:.3f}ms, p99={self.percentile(99) * 1000:.3f}ms)"
+
+    def observe(self, seconds: float) -> None:
+        """Adds one latency"""
+        self.buckets[min(int(seconds * 1_000_000).bit_length(), 31)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "Histogram") -> None:
+        """Adds the counts of another histogram"""
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean latency in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Returns the upper bound in seconds of the bucket holding the p-th percentile"""
+        _rank = self.count * p / 100
+        _seen = 0
+        for _index, _count in enumerate(self.buckets):
+            _seen += _count
+            if _count and _seen >= _rank:
+                return min((1 << _index) / 1_000_000, self.max)
+        return self.max
+
+
+class Sink(ABC):
+    """
+    Sink - Receiver of the call events of an Instrumentation
+    """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def record(self, event: CallEvent) -> None:
+        """Handles one call event"""
+
+    def close(self) -> None:
+        """Flushes and releases what the sink holds"""
+
+
+class SummarySink(Sink):
+    """
+    SummarySink - In-memory call counts and latency histograms per member and per call site
+
+    A call site is the pair of element id and member, e.g. ('wnd[0]/usr/txtA', 'Text').
+    """
+
+    def __init__(self) -> None:
+        self.by_member: dict[str, Histogram] = {}
+        self.by_site: dict[tuple[str, str], Histogram] = {}
+        self.errors: int = 0
+
+    def __repr__(self) -> str:
+        return f"SummarySink({self.calls} calls, {len(self.by_site)} call sites)"
+
+    def __str__(self) -> str:
+        return self.report()
+
+    @property
+    def calls(self) -> int:
+        """Returns the number of recorded calls"""
+        return sum(h.count for h in self.by_member.values())
+
+    @property
+    def seconds(self) -> float:
+        """Returns the time spent in recorded calls"""
+        return sum(h.total for h in self.by_member.values())
+
+    def record(self, event: CallEvent) -> None:
+        _histogram = self.by_site.get((event.id, event.member))
+        if _histogram is None:
+            _histogram = self.by_site[(event.id, event.member)] = Histogram()
+            self.by_member.setdefault(event.member, Histogram())
+        _histogram.observe(event.seconds)
+        self.by_member[event.member].observe(event.seconds)
+        if event.error is not None:
+            self.errors += 1
+
+    def top(self, n: int = 10, by: str = "total") -> list[tuple[tuple[str, str], Histogram]]:
+        """
+        Returns the n slowest call sites
+
+        Args:
+            n: Number of call sites to return
+            by: 'total', 'max', 'mean' or 'count'
+        """
+        return sorted(self.by_site.items(), key=lambda i: getattr(i[1], by), reverse=True)[:n]
+
+    def report(self, n: int = 10) -> str:
+        """Returns the n call sites with the most total time as a table"""
+        _lines = [
+            f"{self.calls} calls in {self.seconds:.3f}s, {self.errors} errors",
+            f"{'total ms':>10} {'calls':>7} {'mean ms':>9} {'p99 ms':>9} {'max ms':>9}  call site",
+        ]
+        for (_id, _member), _histogram in self.top(n):
+            _lines.append(
+                f"{_histogram.total * 1000:>10.3f} {_histogram.count:>7} {_histogram.mean * 1000:>9.3f} "
+                f"{_histogram.percentile(99) * 1000:>9.3f} {_histogram.max * 1000:>9.3f}  {_id}.{_member}"
+            )
+        return "\n".join(_lines)
+
+
+class JsonLinesSink(Sink):
+    """
+    JsonLinesSink - Writes every call event as one JSON object per line
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path: Path = Path(path)
+        self._file: TextIO = self.path.open("a", encoding="utf-8", buffering=1 << 16)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"JsonLinesSink({self.path})"
+
+    def __str__(self) -> str:
+        return f"JsonLinesSink({self.path})"
+
+    def record(self, event: CallEvent) -> None:
+        _line = json.dumps(event.to_dict())
+        with self._lock:
+            self._file.write(_line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class OpenTelemetrySink(Sink):
+    """
+    OpenTelemetrySink - Emits every call event as an OpenTelemetry span
+
+    Requires the opentelemetry-api package, pip install opentelemetry-api
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace  # type: ignore
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetrySink requires opentelemetry-api, install it with 'pip install opentelemetry-api'"
+            ) from e
+        self._trace = trace
+        self.tracer: Any = tracer if tracer is not None else trace.get_tracer("SapScript")
+
+    def record(self, event: CallEvent) -> None:
+        _end = time.time_ns()
+        _span = self.tracer.start_span(
+            f"{event.kind} {event.member}",
+            start_time=_end - int(event.seconds * 1_000_000_000),
+            attributes={"sap.element.id": event.id, "sap.member": event.member, "sap.kind": event.kind},
+        )
+        if event.error is not None:
+            _span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, event.error))
+        _span.end(end_time=_end)
+
+
+class Instrumentation:
+    """
+    Instrumentation - Times scripting calls made through instrumented objects and hands them to sinks
+
+    Objects are instrumented by wrapping them with instrument(). Code that works
+    on unwrapped objects pays nothing, and a disabled Instrumentation only
+    forwards calls without timing them.
+    """
+
+    def __init__(self, sinks: Optional[list[Sink]] = None, enabled: bool = True) -> None:
+        self.sinks: list[Sink] = sinks if sinks is not None else [SummarySink()]
+        self.enabled: bool = enabled
+
+    def __repr__(self) -> str:
+        return f"Instrumentation({', '.join(repr(s) for s in self.sinks)}, enabled={self.enabled})"
+
+    def __str__(self) -> str:
+        return f"Instrumentation({', '.join(repr(s) for s in self.sinks)}, enabled={self.enabled})"
+
+    @property
+    def summary(self) -> SummarySink | None:
+        """Returns the first in-memory summary sink"""
+        return next((s for s in self.sinks if isinstance(s, SummarySink)), None)
+
+    def record(self, member: str, id: str, kind: str, seconds: float, error: Optional[BaseException] = None) -> None:
+        """Passes one call to every sink"""
+        _event = CallEvent(time.time(), member, id, kind, seconds, None if error is None else f"{type(error).__name__}: {error}")
+        for _sink in self.sinks:
+            _sink.record(_event)
+
+    def close(self) -> None:
+        """Closes every sink"""
+        for _sink in self.sinks:
+            _sink.close()
+
+
+def instrument(obj: Any, instrumentation: Instrumentation, id: str) -> Any:
+    """
+    Wraps a scripting object so every call made through it and the objects it returns is timed
+
+    Args:
+        obj: The scripting object, e.g. a session
+        instrumentation: Receiver of the timings
+        id: Label of the object in the recorded events
+
+    Returns:
+        obj wrapped in a proxy, obj itself for primitive values
+    """
+    if isinstance(obj, PRIMITIVES) or isinstance(obj, InstrumentedObject):
+        return obj
+    return InstrumentedObject(obj, instrumentation, id)
+
+
+def uninstrument(obj: Any) -> Any:
+    """Returns the object wrapped by instrument()"""
+    return object.__getattribute__(obj, "_obj") if isinstance(obj, InstrumentedObject) else obj
+
+
+class InstrumentedObject:
+    """
+    InstrumentedObject - Proxy timing every property read, property write and method call of a scripting object
+    """
+
+    __slots__ = ("_obj", "_instrumentation", "_id")
+
+    def __init__(self, obj: Any, instrumentation: Instrumentation, id: str) -> None:
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_instrumentation", instrumentation)
+        object.__setattr__(self, "_id", id)
+
+    def __repr__(self) -> str:
+        return repr(self._obj)
+
+    def __str__(self) -> str:
+        return str(self._obj)
+
+    def __eq__(self, other: object) -> bool:
+        return self._obj == uninstrument(other)
+
+    def __hash__(self) -> int:
+        return hash(self._obj)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        _obj = self._obj
+        if name[0] == "_":
+            return getattr(_obj, name)
+        _instrumentation = self._instrumentation
+        if not _instrumentation.enabled:
+            _value = getattr(_obj, name)
+            if isinstance(_value, _METHOD_TYPES):
+                return _Method(_value, _instrumentation, self._id, name)
+            return instrument(_value, _instrumentation, f"{self._id}/{name}")
+        _start = time.perf_counter()
+        try:
+            _value = getattr(_obj, name)
+        except Exception as e:
+            _instrumentation.record(name, self._id, "get", time.perf_counter() - _start, e)
+            raise
+        if isinstance(_value, _METHOD_TYPES):
+            return _Method(_value, _instrumentation, self._id, name)
+        _instrumentation.record(name, self._id, "get", time.perf_counter() - _start)
+        return instrument(_value, _instrumentation, f"{self._id}/{name}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _instrumentation = self._instrumentation
+        _value = uninstrument(value)
+        if not _instrumentation.enabled:
+            setattr(self._obj, name, _value)
+            return
+        _start = time.perf_counter()
+        try:
+            setattr(self._obj, name, _value)
+        except Exception as e:
+            _instrumentation.record(name, self._id, "set", time.perf_counter() - _start, e)
+            raise
+        _instrumentation.record(name, self._id, "set", time.perf_counter() - _start)
+
+    def __call__(self, *args: Any) -> Any:
+        return _Method(self._obj, self._instrumentation, self._id, "Item")(*args)
+
+    def __len__(self) -> int:
+        return _Method(self._obj.__len__, self._instrumentation, self._id, "Count")()
+
+    def __iter__(self) -> Iterator[Any]:
+        for _index, _item in enumerate(self._obj):
+            yield instrument(_item, self._instrumentation, f"{self._id}[{_index}]")
+
+
+class _Method:
+    __slots__ = ("_method", "_instrumentation", "_id", "_name")
+
+    def __init__(self, method: Any, instrumentation: Instrumentation, id: str, name: str) -> None:
+        self._method = method
+        self._instrumentation = instrumentation
+        self._id = id
+        self._name = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        _args = [uninstrument(a) for a in args]
+        _instrumentation = self._instrumentation
+        if _instrumentation.enabled:
+            _start = time.perf_counter()
+            try:
+                _value = self._method(*_args, **kwargs)
+            except Exception as e:
+                _instrumentation.record(self._name, self._id, "call", time.perf_counter() - _start, e)
+                raise
+            _instrumentation.record(self._name, self._id, "call", time.perf_counter() - _start)
+        else:
+            _value = self._method(*_args, **kwargs)
+        if self._name.lower() in FIND_METHODS and args and isinstance(args[0], str):
+            _label = args[0]
+        elif self._name == "Item":
+            _label = f"{self._id}[{args[0] if args else ''}]"
+        else:
+            _label = f"{self._id}/{self._name}()"
+        return instrument(_value, _instrumentation, _label)
+
+
+class InstrumentedBackend(Backend):
+    """
+    InstrumentedBackend - Wraps another backend so every scripting object it hands out is instrumented
+
+    Example:
+        ```python
+        instrumentation = Instrumentation([SummarySink(), JsonLinesSink("trace.jsonl")])
+        sap = SAP("PRD", backend=InstrumentedBackend(get_backend(), instrumentation))
+        ...
+        print(instrumentation.summary.report(20))
+        ```
+    """
+
+    name: str = "instrumented"
+
+    def __init__(self, backend: Backend, instrumentation: Optional[Instrumentation] = None) -> None:
+        self.backend: Backend = backend
+        self.instrumentation: Instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+
+    def __repr__(self) -> str:
+        return f"InstrumentedBackend({self.backend!r})"
+
+    def __str__(self) -> str:
+        return f"InstrumentedBackend({self.backend!r})"
+
+    def get_object(self, name: str) -> Dispatch:
+        return instrument(self.backend.get_object(name), self.instrumentation, name)
+
+    def initialize(self) -> None:
+        self.backend.initialize()
+
+    def uninitialize(self) -> None:
+        self.backend.uninitialize()
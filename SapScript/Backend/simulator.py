@@ -0,0 +1,812 @@
+import itertools
+import time
+from collections import Counter
+from typing import Any, Callable, Iterator, Optional
+from .base import Backend, Dispatch
+
+EASY_ACCESS: str = "SESSION_MANAGER"
+
+# Window handles, unique per simulated window like the native window handles
+_window_handles: Iterator[int] = itertools.count(1)
+
+
+class SimObject:
+    """
+    SimObject - Base class of the simulated SAP GUI scripting objects
+
+    Every public attribute read, write and method call is counted by the
+    simulator and delayed by its configured latency. Member names resolve
+    case-insensitively like COM dispatch names, e.g. 'children' and 'Children'.
+    """
+
+    def __init__(self, sim: "SimulatorBackend", id: str, type: str, name: str = "", parent: Any = None, **props: Any) -> None:
+        _props = {
+            "Id": id,
+            "Type": type,
+            "SubType": "",
+            "Name": name if name else id.rsplit("/", 1)[-1],
+            "Parent": parent,
+            "ContainerType": False,
+            "Changeable": False,
+            "Modified": False,
+            "Tooltip": "",
+            "DefaultTooltip": "",
+            "IconName": "",
+            "Key": "",
+            "Handle": 0,
+            "Left": 0,
+            "Top": 0,
+            "ScreenLeft": 0,
+            "ScreenTop": 0,
+            "Width": 0,
+            "Height": 0,
+            "ScreenWidth": 0,
+            "ScreenHeight": 0,
+        }
+        _props.update(props)
+        object.__setattr__(self, "_sim", sim)
+        for _name, _value in _props.items():
+            if isinstance(getattr(_type_of(self), _name, None), property):
+                object.__setattr__(self, f"_{_name.lower()}", _value)
+            else:
+                object.__setattr__(self, _name, _value)
+
+    def __repr__(self) -> str:
+        return f"<{object.__getattribute__(self, '__dict__').get('Type')} {object.__getattribute__(self, '__dict__').get('Id')}>"
+
+    def __getattribute__(self, name: str) -> Any:
+        if name[0] == "_":
+            return object.__getattribute__(self, name)
+        _sim = object.__getattribute__(self, "_sim")
+        if "_closed" in object.__getattribute__(self, "__dict__"):
+            _sim._call(name)
+            raise Exception(f"The object {object.__getattribute__(self, 'Id')} has been closed")
+        _name = object.__getattribute__(self, "_canonical")(name)
+        _value = object.__getattribute__(self, _name) if _name is not None else None
+        if callable(_value) and not isinstance(_value, SimObject):
+            return _sim._method(_name, _value)
+        _sim._call(_name or name)
+        if _name is None:
+            raise AttributeError(f"{object.__getattribute__(self, 'Type')}.{name}")
+        return _value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name[0] == "_":
+            object.__setattr__(self, name, value)
+            return
+        _name = self._canonical(name) or name
+        self._sim._call(_name)
+        object.__setattr__(self, _name, value)
+
+    def _set(self, **props: Any) -> None:
+        for _name, _value in props.items():
+            object.__setattr__(self, _name, _value)
+
+    def _get(self, name: str) -> Any:
+        return object.__getattribute__(self, name)
+
+    def _canonical(self, name: str) -> str | None:
+        _dict = object.__getattribute__(self, "__dict__")
+        _cls = _type_of(self)
+        if name in _dict or hasattr(_cls, name):
+            return name
+        _names = _cls.__dict__.get("_name_map")
+        if _names is None:
+            _names = {n.lower(): n for n in dir(_cls) if not n.startswith("_")}
+            setattr(_cls, "_name_map", _names)
+        _lower = name.lower()
+        for _key in _dict:
+            if _key.lower() == _lower:
+                return _key
+        return _names.get(_lower)
+
+
+def _type_of(obj: object) -> type:
+    return object.__getattribute__(obj, "__class__")
+
+
+class SimCollection(SimObject):
+    """
+    SimCollection - Simulated GuiComponentCollection, callable with an index like its COM counterpart
+    """
+
+    def __init__(self, sim: "SimulatorBackend", items: Optional[list[Any]] = None) -> None:
+        super().__init__(sim, id="", type="GuiComponentCollection")
+        object.__setattr__(self, "_items", items if items is not None else [])
+
+    def __call__(self, index: int) -> Any:
+        self._sim._call("Item")
+        return self._items[index]
+
+    def __len__(self) -> int:
+        self._sim._call("Count")
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        for _item in list(self._items):
+            self._sim._call("Item")
+            yield _item
+
+    @property
+    def Count(self) -> int:
+        return len(self._items)
+
+    @property
+    def Length(self) -> int:
+        return len(self._items)
+
+    def Item(self, index: int) -> Any:
+        return self._items[index]
+
+    def ElementAt(self, index: int) -> Any:
+        return self._items[index]
+
+
+class SimContainer(SimObject):
+    """
+    SimContainer - Simulated GUI container holding child elements by id segment
+    """
+
+    def __init__(self, sim: "SimulatorBackend", id: str, type: str, name: str = "", parent: Any = None, **props: Any) -> None:
+        super().__init__(sim, id, type, name, parent, ContainerType=True, **props)
+        object.__setattr__(self, "_children", {})
+
+    @property
+    def Children(self) -> SimCollection:
+        return SimCollection(self._sim, list(self._children.values()))
+
+    def findById(self, id: str, raise_error: bool = True) -> Any:
+        _element = self._find(id)
+        if _element is None and raise_error:
+            raise Exception(f"The control could not be found by id: {id}")
+        return _element
+
+    def FindById(self, id: str, raise_error: bool = True) -> Any:
+        return self.findById(id, raise_error)
+
+    def _find(self, id: str) -> Any:
+        _own = object.__getattribute__(self, "__dict__")["Id"]
+        if id.startswith("/"):
+            if not id.startswith(_own):
+                return None
+            id = id[len(_own) :].lstrip("/")
+        _element: Any = self
+        for _segment in id.split("/"):
+            if not _segment:
+                continue
+            if not isinstance(_element, SimContainer):
+                return None
+            _element = _element._children.get(_segment)
+            if _element is None:
+                return None
+        return _element
+
+    def _add(self, segment: str, factory: Callable[[str, Any], SimObject]) -> SimObject:
+        _parent: SimContainer = self
+        _segments = segment.split("/")
+        for _segment in _segments[:-1]:
+            _child = _parent._children.get(_segment)
+            if _child is None:
+                _child = SimContainer(
+                    self._sim, f"{object.__getattribute__(_parent, 'Id')}/{_segment}", "GuiSimpleContainer", parent=_parent
+                )
+                _parent._children[_segment] = _child
+            _parent = _child
+        _element = factory(f"{object.__getattribute__(_parent, 'Id')}/{_segments[-1]}", _parent)
+        _parent._children[_segments[-1]] = _element
+        return _element
+
+
+class SimField(SimObject):
+    """
+    SimField - Simulated text field, label, button, check box or radio button
+    """
+
+    def __init__(
+        self,
+        sim: "SimulatorBackend",
+        id: str,
+        type: str,
+        parent: Any = None,
+        text: str = "",
+        changeable: bool = True,
+        screen: Optional[str] = None,
+        **props: Any,
+    ) -> None:
+        super().__init__(sim, id, type, parent=parent, Changeable=changeable, Selected=False, **props)
+        object.__setattr__(self, "_text", text)
+        object.__setattr__(self, "_screen", screen)
+
+    @property
+    def Text(self) -> str:
+        return self._text
+
+    @Text.setter
+    def Text(self, value: str) -> None:
+        if not object.__getattribute__(self, "__dict__")["Changeable"]:
+            raise Exception(f"The field {object.__getattribute__(self, '__dict__')['Id']} is not changeable")
+        object.__setattr__(self, "_text", str(value))
+        object.__setattr__(self, "Modified", True)
+
+    def SetFocus(self) -> None:
+        self._sim._focus = self
+
+    def Select(self) -> None:
+        object.__setattr__(self, "Selected", True)
+
+    def Press(self) -> None:
+        self._sim._roundtrip()
+        _session = self._sim._session_of(self)
+        if _session is not None and self._screen is not None:
+            _session._enter(self._screen)
+        elif _session is not None:
+            _window = self._sim._window_of(self)
+            if _window is not None and object.__getattribute__(_window, "Type") == "GuiModalWindow":
+                _session._close_window(_window)
+
+
+class SimGrid(SimObject):
+    """
+    SimGrid - Simulated ALV grid view (GuiShell with SubType GridView)
+
+    With lazy=True cells of rows that were never scrolled into view read as
+    empty strings, like a large ALV grid that loads rows on demand.
+    """
+
+    def __init__(
+        self,
+        sim: "SimulatorBackend",
+        id: str,
+        parent: Any,
+        columns: list[str],
+        rows: list[list[str]],
+        titles: Optional[list[str]] = None,
+        visible_rows: int = 20,
+        lazy: bool = False,
+        changeable: bool = False,
+    ) -> None:
+        super().__init__(sim, id, "GuiShell", parent=parent, SubType="GridView", Changeable=changeable)
+        object.__setattr__(self, "_columns", list(columns))
+        object.__setattr__(self, "_titles", dict(zip(columns, titles if titles is not None else columns)))
+        object.__setattr__(self, "_rows", [list(r) for r in rows])
+        object.__setattr__(self, "_visible_rows", visible_rows)
+        object.__setattr__(self, "_first_visible_row", 0)
+        object.__setattr__(self, "_lazy", lazy)
+        object.__setattr__(self, "_loaded", set(range(min(len(rows), visible_rows))))
+        object.__setattr__(self, "_selected_rows", "")
+        object.__setattr__(self, "_current_cell", (-1, ""))
+
+    @property
+    def RowCount(self) -> int:
+        return len(self._rows)
+
+    @property
+    def ColumnCount(self) -> int:
+        return len(self._columns)
+
+    @property
+    def VisibleRowCount(self) -> int:
+        return self._visible_rows
+
+    @property
+    def ColumnOrder(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    @ColumnOrder.setter
+    def ColumnOrder(self, value: list[str]) -> None:
+        object.__setattr__(self, "_columns", list(value))
+
+    @property
+    def FirstVisibleRow(self) -> int:
+        return self._first_visible_row
+
+    @FirstVisibleRow.setter
+    def FirstVisibleRow(self, value: int) -> None:
+        object.__setattr__(self, "_first_visible_row", value)
+        self._loaded.update(range(value, min(value + self._visible_rows, len(self._rows))))
+
+    @property
+    def SelectedRows(self) -> str:
+        return self._selected_rows
+
+    @SelectedRows.setter
+    def SelectedRows(self, value: str) -> None:
+        object.__setattr__(self, "_selected_rows", value)
+
+    @property
+    def CurrentCellRow(self) -> int:
+        return self._current_cell[0]
+
+    @property
+    def CurrentCellColumn(self) -> str:
+        return self._current_cell[1]
+
+    def _column_index(self, column: str | int) -> int:
+        if isinstance(column, int):
+            return column
+        try:
+            return self._columns.index(column)
+        except ValueError:
+            raise Exception(f"Invalid column: {column}")
+
+    def GetCellValue(self, row: int, column: str | int) -> str:
+        if not 0 <= row < len(self._rows):
+            raise Exception(f"Invalid row: {row}")
+        if self._lazy and row not in self._loaded:
+            return ""
+        return self._rows[row][self._column_index(column)]
+
+    def ModifyCell(self, row: int, column: str | int, value: str) -> None:
+        self._rows[row][self._column_index(column)] = str(value)
+
+    def GetDisplayedColumnTitle(self, column: str) -> str:
+        return self._titles[column]
+
+    def GetCellWidth(self, row: int, column: str) -> int:
+        return max(len(self._titles[column]), 10)
+
+    def GetColumnDataType(self, column: str) -> str:
+        return "C"
+
+    def SetCurrentCell(self, row: int, column: str) -> None:
+        object.__setattr__(self, "_current_cell", (row, column))
+
+    def SelectAll(self) -> None:
+        object.__setattr__(self, "_selected_rows", f"0-{len(self._rows) - 1}")
+
+    def DoubleClick(self) -> None:
+        self._sim._roundtrip()
+
+    def pressButton(self, row: int, column: str) -> None:
+        self._sim._roundtrip()
+
+
+class Field:
+    """
+    Field - Screen element spec for a text field, label or other simple element
+
+    Args:
+        id: Id path below the user area, e.g. 'txtRSYST-BNAME'
+        text: Initial text
+        changeable: Whether the field accepts input
+        type: SAP GUI type name, e.g. 'GuiTextField', 'GuiCTextField', 'GuiLabel'
+    """
+
+    def __init__(self, id: str, text: str = "", changeable: bool = True, type: str = "GuiTextField") -> None:
+        self.id = id
+        self.text = text
+        self.changeable = changeable
+        self.type = type
+
+    def build(self, sim: "SimulatorBackend", id: str, parent: Any) -> SimObject:
+        return SimField(sim, id, self.type, parent=parent, text=self.text, changeable=self.changeable)
+
+
+class Button(Field):
+    """
+    Button - Screen element spec for a push button that optionally navigates to another screen
+    """
+
+    def __init__(self, id: str, text: str = "", screen: Optional[str] = None) -> None:
+        super().__init__(id, text=text, changeable=True, type="GuiButton")
+        self.screen = screen
+
+    def build(self, sim: "SimulatorBackend", id: str, parent: Any) -> SimObject:
+        return SimField(sim, id, self.type, parent=parent, text=self.text, changeable=True, screen=self.screen)
+
+
+class Grid:
+    """
+    Grid - Screen element spec for an ALV grid view
+
+    Args:
+        id: Id path below the user area, e.g. 'cntlGRID1/shellcont/shell'
+        columns: Column ids
+        rows: Row values, or a row count to generate 'row:column' values
+        titles: Displayed column titles, defaults to the column ids
+        visible_rows: Number of rows in the viewport
+        lazy: Only load rows once they have been scrolled into view
+    """
+
+    def __init__(
+        self,
+        id: str,
+        columns: list[str],
+        rows: list[list[str]] | int,
+        titles: Optional[list[str]] = None,
+        visible_rows: int = 20,
+        lazy: bool = False,
+    ) -> None:
+        self.id = id
+        self.columns = columns
+        self.rows = rows if not isinstance(rows, int) else [[f"{r}:{c}" for c in columns] for r in range(rows)]
+        self.titles = titles
+        self.visible_rows = visible_rows
+        self.lazy = lazy
+
+    def build(self, sim: "SimulatorBackend", id: str, parent: Any) -> SimObject:
+        return SimGrid(
+            sim, id, parent, self.columns, self.rows, titles=self.titles, visible_rows=self.visible_rows, lazy=self.lazy
+        )
+
+
+class SimScreen:
+    """
+    SimScreen - A simulated dynpro: program, screen number, title and user area elements
+
+    Args:
+        name: Unique screen name used to navigate to it
+        program: ABAP program name reported in session.Info.Program
+        number: Screen number reported in session.Info.ScreenNumber
+        title: Window title
+        elements: Element specs (Field, Button, Grid) placed in wnd[0]/usr
+        keys: Virtual key id to screen name transitions, keys not listed stay on the screen
+        message: (message type, text) or (message type, text, message id, message number) shown in
+            the status bar when the screen is entered
+        popup: Title, or (title, dialog text), of a modal window opened on top of the screen when it is
+            entered. The popup has the buttons usr/btnSPOP-OPTION1 and usr/btnSPOP-OPTION2, pressing
+            either or sending any key closes it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        program: str,
+        number: int,
+        title: str = "",
+        elements: Optional[list[Field | Grid]] = None,
+        keys: Optional[dict[int, str]] = None,
+        message: Optional[tuple[str, ...]] = None,
+        popup: Optional[str | tuple[str, str]] = None,
+    ) -> None:
+        self.name = name
+        self.program = program
+        self.number = number
+        self.title = title if title else name
+        self.elements = elements if elements is not None else []
+        self.keys = keys if keys is not None else {}
+        self.message = message
+        self.popup = popup
+
+
+class SimSessionInfo(SimObject):
+    """
+    SimSessionInfo - Simulated GuiSessionInfo
+    """
+
+
+class SimWindow(SimContainer):
+    """
+    SimWindow - Simulated main or modal window with title bar, toolbar, user area and status bar
+    """
+
+    def __init__(self, sim: "SimulatorBackend", id: str, parent: Any, modal: bool = False) -> None:
+        super().__init__(sim, id, "GuiModalWindow" if modal else "GuiMainWindow", parent=parent, Text="", Handle=next(_window_handles))
+        self._add("titl", lambda i, p: SimField(sim, i, "GuiTitlebar", parent=p, changeable=False))
+        self._add("tbar[0]/okcd", lambda i, p: SimField(sim, i, "GuiOkCodeField", parent=p))
+        self._add("usr", lambda i, p: SimContainer(sim, i, "GuiUserArea", parent=p))
+        self._add(
+            "sbar",
+            lambda i, p: SimField(
+                sim, i, "GuiStatusbar", parent=p, changeable=False, MessageType="", MessageId="", MessageNumber=""
+            ),
+        )
+
+    def sendVKey(self, key: int) -> None:
+        self._sim._roundtrip()
+        _session = self._sim._session_of(self)
+        _session._key(int(key), self)
+
+    def Close(self) -> None:
+        _session = self._sim._session_of(self)
+        _session._close_window(self)
+
+    def Maximize(self) -> None:
+        pass
+
+
+class SimSession(SimContainer):
+    """
+    SimSession - Simulated GuiSession with transactions, screens and virtual keys
+    """
+
+    def __init__(self, sim: "SimulatorBackend", id: str, parent: Any, sid: str, number: int) -> None:
+        super().__init__(sim, id, "GuiSession", parent=parent)
+        object.__setattr__(
+            self,
+            "Info",
+            SimSessionInfo(
+                sim,
+                f"{id}/info",
+                "GuiSessionInfo",
+                parent=self,
+                SystemName=sid,
+                Client="100",
+                User="SIMUSER",
+                Language="EN",
+                SessionNumber=number + 1,
+                Program="",
+                ScreenNumber=0,
+                Transaction="",
+            ),
+        )
+        object.__setattr__(self, "_busy_until", 0.0)
+        object.__setattr__(self, "_screen", None)
+        self._add("wnd[0]", lambda i, p: SimWindow(sim, i, p))
+        self._enter(EASY_ACCESS)
+
+    @property
+    def Busy(self) -> bool:
+        return time.monotonic() < self._busy_until
+
+    def StartTransaction(self, Transaction: str) -> None:
+        self._sim._roundtrip()
+        self._start(Transaction)
+
+    def EndTransaction(self) -> None:
+        self._sim._roundtrip()
+        self._enter(EASY_ACCESS)
+
+    def SendCommand(self, Command: str) -> None:
+        self._sim._roundtrip()
+        _command = Command.strip()
+        if _command.lower().startswith(("/n", "/o")):
+            _command = _command[2:]
+        self._start(_command) if _command else self._enter(EASY_ACCESS)
+
+    def CreateSession(self) -> None:
+        self._sim._create_session(object.__getattribute__(self, "Parent"))
+
+    def Close(self) -> None:
+        _connection = object.__getattribute__(self, "Parent")
+        _connection._children = {k: v for k, v in _connection._children.items() if v is not self}
+        object.__setattr__(self, "_closed", True)
+
+    def _start(self, transaction: str) -> None:
+        _screen = self._sim.transactions.get(transaction.upper())
+        if _screen is None:
+            self._message("E", f"Transaction {transaction.upper()} does not exist")
+            return
+        self._enter(_screen, transaction.upper())
+
+    def _enter(self, screen_name: str, transaction: Optional[str] = None) -> None:
+        _screen = self._sim.screens[screen_name]
+        object.__setattr__(self, "_screen", _screen)
+        object.__setattr__(self, "_busy_until", time.monotonic() + self._sim.busy_time)
+        _info = object.__getattribute__(self, "Info")
+        _info._set(
+            Program=_screen.program,
+            ScreenNumber=_screen.number,
+            Transaction=transaction if transaction is not None else (_info._get("Transaction") if screen_name != EASY_ACCESS else EASY_ACCESS),
+        )
+        _window = self._children["wnd[0]"]
+        _window._set(Text=_screen.title)
+        _window._children["titl"]._set(_text=_screen.title)
+        _usr = SimContainer(self._sim, f"{object.__getattribute__(_window, 'Id')}/usr", "GuiUserArea", parent=_window)
+        for _spec in _screen.elements:
+            _usr._add(_spec.id, lambda i, p, s=_spec: s.build(self._sim, i, p))
+        _window._children["usr"] = _usr
+        if _screen.message is not None:
+            self._message(*_screen.message)
+        else:
+            self._message("", "")
+        if _screen.popup is not None:
+            _title, _text = _screen.popup if isinstance(_screen.popup, tuple) else (_screen.popup, "")
+            _popup = self._add(f"wnd[{len(self._children)}]", lambda i, p: SimWindow(self._sim, i, p, modal=True))
+            _popup._set(Text=_title, PopupDialogText=_text)
+            for _option in ("btnSPOP-OPTION1", "btnSPOP-OPTION2"):
+                _popup._children["usr"]._add(_option, lambda i, p: SimField(self._sim, i, "GuiButton", parent=p))
+
+    def _message(self, type: str, text: str, id: str = "", number: str = "") -> None:
+        self._children["wnd[0]"]._children["sbar"]._set(_text=text, MessageType=type, MessageId=id, MessageNumber=number)
+
+    def _key(self, key: int, window: SimWindow) -> None:
+        if window is not self._children["wnd[0]"]:
+            self._close_window(window)
+            return
+        _target = self._screen.keys.get(key)
+        if _target is None and key in (3, 12, 15):
+            _target = EASY_ACCESS
+        if _target is not None:
+            self._enter(_target)
+        else:
+            object.__setattr__(self, "_busy_until", time.monotonic() + self._sim.busy_time)
+
+    def _close_window(self, window: SimWindow) -> None:
+        self._children = {k: v for k, v in self._children.items() if v is not window}
+
+
+class SimConnection(SimContainer):
+    """
+    SimConnection - Simulated GuiConnection holding up to six sessions
+    """
+
+    def __init__(self, sim: "SimulatorBackend", id: str, parent: Any, description: str) -> None:
+        super().__init__(sim, id, "GuiConnection", parent=parent, Description=description, DisabledByServer=False)
+
+    @property
+    def Sessions(self) -> SimCollection:
+        return SimCollection(self._sim, list(self._children.values()))
+
+    def Close(self) -> None:
+        self.CloseConnection()
+
+    def CloseConnection(self) -> None:
+        _app = object.__getattribute__(self, "Parent")
+        _app._children = {k: v for k, v in _app._children.items() if v is not self}
+        for _session in self._children.values():
+            object.__setattr__(_session, "_closed", True)
+        object.__setattr__(self, "_closed", True)
+
+    def CloseSession(self, id: str) -> None:
+        for _session in self._children.values():
+            if object.__getattribute__(_session, "Id") == id:
+                object.__setattr__(_session, "_closed", True)
+        self._children = {k: v for k, v in self._children.items() if object.__getattribute__(v, "Id") != id}
+
+
+class SimApplication(SimContainer):
+    """
+    SimApplication - Simulated GuiApplication (the scripting engine)
+    """
+
+    def __init__(self, sim: "SimulatorBackend") -> None:
+        super().__init__(sim, "/app", "GuiApplication")
+
+    @property
+    def Connections(self) -> SimCollection:
+        return SimCollection(self._sim, list(self._children.values()))
+
+    def OpenConnection(self, Description: str, Sync: bool = True, Raise: bool = True) -> SimConnection:
+        self._sim._roundtrip()
+        return self._sim.connect(Description)
+
+
+class SimGui(SimObject):
+    """
+    SimGui - Simulated SAPGUI object from the running object table
+    """
+
+    def __init__(self, sim: "SimulatorBackend") -> None:
+        super().__init__(sim, "", "GuiRotObject")
+
+    @property
+    def GetScriptingEngine(self) -> SimApplication:
+        return self._sim.application
+
+
+class SimulatorBackend(Backend):
+    """
+    SimulatorBackend - Deterministic in-process SAP GUI simulator
+
+    Simulates connections, sessions, windows, fields and ALV grids. Every
+    scripting call is counted in calls (by member name) and can be delayed by
+    a per-call latency, plus an additional latency for server round trips
+    (StartTransaction, sendVKey, Press), so throughput and COM round trips of
+    any code path can be measured without SAP GUI.
+
+    Args:
+        systems: Connection descriptions OpenConnection accepts
+        latency: Seconds added to every scripting call
+        roundtrip_latency: Seconds added to every server round trip
+        busy_time: Seconds session.Busy stays True after a round trip
+        member_latency: Per member name latency overrides, e.g. {'GetCellValue': 0.001}
+
+    Example:
+        ```python
+        sim = SimulatorBackend(latency=0.0002)
+        sim.add_screen(SimScreen("IDOCS", "RSEIDOC2", 1000, elements=[Grid("cntlGRID/shellcont/shell", ["DOCNUM"], 500)]), "WE02")
+        sap = SAP("DEV", backend=sim)
+        ```
+    """
+
+    name: str = "simulator"
+
+    def __init__(
+        self,
+        systems: Optional[list[str]] = None,
+        latency: float = 0.0,
+        roundtrip_latency: float = 0.0,
+        busy_time: float = 0.0,
+        member_latency: Optional[dict[str, float]] = None,
+    ) -> None:
+        self.systems: list[str] = systems if systems is not None else ["DEV", "QAS", "PRD"]
+        self.latency: float = latency
+        self.roundtrip_latency: float = roundtrip_latency
+        self.busy_time: float = busy_time
+        self.member_latency: dict[str, float] = member_latency if member_latency is not None else {}
+        self.calls: Counter[str] = Counter()
+        self.roundtrips: int = 0
+        self.screens: dict[str, SimScreen] = {}
+        self.transactions: dict[str, str] = {}
+        self._focus: Any = None
+        self.add_screen(SimScreen(EASY_ACCESS, "SAPLSMTR_NAVIGATION", 100, title="SAP Easy Access"))
+        self.gui: SimGui = SimGui(self)
+        self.application: SimApplication = SimApplication(self)
+
+    def __repr__(self) -> str:
+        return f"SimulatorBackend({self.total_calls} calls, {self.roundtrips} round trips)"
+
+    def __str__(self) -> str:
+        return f"SimulatorBackend({self.total_calls} calls, {self.roundtrips} round trips)"
+
+    @property
+    def total_calls(self) -> int:
+        """Returns the number of scripting calls made so far"""
+        return sum(self.calls.values())
+
+    def reset_counters(self) -> None:
+        """Resets the call and round trip counters"""
+        self.calls.clear()
+        self.roundtrips = 0
+
+    def get_object(self, name: str) -> Dispatch:
+        if name.upper() != "SAPGUI":
+            raise OSError(f"Operation unavailable: {name}")
+        return self.gui
+
+    def add_screen(self, screen: SimScreen, transaction: Optional[str] = None) -> SimScreen:
+        """
+        Registers a screen, optionally as the first screen of a transaction
+
+        Args:
+            screen: The screen to register
+            transaction: Transaction code that starts on this screen
+        """
+        self.screens[screen.name] = screen
+        if transaction is not None:
+            self.transactions[transaction.upper()] = screen.name
+        return screen
+
+    def connect(self, description: str) -> SimConnection:
+        """
+        Opens a logged on connection with one session, as if done from SAP Logon
+
+        Raises:
+            Exception: If the description is not one of the configured systems
+        """
+        if description not in self.systems:
+            raise Exception(f"SAP Logon connection entry not found: {description}")
+        _app = self.application
+        _number = max([int(k[4:-1]) for k in _app._children] + [-1]) + 1
+        _connection = _app._add(f"con[{_number}]", lambda i, p: SimConnection(self, i, p, description))
+        self._create_session(_connection)
+        return _connection
+
+    def _create_session(self, connection: SimConnection) -> SimSession:
+        _numbers = [int(k[4:-1]) for k in connection._children]
+        if len(_numbers) >= 6:
+            raise Exception("Maximum number of sessions reached")
+        _number = min(set(range(6)) - set(_numbers))
+        _sid = object.__getattribute__(connection, "Description")
+        return connection._add(f"ses[{_number}]", lambda i, p: SimSession(self, i, p, _sid, _number))
+
+    def _window_of(self, element: SimObject) -> SimWindow | None:
+        _element: Any = element
+        while _element is not None and not isinstance(_element, SimWindow):
+            _element = object.__getattribute__(_element, "Parent")
+        return _element
+
+    def _session_of(self, element: SimObject) -> SimSession | None:
+        _element: Any = element
+        while _element is not None and not isinstance(_element, SimSession):
+            _element = object.__getattribute__(_element, "Parent")
+        return _element
+
+    def _call(self, name: str) -> None:
+        self.calls[name] += 1
+        _latency = self.member_latency.get(name, self.latency)
+        if _latency:
+            time.sleep(_latency)
+
+    def _method(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def invoke(*args: Any, **kwargs: Any) -> Any:
+            self._call(name)
+            return method(*args, **kwargs)
+
+        return invoke
+
+    def _roundtrip(self) -> None:
+        self.roundtrips += 1
+        if self.roundtrip_latency:
+            time.sleep(self.roundtrip_latency)
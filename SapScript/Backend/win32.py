@@ -0,0 +1,27 @@
+from .base import Backend, Dispatch
+
+
+class Win32Backend(Backend):
+    """
+    Win32Backend - SAP GUI scripting over Windows COM with pywin32
+
+    win32com and pythoncom are imported on first use, so the package can be
+    imported on platforms without pywin32.
+    """
+
+    name: str = "win32"
+
+    def get_object(self, name: str) -> Dispatch:
+        import win32com.client  # type: ignore
+
+        return win32com.client.GetObject(name)
+
+    def initialize(self) -> None:
+        import pythoncom  # type: ignore
+
+        pythoncom.CoInitialize()
+
+    def uninitialize(self) -> None:
+        import pythoncom  # type: ignore
+
+        pythoncom.CoUninitialize()
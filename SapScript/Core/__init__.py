@@ -0,0 +1 @@
+from SapScript.Utils.catalog import SystemCatalog  # noqa: F401
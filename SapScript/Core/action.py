@@ -1,5 +1,158 @@
-from typing import Any, Self
+import time
+from typing import Any, Iterable, Optional, Self
 from ..Gui.elements import GuiElement
+from .result import Result
+
+
+class ActionSpec:
+    """
+    ActionSpec - How an action maps onto a scripting member of an element
+
+    Args:
+        member: Scripting method or property name, e.g. 'Press' or 'Selected'
+        args: Types of the arguments the action takes
+        kind: 'call' to call the method, 'set' to assign the property
+        value: Value assigned by a 'set' action that takes no argument
+    """
+
+    __slots__ = ("member", "args", "kind", "value")
+
+    def __init__(self, member: str, args: tuple[type, ...] = (), kind: str = "call", value: Any = None) -> None:
+        if kind not in ("call", "set"):
+            raise ValueError(f"Invalid action kind {kind}")
+        if kind == "set" and len(args) > 1:
+            raise ValueError("A 'set' action takes at most one argument")
+        self.member: str = member
+        self.args: tuple[type, ...] = args
+        self.kind: str = kind
+        self.value: Any = value
+
+    def __repr__(self) -> str:
+        return f"ActionSpec({self.kind} {self.member}({', '.join(a.__name__ for a in self.args)}))"
+
+    def __str__(self) -> str:
+        return f"ActionSpec({self.kind} {self.member}({', '.join(a.__name__ for a in self.args)}))"
+
+    def check(self, action: str, args: tuple[Any, ...]) -> None:
+        """
+        Validates the arguments against the signature
+
+        Raises:
+            TypeError: If the number or the types of the arguments do not match
+        """
+        if len(args) != len(self.args):
+            raise TypeError(f"Action {action} takes {len(self.args)} arguments, {len(args)} given")
+        for _arg, _type in zip(args, self.args):
+            if not isinstance(_arg, _type):
+                raise TypeError(f"Action {action} expects {_type.__name__}, got {type(_arg).__name__}")
+
+    def invoke(self, element: Any, args: tuple[Any, ...]) -> Any:
+        """Performs the action on a scripting object"""
+        if self.kind == "call":
+            return getattr(element, self.member)(*args)
+        setattr(element, self.member, args[0] if args else self.value)
+        return None
+
+
+#: Action name -> spec used for every element type without an override
+ACTIONS: dict[str, ActionSpec] = {
+    "press": ActionSpec("Press"),
+    "set_focus": ActionSpec("SetFocus"),
+    "select": ActionSpec("Select"),
+    "set_text": ActionSpec("Text", (str,), kind="set"),
+    "set_key": ActionSpec("Key", (str,), kind="set"),
+    "check": ActionSpec("Selected", kind="set", value=True),
+    "uncheck": ActionSpec("Selected", kind="set", value=False),
+    "send_vkey": ActionSpec("sendVKey", (int,)),
+    "press_toolbar_button": ActionSpec("pressToolbarButton", (str,)),
+    "double_click": ActionSpec("DoubleClick"),
+}
+
+#: (action name, element type) -> spec overriding ACTIONS for that element type
+TYPE_ACTIONS: dict[tuple[str, str], ActionSpec] = {
+    ("select", "GuiCheckBox"): ActionSpec("Selected", kind="set", value=True),
+    ("double_click", "GuiShell"): ActionSpec("doubleClickCurrentCell"),
+}
+
+_typed_actions: set[str] = {a for a, _ in TYPE_ACTIONS}
+_resolved: dict[tuple[str, str | None], ActionSpec] = {}
+
+
+def register_action(name: str, spec: ActionSpec, types: Optional[Iterable[str]] = None) -> None:
+    """
+    Adds or replaces an action in the registry
+
+    Args:
+        name: Action name, e.g. 'press'
+        spec: How the action is performed
+        types: Element types the spec applies to, defaults to every type without an override
+
+    Example:
+        ```python
+        register_action("expand", ActionSpec("expandNode", (str,)), types=["GuiShell"])
+        Actions.run(tree, "expand", "F00001")
+        ```
+    """
+    if types is None:
+        ACTIONS[name] = spec
+    else:
+        for _type in types:
+            TYPE_ACTIONS[(name, _type)] = spec
+            _typed_actions.add(name)
+    _resolved.clear()
+
+
+def resolve_action(name: str, type: Optional[str] = None) -> ActionSpec:
+    """
+    Returns the spec of an action for an element type, cached per (action, type)
+
+    Args:
+        name: Action name
+        type: Element type, e.g. 'GuiCheckBox'
+
+    Raises:
+        ValueError: If the action is not registered
+    """
+    _key = (name, type)
+    _spec = _resolved.get(_key)
+    if _spec is None:
+        _spec = TYPE_ACTIONS.get(_key) or ACTIONS.get(name)
+        if _spec is None:
+            raise ValueError(f"Unknown action {name}")
+        _resolved[_key] = _spec
+    return _spec
+
+
+def _spec_for(element: GuiElement, action: str) -> ActionSpec:
+    return resolve_action(action, element.type_name if action in _typed_actions else None)
+
+
+class BatchResult:
+    """
+    BatchResult - Summary of a batch of actions
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total: int = total
+        self.succeeded: int = 0
+        self.errors: list[tuple[int, str, Exception]] = []
+        self.seconds: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"BatchResult({self.succeeded}/{self.total} succeeded, {self.seconds:.3f}s)"
+
+    def __str__(self) -> str:
+        return f"{self.succeeded} of {self.total} actions succeeded, {self.failed} failed in {self.seconds:.3f}s"
+
+    @property
+    def failed(self) -> int:
+        """Returns the number of actions that raised"""
+        return len(self.errors)
+
+    @property
+    def skipped(self) -> int:
+        """Returns the number of actions not run after stopping on an error"""
+        return self.total - self.succeeded - self.failed
 
 
 class Actions:
@@ -15,67 +168,118 @@ class Actions:
         return f"Action({self._success}, {self._result})"
 
     @staticmethod
-    def press(element: GuiElement) -> Self:
-        _actions = Actions()
+    def run(element: GuiElement, action: str, *args: Any) -> Self:
+        """
+        Performs a registered action on an element
+
+        The element's fetched property record is dropped afterwards, so the
+        next property reads see the values the action wrote.
+
+        Args:
+            element: The element to act on
+            action: Action name, e.g. 'press', 'set_focus' or 'select'
+            args: Arguments of the action
+
+        Returns:
+            Actions with success flag and the return value or exception as result
+
+        Raises:
+            ValueError: If element is not a GuiElement or the action is unknown
+            TypeError: If the arguments do not match the action signature
+        """
         if not isinstance(element, GuiElement):
             raise ValueError("Invalid element")
+        _spec = _spec_for(element, action)
+        _spec.check(action, args)
+        _actions = Actions()
         _actions._element = element
         try:
-            _actions._element.Press()
+            _actions._result = _spec.invoke(element.element, args)
             _actions._success = True
-            _actions._result = None
         except Exception as e:
             _actions._success = False
             _actions._result = e
-        finally:
-            return _actions
+        # The action may have changed properties of the element, fetched values are read again
+        element.refresh()
+        return _actions
+
+    @staticmethod
+    def press(element: GuiElement) -> Self:
+        return Actions.run(element, "press")
 
     @staticmethod
     def set_focus(element: GuiElement) -> Self:
-        _actions = Actions()
-        if not isinstance(element, GuiElement):
-            raise ValueError("Invalid element")
-        _actions._element = element
-        try:
-            _actions._element.Select()
-            _actions._success = True
-            _actions._result = None
-        except Exception as e:
-            _actions._success = False
-            _actions._result = e
-        finally:
-            return _actions
+        return Actions.run(element, "set_focus")
 
     @staticmethod
     def select(element: GuiElement) -> Self:
-        _actions = Actions()
+        return Actions.run(element, "select")
+
+    @staticmethod
+    def call_function(element: GuiElement, function: str, *args: Any) -> Self:
         if not isinstance(element, GuiElement):
             raise ValueError("Invalid element")
+        _actions = Actions()
         _actions._element = element
         try:
-            _actions._element.Select()
+            _function = getattr(element.element, function)
+        except AttributeError:
+            raise ValueError("Invalid function")
+        if not callable(_function):
+            raise ValueError("Invalid function")
+        try:
+            _actions._result = _function(*args)
             _actions._success = True
-            _actions._result = None
         except Exception as e:
             _actions._success = False
             _actions._result = e
-        finally:
-            return _actions
+        return _actions
 
     @staticmethod
-    def call_function(element: GuiElement, function: str) -> Self:
-        _actions = Actions()
-        if not isinstance(element, GuiElement):
-            raise ValueError("Invalid element")
-        _actions._element = element
-        if hasattr(element, function) and callable(element.function):
+    def batch(items: Iterable[tuple[GuiElement, str] | tuple[GuiElement, str, tuple[Any, ...]]], stop_on_error: bool = False) -> Result:
+        """
+        Performs a sequence of actions with one summary instead of one Actions object per item
+
+        Specs are resolved once per (action, element type) and the items run in a
+        tight loop against the scripting objects.
+
+        Args:
+            items: (element, action) or (element, action, args) tuples
+            stop_on_error: Stop at the first failing action
+
+        Returns:
+            Result with a BatchResult as value, the first exception as error if any action failed
+
+        Example:
+            ```python
+            result = Actions.batch([(row_checkbox, "check") for row_checkbox in checkboxes] + [(save, "press")])
+            print(result.value)
+            ```
+        """
+        _items = items if isinstance(items, list) else list(items)
+        _summary = BatchResult(len(_items))
+        _errors = _summary.errors
+        _start = time.perf_counter()
+        for _index, _item in enumerate(_items):
+            _element, _action = _item[0], _item[1]
+            _args = _item[2] if len(_item) > 2 else ()
             try:
-                getattr(element, function)()
-                _actions._success = True
-                _actions._result = None
+                if not isinstance(_element, GuiElement):
+                    raise ValueError("Invalid element")
+                _spec = _spec_for(_element, _action)
+                _spec.check(_action, _args)
+                try:
+                    _spec.invoke(_element.element, _args)
+                finally:
+                    _element.refresh()
             except Exception as e:
-                _actions._success = False
-                _actions._result = e
-        else:
-            raise ValueError("Invalid function")
-        return _actions
+                _errors.append((_index, _action, e))
+                if stop_on_error:
+                    break
+                continue
+            _summary.succeeded += 1
+        _summary.seconds = time.perf_counter() - _start
+        if _errors:
+            _index, _action, _error = _errors[0]
+            return Result(value=_summary, error=_error, message=f"{_summary.failed} of {_summary.total} actions failed, first at item {_index} ({_action}).")
+        return Result(value=_summary, message=f"{_summary.total} actions done in {_summary.seconds:.3f}s.")
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from typing import Any
+from ..Backend.base import Dispatch
+from ..Gui.elements import GuiElement
+
+
+class ElementCache:
+    """
+    ElementCache - LRU cache of GuiElement lookups keyed by id path
+
+    Lookups are served from memory while the session stays on the same screen.
+    Actions that may change the screen mark the cache dirty, the next lookup
+    then compares the screen signature (session.Info Program and ScreenNumber)
+    and drops every cached element if the screen has changed. Navigation that
+    does not go through a SAP method, e.g. Actions.press, is not seen, so the
+    cache is opt-in for SAP.get_element and callers must mark it dirty after
+    such navigation. Property records
+    fetched on cached elements are dropped whenever the cache is marked dirty,
+    since a round trip may change them even on the same screen.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+        self.changeable_reads: int = 0
+        self.screen_checks: int = 0
+        self._elements: OrderedDict[str, GuiElement] = OrderedDict()
+        self._changeable: dict[str, bool] = {}
+        self._session: Dispatch | None = None
+        self._screen: tuple[Any, ...] | None = None
+        self._dirty: bool = True
+
+    def __repr__(self) -> str:
+        return f"ElementCache({len(self._elements)}/{self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+    def __str__(self) -> str:
+        return f"ElementCache({len(self._elements)}/{self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._elements
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the share of lookups served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Returns the cache counters as a dictionary"""
+        return {
+            "size": len(self._elements),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "invalidations": self.invalidations,
+            "changeable_reads": self.changeable_reads,
+            "screen_checks": self.screen_checks,
+        }
+
+    def get(self, session: Dispatch, id: str) -> GuiElement:
+        """
+        Returns the element for an id path, resolving it with findById on a miss
+
+        Args:
+            session: The session the id path belongs to
+            id: The element id path, e.g. 'wnd[0]/usr/txtRSYST-BNAME'
+
+        Returns:
+            The cached or newly resolved GuiElement
+        """
+        if session is not self._session:
+            self.clear()
+            self._session = session
+        if self._dirty:
+            self.check_screen()
+        element = self._elements.get(id)
+        if element is not None:
+            self._elements.move_to_end(id)
+            self.hits += 1
+            return element
+        self.misses += 1
+        element = GuiElement(element=session.findById(id))
+        self._elements[id] = element
+        if len(self._elements) > self.maxsize:
+            self._elements.popitem(last=False)
+        return element
+
+    def changeable(self, session: Dispatch, id: str) -> bool:
+        """
+        Returns whether an element accepts input, read once per screen
+
+        Args:
+            session: The session the id path belongs to
+            id: The element id path
+
+        Returns:
+            The cached or newly read Changeable property of the element
+        """
+        element = self.get(session, id)
+        changeable = self._changeable.get(id)
+        if changeable is None:
+            self.changeable_reads += 1
+            changeable = self._changeable[id] = bool(element.element.Changeable)
+        return changeable
+
+    #: COM calls of one screen_signature(): Info, Program and ScreenNumber
+    SIGNATURE_CALLS: int = 3
+
+    def screen_signature(self) -> tuple[Any, ...]:
+        """Returns the (Program, ScreenNumber) pair identifying the current screen"""
+        info = self._session.Info
+        return (info.Program, info.ScreenNumber)
+
+    def check_screen(self) -> None:
+        """Drops the cached elements if the screen changed since they were resolved"""
+        self.screen_checks += 1
+        screen = self.screen_signature()
+        if screen != self._screen:
+            self.clear()
+            self._screen = screen
+        self._dirty = False
+
+    def mark_dirty(self) -> None:
+        """Flags that the screen may have changed, verified lazily on the next lookup"""
+        self._dirty = True
+        self._refresh_elements()
+
+    def clear(self) -> None:
+        """Drops every cached element"""
+        if self._elements:
+            self.invalidations += 1
+            self._refresh_elements()
+            self._elements.clear()
+        self._changeable.clear()
+        self._screen = None
+        self._dirty = True
+
+    def _refresh_elements(self) -> None:
+        for element in self._elements.values():
+            element.refresh()
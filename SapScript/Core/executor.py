@@ -0,0 +1,227 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+from ..Backend.base import Dispatch
+from .result import Result
+from .sap import SAP
+
+MAX_SESSIONS: int = 6
+
+
+class Job:
+    """
+    Job - A transaction and the steps to run in it on one session
+
+    Each step is a callable that receives the session handle and may return a
+    Result, a Result that is not ok stops the job.
+    """
+
+    def __init__(
+        self, transaction: Optional[str] = None, steps: Optional[list[Callable[[Any], Any]]] = None, name: Optional[str] = None
+    ) -> None:
+        self.transaction: str | None = transaction
+        self.steps: list[Callable[[Any], Any]] = steps if steps is not None else []
+        self.name: str = name if name is not None else (transaction or "job")
+
+    def __repr__(self) -> str:
+        return f"Job({self.name}, {len(self.steps)} steps)"
+
+    def __str__(self) -> str:
+        return f"Job({self.name}, {len(self.steps)} steps)"
+
+    def run(self, handle: Any) -> Result:
+        """
+        Runs the job on a session handle
+
+        Args:
+            handle: SAP handle bound to the session the job runs on
+
+        Returns:
+            Result with the list of step return values, or the first failing Result
+        """
+        _start = time.perf_counter()
+        try:
+            if self.transaction is not None:
+                _result = handle.start_transaction(self.transaction)
+                if not _result.ok:
+                    return _result
+            _values = []
+            for step in self.steps:
+                _value = step(handle)
+                if isinstance(_value, Result) and not _value.ok:
+                    return _value
+                _values.append(_value)
+            return Result(value=_values, message=f"Job {self.name} done in {time.perf_counter() - _start:.3f}s.")
+        except Exception as e:
+            return Result(error=e, message=f"Error running job {self.name}.")
+
+
+class _WorkerHandle:
+    """
+    Creates the handle for a session inside its worker thread
+
+    Real COM sessions are marshalled into the worker thread's apartment, any
+    other object (e.g. a simulated session) is handed over as is.
+    """
+
+    def __init__(self, session: Dispatch, sid: Optional[str], handle_factory: Callable[..., Any]) -> None:
+        self._session = session
+        self._sid = sid
+        self._handle_factory = handle_factory
+        self._stream: Any = None
+        if hasattr(session, "_oleobj_"):
+            import pythoncom  # type: ignore
+
+            self._stream = pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, session._oleobj_)
+
+    def open(self) -> Any:
+        if self._stream is None:
+            return self._handle_factory(self._session, self._sid)
+        import pythoncom  # type: ignore
+        import win32com.client  # type: ignore
+
+        pythoncom.CoInitialize()
+        _session = win32com.client.Dispatch(pythoncom.CoGetInterfaceAndReleaseStream(self._stream, pythoncom.IID_IDispatch))
+        return self._handle_factory(_session, self._sid)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            import pythoncom  # type: ignore
+
+            pythoncom.CoUninitialize()
+
+
+class SessionExecutor:
+    """
+    SessionExecutor - Runs a queue of jobs in parallel across the sessions of one connection
+
+    Each session gets its own worker thread and its own SAP handle, created with
+    SAP.from_session so no module-level state is shared. Workers pull jobs from a
+    common queue, so a slow job never blocks the other sessions.
+
+    Example:
+        ```python
+        executor = SessionExecutor.from_connection(sap.connection, sessions=4, sid="PRD")
+        results = executor.run([Job("VA02", [change_order(o)]) for o in orders])
+        ```
+    """
+
+    def __init__(
+        self,
+        sessions: list[Dispatch],
+        sid: Optional[str] = None,
+        handle_factory: Callable[..., Any] = SAP.from_session,
+    ) -> None:
+        if not sessions:
+            raise ValueError("At least one session is required")
+        self.sessions: list[Dispatch] = sessions
+        self.sid: str | None = sid
+        self.handle_factory: Callable[..., Any] = handle_factory
+        self.jobs_per_session: list[int] = [0] * len(sessions)
+        self.session_errors: dict[int, Result] = {}
+
+    def __repr__(self) -> str:
+        return f"SessionExecutor({self.sid}, {len(self.sessions)} sessions)"
+
+    def __str__(self) -> str:
+        return f"SessionExecutor({self.sid}, {len(self.sessions)} sessions)"
+
+    @classmethod
+    def from_connection(
+        cls,
+        connection: Dispatch,
+        sessions: int = MAX_SESSIONS,
+        sid: Optional[str] = None,
+        timeout: float = 30.0,
+        handle_factory: Callable[..., Any] = SAP.from_session,
+    ) -> "SessionExecutor":
+        """
+        Opens sessions on a connection with CreateSession until the requested number exist
+
+        Args:
+            connection: The GuiConnection to open sessions on
+            sessions: Number of sessions to use, at most 6
+            sid: System id passed on to the session handles
+            timeout: Seconds to wait for the new sessions to appear
+
+        Raises:
+            ValueError: If sessions is not between 1 and 6
+            TimeoutError: If the sessions do not open within the timeout
+        """
+        if not 1 <= sessions <= MAX_SESSIONS:
+            raise ValueError(f"sessions must be between 1 and {MAX_SESSIONS}")
+        _deadline = time.monotonic() + timeout
+        _requested = connection.Children.Count
+        while _requested < sessions:
+            connection.Children(0).CreateSession()
+            _requested += 1
+        _delay = 0.05
+        while connection.Children.Count < sessions:
+            if time.monotonic() > _deadline:
+                raise TimeoutError(f"Timed out waiting for {sessions} sessions to open")
+            time.sleep(_delay)
+            _delay = min(_delay * 2, 1.0)
+        return cls(
+            sessions=[connection.Children(i) for i in range(sessions)], sid=sid, handle_factory=handle_factory
+        )
+
+    def run(self, jobs: list[Job]) -> list[Result]:
+        """
+        Runs the jobs across all sessions and waits for them to finish
+
+        Args:
+            jobs: The jobs to run
+
+        Returns:
+            One Result per job, in the order of the jobs
+        """
+        _results: list[Result | None] = [None] * len(jobs)
+        _queue: queue.SimpleQueue[tuple[int, Job] | None] = queue.SimpleQueue()
+        for _item in enumerate(jobs):
+            _queue.put(_item)
+        for _ in self.sessions:
+            _queue.put(None)
+        _threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(i, _WorkerHandle(s, self.sid, self.handle_factory), _queue, _results),
+                name=f"SessionExecutor-{i}",
+                daemon=True,
+            )
+            for i, s in enumerate(self.sessions)
+        ]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        return [
+            r if r is not None else Result(error=RuntimeError("No session available"), message=f"Job {jobs[i].name} was not run.")
+            for i, r in enumerate(_results)
+        ]
+
+    async def run_async(self, jobs: list[Job]) -> list[Result]:
+        """Runs the jobs without blocking the running event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.run, jobs)
+
+    def _worker(
+        self,
+        index: int,
+        worker_handle: _WorkerHandle,
+        jobs: "queue.SimpleQueue[tuple[int, Job] | None]",
+        results: list[Result | None],
+    ) -> None:
+        try:
+            _handle = worker_handle.open()
+        except Exception as e:
+            self.session_errors[index] = Result(error=e, message=f"Error opening session {index}.")
+            worker_handle.close()
+            return
+        try:
+            while (_item := jobs.get()) is not None:
+                _position, _job = _item
+                results[_position] = _job.run(_handle)
+                self.jobs_per_session[index] += 1
+        finally:
+            worker_handle.close()
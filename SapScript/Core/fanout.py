@@ -0,0 +1,241 @@
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from typing import Any, Callable, Generator, Iterable, Optional
+from .executor import Job
+from .result import OK, Result
+
+
+def default_sap_factory(sid: str) -> Any:
+    """
+    Initializes the default backend in the calling process and returns a SAP instance for the sid
+    """
+    from ..Backend.base import get_backend
+    from .sap import SAP
+
+    get_backend().initialize()
+    return SAP(sid)
+
+
+class WorkerStats:
+    """
+    WorkerStats - Throughput statistics of one fan-out worker process
+    """
+
+    def __init__(self, worker: int) -> None:
+        self.worker: int = worker
+        self.pid: int = os.getpid()
+        self.sids: list[str] = []
+        self.jobs: int = 0
+        self.errors: int = 0
+        self.busy_seconds: float = 0.0
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"WorkerStats({self.worker}, {self.jobs} jobs, {self.jobs_per_second:.1f} jobs/s)"
+
+    def __str__(self) -> str:
+        return f"Worker {self.worker} ({', '.join(self.sids)}): {self.jobs} jobs, {self.errors} errors, {self.jobs_per_second:.1f} jobs/s"
+
+    @property
+    def jobs_per_second(self) -> float:
+        """Returns the worker throughput over its lifetime"""
+        return self.jobs / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Returns the share of the worker lifetime spent running jobs"""
+        return self.busy_seconds / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _run_job(job: Job | Callable[[Any], Any], sap: Any) -> Result:
+    if isinstance(job, Job):
+        return job.run(sap)
+    _value = job(sap)
+    if _value is None:
+        return OK
+    return _value if isinstance(_value, Result) else Result(value=_value)
+
+
+def _worker(
+    worker: int,
+    sap_factory: Callable[[str], Any],
+    jobs: "multiprocessing.Queue[bytes | None]",
+    results: "multiprocessing.Queue[tuple[Any, ...]]",
+) -> None:
+    _start = time.perf_counter()
+    _stats = WorkerStats(worker)
+    _saps: dict[str, Any] = {}
+    while (_item := jobs.get()) is not None:
+        _index, _sid, _job = pickle.loads(_item)
+        _job_start = time.perf_counter()
+        try:
+            if _sid not in _saps:
+                _saps[_sid] = sap_factory(_sid)
+                _stats.sids.append(_sid)
+            _result = _run_job(_job, _saps[_sid])
+        except Exception as e:
+            _result = Result(error=e, message=f"Error running job {_index} on {_sid}.")
+        _stats.busy_seconds += time.perf_counter() - _job_start
+        _stats.jobs += 1
+        if not _result.ok:
+            _stats.errors += 1
+        try:
+            _payload = pickle.dumps(_result)
+        except Exception as e:
+            _payload = pickle.dumps(Result(error=TypeError(str(e)), message=f"Result of job {_index} could not be pickled."))
+        results.put(("result", _index, _sid, _payload))
+    _stats.elapsed = time.perf_counter() - _start
+    results.put(("done", worker, _stats))
+
+
+class ProcessRunner:
+    """
+    ProcessRunner - Fans (sid, job) items out to worker processes that each own their SAP instances
+
+    Every SID is pinned to one worker process, which initializes COM and creates
+    the SAP instance for it on first use through sap_factory. Work and result
+    queues are bounded, so a fast producer or slow consumer applies back-pressure
+    instead of buffering everything in memory. Results are streamed back as they
+    complete.
+
+    Example:
+        ```python
+        runner = ProcessRunner(processes=3)
+        for index, sid, result in runner.run([(sid, post_batch) for sid in Systems().available_systems()]):
+            print(index, sid, result.ok)
+        print(runner.worker_stats)
+        ```
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        sap_factory: Callable[[str], Any] = default_sap_factory,
+        queue_size: int = 64,
+        start_method: Optional[str] = "spawn",
+    ) -> None:
+        self.processes: int = processes if processes is not None else (os.cpu_count() or 1)
+        self.sap_factory: Callable[[str], Any] = sap_factory
+        self.queue_size: int = queue_size
+        self._context = multiprocessing.get_context(start_method)
+        self.worker_stats: list[WorkerStats] = []
+        self.assignments: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"ProcessRunner({self.processes} processes)"
+
+    def __str__(self) -> str:
+        return f"ProcessRunner({self.processes} processes)"
+
+    def run(self, items: Iterable[tuple[str, Job | Callable[[Any], Any]]]) -> Generator[tuple[int, str, Result], Any, None]:
+        """
+        Runs the jobs and yields their results as they complete
+
+        Args:
+            items: (sid, job) pairs, a job is a Job or a picklable callable taking the SAP instance
+
+        Yields:
+            (index, sid, Result) with index being the position of the item in items
+        """
+        _jobs = [self._context.Queue(maxsize=self.queue_size) for _ in range(self.processes)]
+        _results = self._context.Queue(maxsize=self.queue_size)
+        _workers = [
+            self._context.Process(target=_worker, args=(i, self.sap_factory, _jobs[i], _results), daemon=True)
+            for i in range(self.processes)
+        ]
+        self.worker_stats = []
+        self.assignments = {}
+        _stop = threading.Event()
+        # Index -> sid of the jobs handed to each worker that have not produced a result yet
+        _outstanding: list[dict[int, str]] = [{} for _ in range(self.processes)]
+        _lock = threading.Lock()
+        # Results created in this process, for jobs that never reached a worker
+        _failed: "queue.SimpleQueue[tuple[int, str, Result]]" = queue.SimpleQueue()
+        for _process in _workers:
+            _process.start()
+
+        def _put(worker: int, item: bytes | None) -> bool:
+            while not _stop.is_set() and _workers[worker].is_alive():
+                try:
+                    _jobs[worker].put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _feed() -> None:
+            for _index, (_sid, _job) in enumerate(items):
+                _worker_index = self.assignments.setdefault(_sid, len(self.assignments) % self.processes)
+                # Jobs are pickled here, the queue would pickle them in its feeder thread and drop failures silently
+                try:
+                    _item = pickle.dumps((_index, _sid, _job))
+                except Exception as e:
+                    _failed.put((_index, _sid, Result(error=TypeError(str(e)), message=f"Job {_index} on {_sid} could not be pickled.")))
+                    continue
+                with _lock:
+                    _outstanding[_worker_index][_index] = _sid
+                if not _put(_worker_index, _item):
+                    with _lock:
+                        _outstanding[_worker_index].pop(_index, None)
+                    if _stop.is_set():
+                        return
+                    _lost = Result(error=RuntimeError(f"Worker {_worker_index} exited"), message=f"Job {_index} on {_sid} was not run.")
+                    _failed.put((_index, _sid, _lost))
+            for _i in range(self.processes):
+                _put(_i, None)
+
+        def _abandon(worker: int) -> list[tuple[int, str, Result]]:
+            with _lock:
+                _lost_jobs, _outstanding[worker] = _outstanding[worker], {}
+            _error = RuntimeError(f"Worker {worker} exited with code {_workers[worker].exitcode}")
+            return [
+                (_index, _sid, Result(error=_error, message=f"Job {_index} on {_sid} was not completed."))
+                for _index, _sid in sorted(_lost_jobs.items())
+            ]
+
+        _feeder = threading.Thread(target=_feed, name="ProcessRunner-feeder", daemon=True)
+        _feeder.start()
+        _done: set[int] = set()
+        try:
+            while len(_done) < self.processes or _feeder.is_alive() or not _failed.empty():
+                while not _failed.empty():
+                    yield _failed.get()
+                if len(_done) == self.processes:
+                    _feeder.join(timeout=0.1)
+                    continue
+                try:
+                    _message = _results.get(timeout=0.5)
+                except queue.Empty:
+                    for _i, _process in enumerate(_workers):
+                        if _i not in _done and not _process.is_alive() and _process.exitcode not in (None, 0):
+                            _done.add(_i)
+                            _stats = WorkerStats(_i)
+                            _stats.pid = _process.pid
+                            _stats.errors = 1
+                            self.worker_stats.append(_stats)
+                            yield from _abandon(_i)
+                    continue
+                if _message[0] == "result":
+                    _, _index, _sid, _payload = _message
+                    with _lock:
+                        _pending = _outstanding[self.assignments[_sid]].pop(_index, None) is not None
+                    # A job already reported as not completed by a crashed worker is not reported twice
+                    if _pending:
+                        yield _index, _sid, pickle.loads(_payload)
+                else:
+                    _done.add(_message[1])
+                    self.worker_stats.append(_message[2])
+            # Jobs put on a queue just as its worker died
+            for _i in range(self.processes):
+                yield from _abandon(_i)
+        finally:
+            _stop.set()
+            for _process in _workers:
+                _process.join(timeout=1.0)
+                if _process.is_alive():
+                    _process.terminate()
+            self.worker_stats.sort(key=lambda s: s.worker)
@@ -0,0 +1,37 @@
+class FillStats:
+    """
+    FillStats - Summary of a SAP.fill call
+
+    com_calls counts the findById, Changeable, Text read and Text write calls made,
+    plus the screen signature reads of the element cache.
+    The baseline is the per-field get_element(cached=False) plus GuiElement.text
+    setter path, which costs findById, Changeable and Text for every field.
+    """
+
+    #: COM calls per field on the findById + Changeable + Text path
+    CALLS_PER_FIELD: int = 3
+
+    def __init__(self, fields: int) -> None:
+        self.fields: int = fields
+        self.written: int = 0
+        self.skipped: int = 0
+        self.com_calls: int = 0
+
+    def __repr__(self) -> str:
+        return f"FillStats({self.written}/{self.fields} written, {self.com_calls} COM calls)"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.written} of {self.fields} fields written, {self.skipped} skipped, "
+            f"{self.com_calls} COM calls ({self.com_calls_saved} saved)"
+        )
+
+    @property
+    def baseline_calls(self) -> int:
+        """Returns the COM calls the per-field path would have made"""
+        return self.fields * self.CALLS_PER_FIELD
+
+    @property
+    def com_calls_saved(self) -> int:
+        """Returns the COM calls saved against the per-field path, negative if more were made"""
+        return self.baseline_calls - self.com_calls
@@ -0,0 +1,192 @@
+import time
+from collections import deque
+from typing import Any, Iterator, Optional
+from ..Backend.base import Dispatch
+
+#: Status bar message types
+MESSAGE_TYPES: dict[str, str] = {"S": "success", "W": "warning", "E": "error", "A": "abort", "I": "information"}
+
+#: Message types that stop a script
+ERROR_TYPES: frozenset[str] = frozenset({"E", "A"})
+
+
+class MessageEvent:
+    """
+    MessageEvent - One status bar message or popup window seen after an action
+
+    kind is 'status' for status bar messages and 'popup' for modal windows,
+    for popups type is empty, window is the window id and text its title.
+    """
+
+    __slots__ = ("seq", "time", "action", "kind", "window", "type", "id", "number", "text")
+
+    def __init__(
+        self,
+        seq: int,
+        action: str,
+        kind: str,
+        window: str,
+        type: str = "",
+        id: str = "",
+        number: str = "",
+        text: str = "",
+    ) -> None:
+        self.seq: int = seq
+        self.time: float = time.time()
+        self.action: str = action
+        self.kind: str = kind
+        self.window: str = window
+        self.type: str = type
+        self.id: str = id
+        self.number: str = number
+        self.text: str = text
+
+    def __repr__(self) -> str:
+        return f"MessageEvent({self.seq}, {self.kind}, {self.type or '-'}, {self.text!r})"
+
+    def __str__(self) -> str:
+        if self.kind == "popup":
+            return f"Popup {self.window}: {self.text}"
+        _key = f" ({self.id} {self.number})" if self.id else ""
+        return f"{self.type}: {self.text}{_key}"
+
+    @property
+    def is_error(self) -> bool:
+        """Returns whether the message is an error or abort message"""
+        return self.type in ERROR_TYPES
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the event as a dictionary"""
+        return {f: getattr(self, f) for f in self.__slots__}
+
+
+class MessageLog:
+    """
+    MessageLog - Bounded ring buffer of the most recent MessageEvents with a counter per message type
+
+    Events carry a sequence number, so a script can remember seq before a
+    step and read only what the step produced with since().
+    """
+
+    def __init__(self, maxsize: int = 200) -> None:
+        self.maxsize: int = maxsize
+        self.total: int = 0
+        self.counts: dict[str, int] = {}
+        self._events: deque[MessageEvent] = deque(maxlen=maxsize)
+
+    def __repr__(self) -> str:
+        return f"MessageLog({len(self._events)}/{self.maxsize}, total={self.total})"
+
+    def __str__(self) -> str:
+        return f"MessageLog({len(self._events)}/{self.maxsize}, total={self.total})"
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[MessageEvent]:
+        return iter(self._events)
+
+    def __getitem__(self, index: int) -> MessageEvent:
+        return self._events[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._events)
+
+    @property
+    def seq(self) -> int:
+        """Returns the sequence number the next event will get"""
+        return self.total
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of events pushed out of the buffer"""
+        return self.total - len(self._events)
+
+    def append(self, action: str, kind: str, window: str, type: str = "", id: str = "", number: str = "", text: str = "") -> MessageEvent:
+        """Records an event and returns it"""
+        _event = MessageEvent(self.total, action, kind, window, type, id, number, text)
+        self._events.append(_event)
+        _key = type if kind == "status" else kind
+        self.counts[_key] = self.counts.get(_key, 0) + 1
+        self.total += 1
+        return _event
+
+    def filter(self, type: Optional[str] = None, kind: Optional[str] = None, since: Optional[int] = None) -> list[MessageEvent]:
+        """
+        Returns the buffered events matching every given criterion, oldest first
+
+        Args:
+            type: Message types to keep, e.g. 'E' or 'EA'
+            kind: 'status' or 'popup'
+            since: Only events with a sequence number of at least since
+        """
+        return [
+            e
+            for e in self._events
+            if (type is None or (e.type and e.type in type))
+            and (kind is None or e.kind == kind)
+            and (since is None or e.seq >= since)
+        ]
+
+    def since(self, seq: int) -> list[MessageEvent]:
+        """Returns the events recorded from sequence number seq on"""
+        if seq >= self.total:
+            return []
+        return list(self._events)[max(seq - self.dropped, 0):]
+
+    def last(self, type: Optional[str] = None, kind: Optional[str] = None) -> MessageEvent | None:
+        """Returns the most recent event matching the criteria, None if there is none"""
+        for _event in reversed(self._events):
+            if (type is None or (_event.type and _event.type in type)) and (kind is None or _event.kind == kind):
+                return _event
+        return None
+
+    def errors(self, since: Optional[int] = None) -> list[MessageEvent]:
+        """Returns the buffered error and abort messages"""
+        return self.filter(type="EA", since=since)
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the number of events kept, dropping the oldest ones if needed"""
+        self.maxsize = maxsize
+        self._events = deque(self._events, maxlen=maxsize)
+
+    def clear(self) -> None:
+        """Drops every event and resets the counters"""
+        self._events.clear()
+        self.counts.clear()
+        self.total = 0
+
+
+def capture(session: Dispatch, log: MessageLog, action: str, popups: bool = True) -> list[MessageEvent]:
+    """
+    Reads the status bar of the main window and any open popup windows into a MessageLog
+
+    The message type is read first and the other status bar properties only
+    when a message is shown, so a quiet screen costs two calls for the status
+    bar. Popups cost two calls to count the windows, plus the window reads
+    when there are any.
+
+    Args:
+        session: The session to read
+        log: The log to record the events in
+        action: Description of the action that caused the messages, e.g. 'send_key ENTER'
+        popups: Also record modal windows (wnd[1] and up)
+
+    Returns:
+        The recorded events, empty if the screen shows neither a message nor a popup
+    """
+    _events = []
+    _sbar = session.findById("wnd[0]/sbar")
+    _type = _sbar.MessageType
+    if _type:
+        _events.append(
+            log.append(action, "status", "wnd[0]", _type, _sbar.MessageId, _sbar.MessageNumber, _sbar.Text)
+        )
+    if popups:
+        _windows = session.Children
+        if _windows.Count > 1:
+            for _window in _windows:
+                _id = _window.Id.rsplit("/", 1)[-1]
+                if _id != "wnd[0]":
+                    _events.append(log.append(action, "popup", _id, text=_window.Text))
+    return _events
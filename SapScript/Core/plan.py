@@ -0,0 +1,306 @@
+import json
+import string
+import time
+from pathlib import Path
+from typing import Any, Optional
+from ..Gui.elements import GuiElement, Table
+from ..Gui.vkeys import get_key_id
+from .result import Result
+
+#: Step operation -> (required fields, optional fields)
+OPERATIONS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "transaction": (("code",), ()),
+    "set": (("id", "value"), ()),
+    "press": (("id",), ()),
+    "focus": (("id",), ()),
+    "select": (("id",), ()),
+    "key": (("key",), ("window",)),
+    "read": (("id", "name"), ()),
+    "table": (("id", "name"), ("columns", "chunk_rows")),
+}
+
+#: Operations after which the screen may have changed
+SCREEN_CHANGING: frozenset[str] = frozenset({"transaction", "press", "key"})
+
+_formatter = string.Formatter()
+
+
+def _is_template(value: str) -> bool:
+    if "{" not in value:
+        return False
+    try:
+        return any(f for _, f, _, _ in _formatter.parse(value))
+    except ValueError as _:
+        return False
+
+
+class Step:
+    """
+    Step - One declarative plan step
+
+    Args:
+        op: One of the OPERATIONS
+        id: Element id path for element steps
+        value: Value to write for 'set' steps, '{name}' placeholders are filled from the run parameters.
+            A value without placeholders is written as is, in a value with placeholders literal braces
+            are doubled, e.g. '{{{order}}}' writes '{4711}'
+        key: Key combination or id for 'key' steps
+        code: Transaction code for 'transaction' steps
+        name: Output name for 'read' and 'table' steps
+        window: Window number a 'key' step is sent to, defaults to 0
+        columns: Column ids for 'table' steps, defaults to all
+        chunk_rows: Rows per batch for 'table' steps
+    """
+
+    __slots__ = ("op", "id", "value", "key", "code", "name", "window", "columns", "chunk_rows")
+
+    def __init__(
+        self,
+        op: str,
+        id: Optional[str] = None,
+        value: Optional[str] = None,
+        key: Optional[str | int] = None,
+        code: Optional[str] = None,
+        name: Optional[str] = None,
+        window: Optional[int] = None,
+        columns: Optional[list[str]] = None,
+        chunk_rows: Optional[int] = None,
+    ) -> None:
+        self.op = op
+        self.id = id
+        self.value = value
+        self.key = key
+        self.code = code
+        self.name = name
+        self.window = window
+        self.columns = columns
+        self.chunk_rows = chunk_rows
+
+    def __repr__(self) -> str:
+        return f"Step({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+    def __str__(self) -> str:
+        return f"Step({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the step as a JSON-serializable dictionary without unset fields"""
+        return {f: getattr(self, f) for f in self.__slots__ if getattr(self, f) is not None}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Step":
+        """Creates a step from a dictionary as written by to_dict"""
+        return cls(**data)
+
+
+class PlanRun:
+    """
+    PlanRun - Outcome of one plan execution with per-step timings
+    """
+
+    __slots__ = ("plan", "outputs", "timings", "failed_step", "seconds")
+
+    def __init__(self, plan: "Plan") -> None:
+        self.plan: Plan = plan
+        self.outputs: dict[str, Any] = {}
+        self.timings: list[float] = [0.0] * len(plan.steps)
+        self.failed_step: int | None = None
+        self.seconds: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"PlanRun({self.plan.name}, {self.seconds:.3f}s, failed_step={self.failed_step})"
+
+    def __str__(self) -> str:
+        return f"PlanRun({self.plan.name}, {self.seconds:.3f}s, failed_step={self.failed_step})"
+
+
+class Plan:
+    """
+    Plan - A validated, replayable list of GUI steps
+
+    The plan is validated and compiled once: key names are resolved to ids,
+    placeholders are detected and element ids are grouped per screen. A screen
+    ends after every step that may change it (transaction, press, key). When
+    run, the element ids of a screen are resolved with one findById each when
+    the screen is reached and the steps then execute in a tight loop against
+    the raw scripting objects.
+
+    Example:
+        ```python
+        plan = Plan("change_order", [
+            Step("transaction", code="VA02"),
+            Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value="{order}"),
+            Step("key", key="ENTER"),
+            Step("read", id="wnd[0]/sbar", name="status"),
+        ])
+        Path("change_order.json").write_text(plan.to_json())
+        run = Plan.from_json(Path("change_order.json").read_text()).run(sap, {"order": "4711"}).value
+        print(run.outputs["status"], run.timings)
+        ```
+    """
+
+    def __init__(self, name: str, steps: list[Step]) -> None:
+        self.name: str = name
+        self.steps: list[Step] = steps
+        self.runs: int = 0
+        self.step_seconds: list[float] = [0.0] * len(steps)
+        self._screens: list[tuple[tuple[str, ...], int, int]] = []
+        # Compiled per step, by step position, the steps themselves are left untouched and can be shared
+        self._slots: list[int] = []
+        self._key_ids: list[int] = []
+        self._texts: list[str] = []
+        self._templates: list[bool] = []
+        self.validate()
+
+    def __repr__(self) -> str:
+        return f"Plan({self.name}, {len(self.steps)} steps)"
+
+    def __str__(self) -> str:
+        return f"Plan({self.name}, {len(self.steps)} steps)"
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def validate(self) -> None:
+        """
+        Validates and compiles the steps
+
+        Raises:
+            ValueError: If a step has an unknown operation, misses a required field,
+                has an unknown key or repeats an output name
+        """
+        _names: set[str] = set()
+        _screens: list[tuple[tuple[str, ...], int, int]] = []
+        _count = len(self.steps)
+        _slots, _key_ids, _texts, _templates = [-1] * _count, [-1] * _count, [""] * _count, [False] * _count
+        _ids: dict[str, int] = {}
+        _start = 0
+        for _index, _step in enumerate(self.steps):
+            if _step.op not in OPERATIONS:
+                raise ValueError(f"Step {_index}: unknown operation '{_step.op}'")
+            _required, _ = OPERATIONS[_step.op]
+            for _field in _required:
+                _value = getattr(_step, _field)
+                if _value is None or (_value == "" and _field != "value"):
+                    raise ValueError(f"Step {_index}: '{_step.op}' requires '{_field}'")
+            if _step.name is not None:
+                if _step.name in _names:
+                    raise ValueError(f"Step {_index}: duplicate output name '{_step.name}'")
+                _names.add(_step.name)
+            _id = _step.id
+            if _step.op == "key":
+                _key_id = get_key_id(_step.key)
+                if _key_id is None:
+                    raise ValueError(f"Step {_index}: unknown key '{_step.key}'")
+                _key_ids[_index] = int(_key_id)
+                _id = f"wnd[{_step.window or 0}]"
+            if _step.op == "set":
+                _texts[_index] = str(_step.value)
+                _templates[_index] = _is_template(_texts[_index])
+            if _id is not None and _step.op != "transaction":
+                _slots[_index] = _ids.setdefault(_id, len(_ids))
+            if _step.op in SCREEN_CHANGING or _index == len(self.steps) - 1:
+                _screens.append((tuple(_ids), _start, _index + 1))
+                _ids = {}
+                _start = _index + 1
+        self._screens = _screens
+        self._slots, self._key_ids, self._texts, self._templates = _slots, _key_ids, _texts, _templates
+
+    def run(self, sap: Any, params: Optional[dict[str, Any]] = None) -> Result:
+        """
+        Executes the plan on a SAP instance
+
+        Args:
+            sap: The SAP instance whose session the plan runs in
+            params: Values for the '{name}' placeholders of 'set' steps
+
+        Returns:
+            Result with the PlanRun as value, on failure also the error and the failed step index
+        """
+        _run = PlanRun(self)
+        _params = params if params is not None else {}
+        _timings = _run.timings
+        _outputs = _run.outputs
+        _steps = self.steps
+        _slots, _key_ids, _texts, _templates = self._slots, self._key_ids, self._texts, self._templates
+        _session = sap.session
+        _clock = time.perf_counter
+        _index = 0
+        _started = _clock()
+        try:
+            for _ids, _first, _stop in self._screens:
+                _index = _first
+                _elements = []
+                for _slot, _id in enumerate(_ids):
+                    try:
+                        _elements.append(_session.findById(_id))
+                    except Exception:
+                        _index = next(i for i in range(_first, _stop) if _slots[i] == _slot)
+                        raise
+                for _index in range(_first, _stop):
+                    _step_started = _clock()
+                    _step = _steps[_index]
+                    _op = _step.op
+                    if _op == "set":
+                        _elements[_slots[_index]].Text = _texts[_index].format_map(_params) if _templates[_index] else _texts[_index]
+                    elif _op == "key":
+                        _elements[_slots[_index]].sendVKey(_key_ids[_index])
+                    elif _op == "transaction":
+                        _session.StartTransaction(_step.code)
+                    elif _op == "press":
+                        _elements[_slots[_index]].Press()
+                    elif _op == "read":
+                        _outputs[_step.name] = _elements[_slots[_index]].Text
+                    elif _op == "table":
+                        _outputs[_step.name] = (
+                            Table(element=GuiElement(element=_elements[_slots[_index]]))
+                            .read_all(columns=_step.columns, chunk_rows=_step.chunk_rows)
+                            .columns
+                        )
+                    elif _op == "focus":
+                        _elements[_slots[_index]].SetFocus()
+                    elif _op == "select":
+                        _elements[_slots[_index]].Select()
+                    _timings[_index] = _clock() - _step_started
+        except Exception as e:
+            _run.failed_step = _index
+            _run.seconds = _clock() - _started
+            return Result(value=_run, error=e, message=f"Error in step {_index} ({_steps[_index].op}) of plan {self.name}.")
+        finally:
+            sap.element_cache.clear()
+        _run.seconds = _clock() - _started
+        self.runs += 1
+        _totals = self.step_seconds
+        for _index, _seconds in enumerate(_timings):
+            _totals[_index] += _seconds
+        return Result(value=_run)
+
+    def average_step_seconds(self) -> list[float]:
+        """Returns the mean duration of every step over all successful runs"""
+        return [s / self.runs if self.runs else 0.0 for s in self.step_seconds]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the plan as a JSON-serializable dictionary"""
+        return {"name": self.name, "steps": [s.to_dict() for s in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Plan":
+        """Creates and validates a plan from a dictionary as written by to_dict"""
+        return cls(name=data["name"], steps=[Step.from_dict(s) for s in data["steps"]])
+
+    def to_json(self) -> str:
+        """Returns the plan serialized as JSON"""
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def from_json(cls, value: str) -> "Plan":
+        """Creates and validates a plan from JSON as written by to_json"""
+        return cls.from_dict(json.loads(value))
+
+    def save(self, path: str | Path) -> None:
+        """Writes the plan as JSON to a file"""
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Plan":
+        """Loads and validates a plan from a JSON file"""
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
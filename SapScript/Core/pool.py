@@ -0,0 +1,339 @@
+import functools
+import threading
+import time
+from typing import Any, Callable, Optional
+from ..Backend.base import Backend, Dispatch
+from ..Utils.catalog import SystemCatalog
+from .executor import MAX_SESSIONS
+from .sap import SAP
+from .wait import poll
+
+
+class PoolStats:
+    """
+    PoolStats - Lease counters and latencies of a SessionPool
+    """
+
+    def __init__(self) -> None:
+        self.leases: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.releases: int = 0
+        self.evictions: int = 0
+        self.health_failures: int = 0
+        self.reset_failures: int = 0
+        self.lease_seconds: float = 0.0
+        self.max_lease_seconds: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"PoolStats({self.leases} leases, hit_rate={self.hit_rate:.2f})"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.leases} leases ({self.hits} hits, {self.misses} misses), {self.evictions} evictions, "
+            f"avg lease {self.average_lease_seconds * 1000:.1f}ms, max {self.max_lease_seconds * 1000:.1f}ms"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the share of leases served by an idle pooled session"""
+        return self.hits / self.leases if self.leases else 0.0
+
+    @property
+    def average_lease_seconds(self) -> float:
+        """Returns the mean time lease() took to hand out a session"""
+        return self.lease_seconds / self.leases if self.leases else 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Returns the counters as a dictionary"""
+        return {
+            "leases": self.leases,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "releases": self.releases,
+            "evictions": self.evictions,
+            "health_failures": self.health_failures,
+            "reset_failures": self.reset_failures,
+            "average_lease_seconds": self.average_lease_seconds,
+            "max_lease_seconds": self.max_lease_seconds,
+        }
+
+
+class Lease:
+    """
+    Lease - A pooled session handed out to one user until released
+
+    Use it as a context manager, the session is returned to the pool on exit.
+    """
+
+    def __init__(self, pool: "SessionPool", sid: str, sap: SAP, session_id: str) -> None:
+        self.pool: SessionPool = pool
+        self.sid: str = sid
+        self.sap: SAP = sap
+        self.session_id: str = session_id
+        self.released: bool = False
+
+    def __repr__(self) -> str:
+        return f"Lease({self.sid}, {self.session_id}{', released' if self.released else ''})"
+
+    def __str__(self) -> str:
+        return f"Lease({self.sid}, {self.session_id}{', released' if self.released else ''})"
+
+    def __enter__(self) -> SAP:
+        return self.sap
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    def release(self, reset: bool = True) -> None:
+        """Returns the session to the pool, reset to the easy access menu unless reset is False"""
+        self.pool.release(self, reset=reset)
+
+
+class SessionPool:
+    """
+    SessionPool - Reuses logged on connections and sessions across SAP handles, keyed by SID
+
+    The pool only leases sessions it created: the first session of a connection
+    it opened and the sessions it opened with CreateSession. Sessions of a
+    connection that was already open, e.g. driven by another SAP handle or a
+    person, are never leased, and such a connection is never closed by the
+    pool. lease() hands out an idle session after a health check (session.Info),
+    or creates a new one while fewer than max_sessions are pooled, and waits for
+    a release otherwise. Released sessions are reset to the easy access menu and
+    kept for reuse until they are idle for idle_timeout seconds.
+
+    Example:
+        ```python
+        pool = SessionPool(idle_timeout=600)
+        for order in orders:
+            with pool.lease("PRD") as sap:
+                sap.start_transaction("VA02")
+                ...
+        print(pool.stats)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        idle_timeout: float = 300.0,
+        backend: Optional[Backend] = None,
+        catalog: Optional[SystemCatalog] = None,
+        handle_factory: Optional[Callable[..., SAP]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= max_sessions <= MAX_SESSIONS:
+            raise ValueError(f"max_sessions must be between 1 and {MAX_SESSIONS}")
+        self.max_sessions: int = max_sessions
+        self.idle_timeout: float = idle_timeout
+        self.backend: Backend | None = backend
+        self.catalog: SystemCatalog | None = catalog
+        self.handle_factory: Callable[..., SAP] = (
+            handle_factory
+            if handle_factory is not None
+            else functools.partial(SAP.from_session, backend=backend, catalog=catalog)
+        )
+        self.clock: Callable[[], float] = clock
+        self.stats: PoolStats = PoolStats()
+        self._connections: dict[str, Dispatch] = {}
+        self._opened: set[str] = set()
+        self._created: dict[str, set[str]] = {}
+        self._idle: dict[str, list[tuple[SAP, float]]] = {}
+        self._leased: dict[str, set[str]] = {}
+        self._opening: dict[str, int] = {}
+        self._open_locks: dict[str, threading.Lock] = {}
+        self._condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return f"SessionPool({', '.join(f'{s}: {self.in_use(s)}/{self.idle(s)}' for s in self._connections)})"
+
+    def __str__(self) -> str:
+        return f"SessionPool({', '.join(f'{s}: {self.in_use(s)}/{self.idle(s)}' for s in self._connections)})"
+
+    def in_use(self, sid: str) -> int:
+        """Returns the number of leased sessions of a SID"""
+        return len(self._leased.get(sid, ()))
+
+    def idle(self, sid: str) -> int:
+        """Returns the number of idle pooled sessions of a SID"""
+        return len(self._idle.get(sid, ()))
+
+    def lease(self, sid: str, timeout: float = 30.0) -> Lease:
+        """
+        Hands out a session of a system
+
+        Args:
+            sid: System to lease a session of, as accepted by SAP(sid)
+            timeout: Seconds to wait for a session when all of them are leased
+
+        Returns:
+            A Lease whose sap attribute is a SAP handle bound to the session
+
+        Raises:
+            TimeoutError: If no session becomes available within the timeout
+            ConnectionError: If the system cannot be connected to
+        """
+        _start = time.perf_counter()
+        _deadline = _start + timeout
+        with self._condition:
+            self.evict_idle()
+            while True:
+                _sap = self._take_idle(sid)
+                if _sap is not None:
+                    self.stats.hits += 1
+                    break
+                if self._open_slots(sid) > 0:
+                    self._opening[sid] = self._opening.get(sid, 0) + 1
+                    self._condition.release()
+                    try:
+                        _sap = self._open_session(sid)
+                    finally:
+                        self._condition.acquire()
+                        self._opening[sid] -= 1
+                    self.stats.misses += 1
+                    break
+                _remaining = _deadline - time.perf_counter()
+                if _remaining <= 0 or not self._condition.wait(_remaining):
+                    raise TimeoutError(f"No session of {sid} released within {timeout}s")
+            _session_id = _sap.session.Id
+            self._leased.setdefault(sid, set()).add(_session_id)
+            _seconds = time.perf_counter() - _start
+            self.stats.leases += 1
+            self.stats.lease_seconds += _seconds
+            self.stats.max_lease_seconds = max(self.stats.max_lease_seconds, _seconds)
+            return Lease(self, sid, _sap, _session_id)
+
+    def release(self, lease: Lease, reset: bool = True) -> None:
+        """
+        Returns a leased session to the pool
+
+        The session is reset to the easy access menu first, a session that fails
+        the reset is closed instead of being pooled.
+
+        Args:
+            lease: The lease to return
+            reset: End the current transaction before pooling the session
+        """
+        if lease.released:
+            return
+        lease.released = True
+        _sap = lease.sap
+        _reset = not reset or _sap.end_transaction().ok
+        with self._condition:
+            self.stats.releases += 1
+            self._leased.get(lease.sid, set()).discard(lease.session_id)
+            if not _reset:
+                self.stats.reset_failures += 1
+                self._close(lease.sid, _sap)
+            else:
+                _sap.element_cache.clear()
+                self._idle.setdefault(lease.sid, []).append((_sap, self.clock()))
+            self._condition.notify()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Closes the sessions that have been idle for longer than idle_timeout
+
+        Args:
+            now: Current clock value, defaults to clock()
+
+        Returns:
+            The number of evicted sessions
+        """
+        _now = now if now is not None else self.clock()
+        _evicted = 0
+        with self._condition:
+            for _sid, _idle in self._idle.items():
+                _expired = [s for s, t in _idle if _now - t >= self.idle_timeout]
+                if _expired:
+                    _idle[:] = [(s, t) for s, t in _idle if _now - t < self.idle_timeout]
+                    for _sap in _expired:
+                        self._close(_sid, _sap)
+                    _evicted += len(_expired)
+            self.stats.evictions += _evicted
+        return _evicted
+
+    def close(self) -> None:
+        """Closes every idle session and forgets the connections, leased sessions are left open"""
+        with self._condition:
+            for _sid, _idle in self._idle.items():
+                for _sap, _ in _idle:
+                    self._close(_sid, _sap)
+                _idle.clear()
+            self._connections.clear()
+            self._opened.clear()
+
+    def _take_idle(self, sid: str) -> SAP | None:
+        _idle = self._idle.get(sid)
+        while _idle:
+            _sap, _ = _idle.pop()
+            if self._healthy(_sap.session):
+                return _sap
+            self.stats.health_failures += 1
+        return None
+
+    def _healthy(self, session: Dispatch) -> bool:
+        try:
+            return session.Info.SessionNumber is not None
+        except Exception as _:
+            return False
+
+    def _open_slots(self, sid: str) -> int:
+        return self.max_sessions - self.in_use(sid) - self.idle(sid) - self._opening.get(sid, 0)
+
+    def _connection(self, sid: str) -> Dispatch:
+        _connection = self._connections.get(sid)
+        if _connection is not None:
+            try:
+                _connection.Children.Count
+                return _connection
+            except Exception as _:
+                del self._connections[sid]
+                self._opened.discard(sid)
+        _sap = SAP(sid, backend=self.backend, catalog=self.catalog)
+        if _sap.connection is None:
+            raise ConnectionError(f"Could not connect to {sid}")
+        self._connections[sid] = _sap.connection
+        if _sap.connection_opened:
+            self._opened.add(sid)
+            with self._condition:
+                self._created.setdefault(sid, set()).add(_sap.session.Id)
+        return _sap.connection
+
+    def _open_session(self, sid: str) -> SAP:
+        with self._open_locks.setdefault(sid, threading.Lock()):
+            _connection = self._connection(sid)
+            with self._condition:
+                _owned = self._leased.get(sid, set()) | {s.session.Id for s, _ in self._idle.get(sid, [])}
+                _created = set(self._created.get(sid, ()))
+            _sessions = list(_connection.Children)
+            _free = next((s for s in _sessions if s.Id in _created and s.Id not in _owned), None)
+            if _free is None:
+                _known = {s.Id for s in _sessions}
+                _sessions[0].CreateSession()
+                _free, _ = poll(lambda: next((s for s in _connection.Children if s.Id not in _known), None), timeout=30.0)
+            _session_id = _free.Id
+            with self._condition:
+                self._created.setdefault(sid, set()).add(_session_id)
+                self._leased.setdefault(sid, set()).add(_session_id)
+        try:
+            return self.handle_factory(_free, sid)
+        except Exception:
+            with self._condition:
+                self._leased[sid].discard(_session_id)
+            raise
+
+    def _close(self, sid: str, sap: SAP) -> None:
+        try:
+            self._created.get(sid, set()).discard(sap.session.Id)
+            _connection = sap.session.Parent
+            if _connection.Children.Count <= 1 and sid in self._opened:
+                self._opened.discard(sid)
+                _connection.CloseConnection()
+                self._connections.pop(sid, None)
+            else:
+                sap.session.Close()
+        except Exception as _:
+            pass
@@ -1,20 +1,140 @@
-from typing import Any, Optional
+import time
+from collections import deque
+from typing import Any, Iterator, Optional
 
+#: Characters of an error text kept in the error log
+MAX_ERROR_TEXT: int = 500
 
-error_list: list[object] = []
+
+class ErrorRecord:
+    """
+    ErrorRecord - Summary of one failed Result, holding no reference to the exception or its traceback
+    """
+
+    __slots__ = ("time", "type", "text", "message")
+
+    def __init__(self, error: object, message: Optional[str] = None) -> None:
+        self.time: float = time.time()
+        self.type: str = type(error).__name__
+        self.text: str = str(error)[:MAX_ERROR_TEXT]
+        self.message: str | None = message
+
+    def __repr__(self) -> str:
+        return f"ErrorRecord({self.type}: {self.text})"
+
+    def __str__(self) -> str:
+        return f"{self.type}: {self.text}" if self.message is None else f"{self.message} {self.type}: {self.text}"
+
+
+class ErrorLog:
+    """
+    ErrorLog - Bounded ring buffer of the most recent errors with a counter per error class
+
+    Only summaries are stored, so exceptions, their tracebacks and any COM
+    objects referenced by their frames are released as soon as the caller drops
+    the Result. The counters keep counting after old records are dropped.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self.maxsize: int = maxsize
+        self.total: int = 0
+        self.counts: dict[str, int] = {}
+        self._records: deque[ErrorRecord] = deque(maxlen=maxsize)
+
+    def __repr__(self) -> str:
+        return f"ErrorLog({len(self._records)}/{self.maxsize}, total={self.total})"
+
+    def __str__(self) -> str:
+        return f"ErrorLog({len(self._records)}/{self.maxsize}, total={self.total})"
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[ErrorRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> ErrorRecord:
+        return self._records[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of records pushed out of the buffer"""
+        return self.total - len(self._records)
+
+    def append(self, error: object, message: Optional[str] = None) -> None:
+        """Records a summary of an error"""
+        _record = ErrorRecord(error, message)
+        self._records.append(_record)
+        self.counts[_record.type] = self.counts.get(_record.type, 0) + 1
+        self.total += 1
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the number of records kept, dropping the oldest ones if needed"""
+        self.maxsize = maxsize
+        self._records = deque(self._records, maxlen=maxsize)
+
+    def clear(self) -> None:
+        """Drops every record and resets the counters"""
+        self._records.clear()
+        self.counts.clear()
+        self.total = 0
+
+
+#: Process-wide log of failed Results, kept under its historic name
+error_list: ErrorLog = ErrorLog()
+
+
+def _restore(value: Any, message: str | None, error: object | None) -> "Result":
+    _result = Result.__new__(Result)
+    for _name, _value in zip(Result.__slots__, (value, message, error, error is None)):
+        object.__setattr__(_result, _name, _value)
+    return _result
 
 
 class Result:
+    """
+    Result - Immutable outcome of an operation
+
+    A Result with an error is summarized in error_list once, when it is created.
+    Successful Results do no work beyond setting their four slots. Since they
+    are immutable, success paths without a value share instances: OK for no
+    message at all, module level constants for fixed messages.
+    """
+
+    __slots__ = ("value", "message", "error", "ok")
+
     def __init__(
         self,
         value: Optional[Any] = None,
         message: Optional[str] = None,
         error: Optional[object] = None,
     ) -> None:
-        global error_list
-        self.value: Any = value if value is not None else None
-        self.message: str | None = message if message is not None else None
-        self.error: object | None = error if error is not None else None
-        self.ok: bool = True if error is None else False
-        if not self.ok:
-            error_list.append(self.error)
+        _set = object.__setattr__
+        _set(self, "value", value)
+        _set(self, "message", message)
+        _set(self, "error", error)
+        _set(self, "ok", error is None)
+        if error is not None:
+            error_list.append(error, message)
+
+    def __repr__(self) -> str:
+        return f"Result(ok={self.ok}, value={self.value!r}, message={self.message!r}, error={self.error!r})"
+
+    def __str__(self) -> str:
+        return f"Result(ok={self.ok}, value={self.value!r}, message={self.message!r}, error={self.error!r})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Result is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Result is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_restore, (self.value, self.message, self.error))
+
+
+#: Shared successful Result without value or message
+OK: Result = Result()
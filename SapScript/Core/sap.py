@@ -1,46 +1,129 @@
-from typing import Optional
-import win32com.client  # type: ignore
-from dotenv import dotenv_values  # type: ignore
-from .result import Result, error_list  # noqa: F401
-from ..Gui.elements import GuiElement  # noqa: F401
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Generator, Mapping, Optional, TextIO
+from ..Backend.base import Backend, Dispatch, get_backend
+from .cache import ElementCache
+from .fill import FillStats
+from .messages import MessageLog, capture
+from .wait import WaitStats, poll
+from .windows import WindowWatcher
+from .result import ErrorLog, Result, error_list  # noqa: F401
+from ..Gui.elements import GuiElement, wrap_element  # noqa: F401
 from ..Gui.vkeys import VKeys  # noqa: F401
+from ..Utils.catalog import SystemCatalog, SystemRecord, default_catalog
+from ..Utils.config import load_config
+
+if TYPE_CHECKING:
+    from ..Backend.instrument import Instrumentation, Sink
 
 sap_connections: list[str] = []
 sap_sessions: list[str] = []
-sap_windows: list[str] = []
+
+# Results are immutable, success paths with a fixed message share one instance
+_CONNECTION_CLOSED: Result = Result(message="Connection closed.")
+_SESSION_CLOSED: Result = Result(message="Session closed.")
+_WINDOW_CLOSED: Result = Result(message="Window closed.")
 
 
 class SAP:
-    def __init__(self, sid: str) -> None:
-        global sap_connections, sap_sessions, sap_windows
+    def __init__(
+        self,
+        sid: str,
+        element_cache_size: int = 128,
+        backend: Optional[Backend] = None,
+        catalog: Optional[SystemCatalog] = None,
+        capture_messages: bool = False,
+    ) -> None:
+        global sap_connections, sap_sessions
+        self.backend: Backend = backend if backend is not None else get_backend()
+        self.catalog: SystemCatalog | None = catalog if catalog is not None else default_catalog()
+        self.system: SystemRecord | None = self.catalog.resolve(sid) if self.catalog is not None else None
         self.keys: VKeys = VKeys()
-        self._config = dotenv_values(".env")
+        self.element_cache: ElementCache = ElementCache(maxsize=element_cache_size)
+        self.waits: WaitStats = WaitStats()
+        self.messages: MessageLog = MessageLog()
+        self.capture_messages: bool = capture_messages
+        self.windows: WindowWatcher = WindowWatcher()
         self.sap_connections: list[str] = sap_connections
         self.sap_sessions: list[str] = sap_sessions
-        self.sap_windows: list[str] = sap_windows
-        self.errors: list[object] = error_list
+        self.sap_windows: OrderedDict[str, Dispatch] = self.windows.registry
+        self.errors: ErrorLog = error_list
         self.sid: str = sid
-        self.gui: win32com.client.CDispatch | None = self.get_gui().value
-        self.app: win32com.client.CDispatch = self.get_app().value
+        self.gui: Dispatch | None = self.get_gui().value
+        self.app: Dispatch = self.get_app().value
         self.connection_number: int | None = None
-        self.connection: win32com.client.CDispatch | None = self.get_connection().value
+        self.connection_opened: bool = False
+        self.connection: Dispatch | None = self.get_connection().value
         self.session_number: int | None = None
-        self.session: win32com.client.CDispatch | None = self.get_session().value
+        self.session: Dispatch | None = self.get_session().value
         self.window_number: int | None = None
-        self.window: win32com.client.CDispatch | None = self.get_window().value
+        self.window: Dispatch | None = self.get_window().value
         self.client: str | None = None
         self.user: str | None = None
         self.current_transaction: str | None = None
 
+    @classmethod
+    def from_session(
+        cls,
+        session: Dispatch,
+        sid: Optional[str] = None,
+        element_cache_size: int = 128,
+        backend: Optional[Backend] = None,
+        catalog: Optional[SystemCatalog] = None,
+        capture_messages: bool = False,
+    ) -> "SAP":
+        """
+        Creates a SAP handle bound to an already open session
+
+        The handle keeps its own connection, session and window lists instead of
+        the shared module-level ones, so several handles can drive different
+        sessions of the same connection side by side.
+        """
+        self = cls.__new__(cls)
+        self.backend = backend if backend is not None else get_backend()
+        self.catalog = catalog
+        self.system = catalog.resolve(sid) if catalog is not None and sid is not None else None
+        self.keys = VKeys()
+        self.element_cache = ElementCache(maxsize=element_cache_size)
+        self.waits = WaitStats()
+        self.messages = MessageLog()
+        self.capture_messages = capture_messages
+        self.windows = WindowWatcher()
+        self.sap_connections = []
+        self.sap_sessions = []
+        self.sap_windows = self.windows.registry
+        self.errors = error_list
+        self.sid = sid
+        self.gui = None
+        self.app = None
+        self.connection_number = None
+        self.connection_opened = False
+        self.connection = session.Parent
+        self.session_number = None
+        self.session = session
+        self.window_number = None
+        self.window = self.get_window().value
+        self.client = None
+        self.user = None
+        self.current_transaction = None
+        return self
+
     def __repr__(self) -> str:
         return f"SAP({self.sid})"
 
     def __str__(self) -> str:
         return f"SAP({self.sid})"
 
+    @property
+    def config(self) -> Mapping[str, str | None]:
+        """Returns the values of the .env file in the current directory, read once per process"""
+        return load_config()
+
     def get_gui(self) -> Result:
         try:
-            return Result(value=win32com.client.GetObject("SAPGUI"))
+            return Result(value=self.backend.get_object("SAPGUI"))
         except Exception as e:
             return Result(error=e, message="Error getting SAP GUI.")
 
@@ -51,24 +134,31 @@ class SAP:
             return Result(error=e, message="Error getting SAP GUI scripting engine.")
 
     def get_connection(self) -> Result:
-        if len(self.sap_connections) == 0:
-            try:
-                self.sap_connections = self.app.connections
-            except Exception as _:
-                pass
+        """
+        Returns the open connection of the system, opening it from SAP Logon if needed
+
+        The sid is resolved through the system catalog, so an entry name, entry
+        uuid or system id all select the SAP Logon entry to connect to. Without
+        a catalog entry the sid is used as the entry name. connection_opened
+        tells whether the connection was opened here or was already open.
+
+        Returns:
+            Result with the GuiConnection as value
+        """
+        _description = self.system.name if self.system is not None else self.sid
         try:
-            if len(self.sap_connections) > 0:
-                for _connection in self.sap_connections:
-                    if _connection.description == self.sid:
-                        self.connection_number = _connection.Id[-2]
-                        return Result(value=_connection)
-            else:
-                _connection = self.app.OpenConnection(self.sid, True)
-                self.connection_number = _connection.Id[-2]
-                self.sap_connections = self.app.connections
-                return Result(value=_connection)
+            self.sap_connections = self.app.Connections
+            for _connection in self.sap_connections:
+                if _connection.Description == _description:
+                    self.connection_number = _connection.Id[-2]
+                    return Result(value=_connection)
+            _connection = self.app.OpenConnection(_description, True)
+            self.connection_opened = True
+            self.connection_number = _connection.Id[-2]
+            self.sap_connections = self.app.Connections
+            return Result(value=_connection)
         except Exception as e:
-            return Result(error=e, message="Error getting connection.")
+            return Result(error=e, message=f"Error getting connection {_description}.")
 
     def get_session(self, session_number: Optional[int | None] = None) -> Result:
         if len(self.sap_sessions) == 0:
@@ -91,13 +181,12 @@ class SAP:
             self.window_number = window_number
         else:
             self.window_number = 0
+        self.element_cache.mark_dirty()
         try:
-            _window = self.session.findById(f"wnd[{self.window_number}]")
-            if _window in self.sap_windows:
-                return Result(value=_window)
-            else:
-                self.sap_windows.append(_window)
-                return Result(value=_window)
+            _id = f"wnd[{self.window_number}]"
+            _window = self.session.findById(_id)
+            self.windows.remember(_id, _window)
+            return Result(value=_window)
         except Exception as e:
             return Result(error=e, message="Error getting window.")
 
@@ -107,57 +196,391 @@ class SAP:
         except Exception as e:
             return Result(error=e, message="Error getting session info.")
 
-    def start_transaction(self, value: str) -> Result:
+    def start_transaction(self, value: str, wait: bool = False) -> Result:
+        self.element_cache.clear()
         try:
             self.session.StartTransaction(Transaction=value)
-            _result = Result(message=f"Transaction {value} started.")
+            if wait:
+                _waited = self.wait_until_idle()
+                if not _waited.ok:
+                    return _waited
             self.current_transaction = value
-            return _result
+            _popup = self._after_action(f"start_transaction {value}")
+            if _popup is not None:
+                return _popup
+            return Result(message=f"Transaction {value} started.")
         except Exception as e:
             return Result(error=e, message=f"Error starting transaction {value}.")
 
     def end_transaction(self) -> Result:
+        self.element_cache.clear()
         try:
             self.session.EndTransaction()
-            _result = Result(message=f"Transaction {self.current_transaction} ended.")
+            _transaction = self.current_transaction
             self.current_transaction = None
-            return _result
+            _popup = self._after_action("end_transaction")
+            if _popup is not None:
+                return _popup
+            return Result(message=f"Transaction {_transaction} ended.")
         except Exception as e:
             return Result(error=e, message="Error ending transaction.")
 
     def close_connection(self) -> Result:
         try:
             self.connection.Close()
-            _result = Result(message="Connection closed.")
-            return _result
+            return _CONNECTION_CLOSED
         except Exception as e:
             return Result(error=e, message="Error closing connection.")
 
     def close_session(self) -> Result:
         try:
             self.session.Close()
-            _result = Result(message="Session closed.")
-            return _result
+            return _SESSION_CLOSED
         except Exception as e:
             return Result(error=e, message="Error closing session.")
 
     def close_window(self) -> Result:
+        self.element_cache.mark_dirty()
         try:
             self.window.Close()
-            _result = Result(message="Window closed.")
-            return _result
+            return _WINDOW_CLOSED
         except Exception as e:
             return Result(error=e, message="Error closing window.")
 
-    def send_key(self, key: str) -> Result:
+    def send_key(self, key: str | int, wait: bool = False) -> Result:
+        self.element_cache.mark_dirty()
         try:
-            self.window.sendVKey(self.keys.get_key_id(key))
+            _key_id = self.keys.get_key_id(key)
+            if _key_id is None:
+                raise ValueError(f"Unknown key {key}")
+            self.window.sendVKey(int(_key_id))
+            if wait:
+                _waited = self.wait_until_idle()
+                if not _waited.ok:
+                    return _waited
+            _popup = self._after_action(f"send_key {key}")
+            if _popup is not None:
+                return _popup
             return Result(message=f"Key {key} sent.")
         except Exception as e:
             return Result(error=e, message=f"Error sending key {key}.")
 
-    def get_element(self, id: str) -> Result:
+    def read_messages(self, action: str = "read_messages", popups: bool = True) -> Result:
+        """
+        Records the current status bar message and popup windows in self.messages
+
+        Called after start_transaction, end_transaction and send_key when
+        capture_messages is set, call it directly after other actions such as
+        pressing a button.
+
+        Args:
+            action: Description of the action that caused the messages
+            popups: Also record modal windows
+
+        Returns:
+            Result with the list of recorded MessageEvents as value
+
+        Example:
+            ```python
+            sap = SAP("PRD", capture_messages=True)
+            sap.send_key("ENTER")
+            if sap.messages.last(type="EA"):
+                ...
+            ```
+        """
         try:
+            _events = capture(self.session, self.messages, action, popups=popups)
+            return Result(value=_events, message=f"{len(_events)} messages read.")
+        except Exception as e:
+            return Result(error=e, message="Error reading messages.")
+
+    def dismiss_popups(self) -> Result:
+        """
+        Dismisses the open popups that match a rule registered in self.windows
+
+        Called after start_transaction, end_transaction and send_key when
+        rules are registered, those actions then return this Result if a
+        popup is left open.
+
+        Returns:
+            Result with one PopupMatch per popup seen as value, with an error if a popup matched no rule
+
+        Example:
+            ```python
+            sap.windows.add_rule(title="Information", key="ENTER")
+            sap.get_element("wnd[0]/usr/btnPOST").value.element.Press()
+            sap.dismiss_popups()
+            ```
+        """
+        try:
+            _matches = self.windows.check(self.session)
+        except Exception as e:
+            return Result(error=e, message="Error dismissing popups.")
+        if any(m.dismissed for m in _matches):
+            self.element_cache.mark_dirty()
+        if _matches and not _matches[-1].dismissed:
+            _open = _matches[-1]
+            _reason = "No popup rule for" if _open.rule is None else f"Popup rule {_open.rule.name} did not close"
+            return Result(
+                value=_matches,
+                error=LookupError(f"{_reason} {_open.window} '{_open.title}'"),
+                message=f"Popup {_open.window} '{_open.title}' left open.",
+            )
+        return Result(value=_matches, message=f"{len(_matches)} popups dismissed.")
+
+    def _after_action(self, action: str) -> Result | None:
+        # Returns the failed dismiss_popups Result when a popup is left open, the action reports it
+        if self.capture_messages:
+            try:
+                capture(self.session, self.messages, action)
+            except Exception as _:
+                pass
+        if self.windows.rules:
+            _popups = self.dismiss_popups()
+            if not _popups.ok:
+                return _popups
+        return None
+
+    def get_element(self, id: str, cached: bool = False, specialize: bool = False) -> Result:
+        """
+        Looks up an element by id path
+
+        Args:
+            id: The element id path, e.g. 'wnd[0]/usr/txtRSYST-BNAME'
+            cached: Serve the element from the element cache. The cache only
+                re-checks the screen after SAP methods that may change it, so
+                call element_cache.mark_dirty() after navigating any other way,
+                e.g. with Actions.press or a raw COM call. An uncached element is a
+                new wrapper on every call, properties it fetched are kept until its
+                refresh() is called
+            specialize: Return the wrapper class registered for the element type, e.g. GridView
+                for an ALV grid, at the cost of reading Type (and SubType for shells) once
+
+        Returns:
+            Result with the GuiElement as value
+
+        Example:
+            ```python
+            grid = sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell", specialize=True).value
+            data = grid.read_all()
+            ```
+        """
+        try:
+            if cached:
+                _element = self.element_cache.get(self.session, id)
+                return Result(value=_element.specialize() if specialize else _element)
+            if specialize:
+                return Result(value=wrap_element(self.session.findById(id)))
             return Result(value=GuiElement(element=self.session.findById(id)))
         except Exception as e:
             return Result(error=e, message="Error getting element.")
+
+    def snapshot(
+        self, id: str = "wnd[0]", max_depth: Optional[int] = None, max_elements: Optional[int] = 10000
+    ) -> Result:
+        try:
+            _snapshot = GuiElement(element=self.session.findById(id)).snapshot(
+                max_depth=max_depth, max_elements=max_elements
+            )
+            return Result(value=_snapshot, message=f"Snapshot of {len(_snapshot)} elements in {_snapshot.elapsed:.3f}s.")
+        except Exception as e:
+            return Result(error=e, message=f"Error taking snapshot of {id}.")
+
+    def fill(
+        self, screen_values: dict[str, Any], commit_key: Optional[str | int] = None, skip_unchanged: bool = True
+    ) -> Result:
+        """
+        Writes the values of a screen in one pass and optionally sends a key afterwards
+
+        Ids are resolved through the element cache and the Changeable property is
+        read once per field and screen. With skip_unchanged the current text is
+        compared first and fields already holding the value are not written.
+
+        Args:
+            screen_values: Element id paths mapped to the values to write
+            commit_key: Key sent to the window after all fields are written, e.g. 'ENTER'
+            skip_unchanged: Skip fields whose text already matches the value
+
+        Returns:
+            Result with FillStats as value
+
+        Raises:
+            ValueError: If a field that has to be written is not changeable, returned as the Result error
+
+        Example:
+            ```python
+            stats = sap.fill({"wnd[0]/usr/ctxtVBAK-VBELN": "4711", "wnd[0]/usr/txtVBAK-BSTNK": "PO-1"}, commit_key="ENTER").value
+            print(stats.written, stats.skipped, stats.com_calls_saved)
+            ```
+        """
+        _stats = FillStats(fields=len(screen_values))
+        _cache = self.element_cache
+        # The screen may have been changed by a press or a raw COM call since the last SAP method
+        _cache.mark_dirty()
+        _misses, _changeable_reads, _screen_checks = _cache.misses, _cache.changeable_reads, _cache.screen_checks
+        _current_id = None
+        try:
+            for _current_id, _value in screen_values.items():
+                _value = str(_value)
+                _element = _cache.get(self.session, _current_id).element
+                if skip_unchanged:
+                    _stats.com_calls += 1
+                    if _element.Text == _value:
+                        _stats.skipped += 1
+                        continue
+                if not _cache.changeable(self.session, _current_id):
+                    raise ValueError(f"Element {_current_id} is not changeable")
+                _element.Text = _value
+                _stats.com_calls += 1
+                _stats.written += 1
+            _current_id = None
+        except Exception as e:
+            return Result(value=_stats, error=e, message=f"Error filling {_current_id}.")
+        finally:
+            _stats.com_calls += _cache.misses - _misses + _cache.changeable_reads - _changeable_reads
+            _stats.com_calls += (_cache.screen_checks - _screen_checks) * _cache.SIGNATURE_CALLS
+        if commit_key is not None:
+            _result = self.send_key(commit_key)
+            if not _result.ok:
+                return Result(value=_stats, error=_result.error, message=_result.message)
+        return Result(value=_stats, message=f"{_stats.written} of {_stats.fields} fields written, {_stats.com_calls_saved} COM calls saved.")
+
+    def _wait(self, kind: str, condition: Any, timeout: float, initial_delay: float, max_delay: float) -> tuple[Any, float]:
+        _start = time.perf_counter()
+        try:
+            _value, _seconds = poll(condition, timeout=timeout, initial_delay=initial_delay, max_delay=max_delay)
+        except TimeoutError:
+            self.waits.record(kind, time.perf_counter() - _start, timed_out=True)
+            raise
+        self.waits.record(kind, _seconds)
+        return _value, _seconds
+
+    def wait_until_idle(self, timeout: float = 30.0, initial_delay: float = 0.01, max_delay: float = 0.5) -> Result:
+        """
+        Waits until the session has finished processing the last round trip
+
+        Polls session.Busy with exponential backoff instead of sleeping a fixed time.
+
+        Args:
+            timeout: Seconds to wait at most
+            initial_delay: Seconds slept after the first busy check
+            max_delay: Upper bound of the sleep between two checks
+
+        Returns:
+            Result with the seconds waited as value, a TimeoutError as error if the session stays busy
+
+        Example:
+            ```python
+            sap.send_key("ENTER")
+            sap.wait_until_idle(timeout=10)
+            ```
+        """
+        try:
+            _, _seconds = self._wait("idle", lambda: not self.session.Busy, timeout, initial_delay, max_delay)
+            return Result(value=_seconds, message=f"Session idle after {_seconds:.3f}s.")
+        except Exception as e:
+            return Result(error=e, message="Error waiting for the session to become idle.")
+
+    def wait_for_element(
+        self, id: str, timeout: float = 30.0, initial_delay: float = 0.01, max_delay: float = 0.5
+    ) -> Result:
+        """
+        Waits until an element exists on the current screen
+
+        Args:
+            id: The element id path, e.g. 'wnd[1]/usr/btnSPOP-OPTION1'
+            timeout: Seconds to wait at most
+            initial_delay: Seconds slept after the first unsuccessful lookup
+            max_delay: Upper bound of the sleep between two lookups
+
+        Returns:
+            Result with the GuiElement as value, a TimeoutError as error if it does not appear
+        """
+        try:
+            _element, _seconds = self._wait(
+                "element", lambda: self.session.findById(id, False), timeout, initial_delay, max_delay
+            )
+            return Result(value=GuiElement(element=_element), message=f"Element {id} found after {_seconds:.3f}s.")
+        except Exception as e:
+            return Result(error=e, message=f"Error waiting for element {id}.")
+
+    def wait_for_screen(
+        self,
+        program: str,
+        dynpro: int | str,
+        timeout: float = 30.0,
+        initial_delay: float = 0.01,
+        max_delay: float = 0.5,
+    ) -> Result:
+        """
+        Waits until the session shows a screen, identified by program and dynpro number
+
+        Args:
+            program: The ABAP program of the screen, e.g. 'SAPMV45A'
+            dynpro: The screen number, e.g. 4001
+            timeout: Seconds to wait at most
+            initial_delay: Seconds slept after the first unsuccessful check
+            max_delay: Upper bound of the sleep between two checks
+
+        Returns:
+            Result with the seconds waited as value, a TimeoutError as error if the screen is not reached
+        """
+        _dynpro = int(dynpro)
+
+        def _on_screen() -> bool:
+            if self.session.Busy:
+                return False
+            _info = self.session.Info
+            return _info.Program == program and int(_info.ScreenNumber) == _dynpro
+
+        try:
+            _, _seconds = self._wait("screen", _on_screen, timeout, initial_delay, max_delay)
+            self.element_cache.mark_dirty()
+            return Result(value=_seconds, message=f"Screen {program} {_dynpro} reached after {_seconds:.3f}s.")
+        except Exception as e:
+            return Result(error=e, message=f"Error waiting for screen {program} {_dynpro}.")
+
+    @contextmanager
+    def profile(
+        self, top: int = 10, sinks: Optional[list["Sink"]] = None, file: Optional[TextIO] = None
+    ) -> Generator["Instrumentation", Any, None]:
+        """
+        Times every scripting call made through this handle while the context is open
+
+        The handle's gui, app, connection, session and window are swapped for
+        instrumented proxies and the element cache is cleared, so elements looked
+        up inside the block are instrumented too. On exit the original objects are
+        restored and the top slowest call sites are printed.
+
+        Args:
+            top: Number of call sites to print, 0 prints nothing
+            sinks: Additional sinks, e.g. JsonLinesSink('trace.jsonl')
+            file: Stream the report is printed to, defaults to stdout
+
+        Yields:
+            The Instrumentation, its summary property holds the in-memory SummarySink
+
+        Example:
+            ```python
+            with sap.profile(top=5):
+                sap.start_transaction("VA02")
+                sap.fill({"wnd[0]/usr/ctxtVBAK-VBELN": "4711"}, commit_key="ENTER")
+            ```
+        """
+        from ..Backend.instrument import Instrumentation, SummarySink, instrument
+
+        _instrumentation = Instrumentation([SummarySink(), *(sinks or [])])
+        _saved = {n: getattr(self, n) for n in ("gui", "app", "connection", "session", "window")}
+        for _name, _value in _saved.items():
+            if _value is not None:
+                setattr(self, _name, instrument(_value, _instrumentation, _name))
+        self.element_cache.clear()
+        try:
+            yield _instrumentation
+        finally:
+            for _name, _value in _saved.items():
+                setattr(self, _name, _value)
+            self.element_cache.clear()
+            _instrumentation.close()
+            if top:
+                print(_instrumentation.summary.report(top), file=file if file is not None else sys.stdout)
@@ -0,0 +1,77 @@
+import time
+from typing import Any, Callable
+
+
+class WaitStats:
+    """
+    WaitStats - Durations of the waits made by one SAP handle, per wait kind
+    """
+
+    def __init__(self) -> None:
+        self.count: dict[str, int] = {}
+        self.timeouts: dict[str, int] = {}
+        self.total_seconds: dict[str, float] = {}
+        self.max_seconds: dict[str, float] = {}
+        self.last_seconds: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"WaitStats({sum(self.count.values())} waits, {sum(self.total_seconds.values()):.3f}s)"
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{k}: {n} waits, avg {self.average(k) * 1000:.1f}ms, max {self.max_seconds[k] * 1000:.1f}ms"
+            for k, n in self.count.items()
+        )
+
+    def record(self, kind: str, seconds: float, timed_out: bool = False) -> None:
+        """Adds the duration of one wait"""
+        self.count[kind] = self.count.get(kind, 0) + 1
+        self.total_seconds[kind] = self.total_seconds.get(kind, 0.0) + seconds
+        self.max_seconds[kind] = max(self.max_seconds.get(kind, 0.0), seconds)
+        if timed_out:
+            self.timeouts[kind] = self.timeouts.get(kind, 0) + 1
+        self.last_seconds = seconds
+
+    def average(self, kind: str) -> float:
+        """Returns the mean duration of the waits of one kind"""
+        return self.total_seconds[kind] / self.count[kind] if self.count.get(kind) else 0.0
+
+
+def poll(
+    condition: Callable[[], Any],
+    timeout: float = 30.0,
+    initial_delay: float = 0.01,
+    max_delay: float = 0.5,
+    factor: float = 2.0,
+) -> tuple[Any, float]:
+    """
+    Calls condition until it returns a truthy value, sleeping with exponential backoff in between
+
+    The condition is checked once before the first sleep, so a wait that is
+    already satisfied returns without sleeping.
+
+    Args:
+        condition: Callable returning a truthy value once the wait is over
+        timeout: Seconds to wait at most
+        initial_delay: Seconds slept after the first unsuccessful check
+        max_delay: Upper bound of the sleep between two checks
+        factor: Growth factor of the sleep after every unsuccessful check
+
+    Returns:
+        The truthy value returned by condition and the seconds waited
+
+    Raises:
+        TimeoutError: If condition stays falsy for timeout seconds
+    """
+    _start = time.perf_counter()
+    _deadline = _start + timeout
+    _delay = initial_delay
+    while True:
+        _value = condition()
+        _now = time.perf_counter()
+        if _value:
+            return _value, _now - _start
+        if _now >= _deadline:
+            raise TimeoutError(f"Condition not met within {timeout}s")
+        time.sleep(min(_delay, _deadline - _now))
+        _delay = min(_delay * factor, max_delay)
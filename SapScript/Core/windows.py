@@ -0,0 +1,282 @@
+import fnmatch
+import re
+from collections import OrderedDict
+from typing import Any, Optional
+from ..Backend.base import Dispatch
+from ..Gui.vkeys import get_key_id
+
+_WILDCARDS: str = "*?["
+
+
+def _compile(pattern: str) -> Any:
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+
+
+class PopupRule:
+    """
+    PopupRule - Dismisses popups whose title and dialog text match, with a key or a button
+
+    Patterns are case insensitive globs, e.g. 'Save*' or '*locked*'. Patterns
+    and the key are compiled when the rule is created.
+
+    Args:
+        title: Pattern for the window title
+        text: Pattern for the popup dialog text
+        key: Key sent to the popup, e.g. 'ENTER' or 'F12'
+        button: Id of the button to press, relative to the popup, e.g. 'usr/btnSPOP-OPTION1'
+        name: Name reported when the rule fires, defaults to the patterns
+    """
+
+    __slots__ = ("name", "title", "text", "key", "button", "_key_id", "_title", "_text")
+
+    def __init__(
+        self,
+        title: Optional[str] = None,
+        text: Optional[str] = None,
+        key: Optional[str | int] = None,
+        button: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        if title is None and text is None:
+            raise ValueError("A popup rule needs a title or a text pattern")
+        if (key is None) == (button is None):
+            raise ValueError("A popup rule needs either a key or a button")
+        _key_id = get_key_id(key) if key is not None else None
+        if key is not None and _key_id is None:
+            raise ValueError(f"Unknown key {key}")
+        self.name: str = name if name is not None else f"{title or '*'} / {text or '*'}"
+        self.title: str | None = title
+        self.text: str | None = text
+        self.key: str | int | None = key
+        self.button: str | None = button
+        self._key_id: int | None = int(_key_id) if _key_id is not None else None
+        self._title: Any = _compile(title) if title is not None else None
+        self._text: Any = _compile(text) if text is not None else None
+
+    def __repr__(self) -> str:
+        return f"PopupRule({self.name} -> {self.key if self.button is None else self.button})"
+
+    def __str__(self) -> str:
+        return f"PopupRule({self.name} -> {self.key if self.button is None else self.button})"
+
+    @property
+    def exact_title(self) -> bool:
+        """Returns whether the title pattern is a literal title"""
+        return self.title is not None and not any(c in self.title for c in _WILDCARDS)
+
+    def matches(self, title: str, text: Optional[str]) -> bool:
+        """Returns whether the rule applies to a popup, text is only needed for rules with a text pattern"""
+        return (self._title is None or self._title(title) is not None) and (
+            self._text is None or self._text(text or "") is not None
+        )
+
+    def dispatch(self, window: Dispatch) -> None:
+        """Dismisses the popup"""
+        if self._key_id is not None:
+            window.sendVKey(self._key_id)
+        else:
+            window.findById(self.button).Press()
+
+
+class PopupMatch:
+    """
+    PopupMatch - A popup seen by the WindowWatcher and the rule that dismissed it, if any
+
+    closed is False when the rule was applied but the popup was still open afterwards.
+    """
+
+    __slots__ = ("window", "title", "rule", "closed")
+
+    def __init__(self, window: str, title: str, rule: Optional[PopupRule], closed: bool = True) -> None:
+        self.window: str = window
+        self.title: str = title
+        self.rule: PopupRule | None = rule
+        self.closed: bool = closed
+
+    def __repr__(self) -> str:
+        return f"PopupMatch({self.window}, {self.title!r}, {self.rule.name if self.rule else None})"
+
+    def __str__(self) -> str:
+        if self.rule is None:
+            return f"{self.window} '{self.title}': no rule"
+        return f"{self.window} '{self.title}': {'dismissed' if self.closed else 'not closed'} by {self.rule.name}"
+
+    @property
+    def dismissed(self) -> bool:
+        """Returns whether a rule dismissed the popup"""
+        return self.rule is not None and self.closed
+
+
+class WindowWatcher:
+    """
+    WindowWatcher - Detects popups of a session and dismisses them with registered rules
+
+    Rules with a literal title are indexed by title, so finding the rules of a
+    popup is one dictionary lookup plus the rules with title patterns. The
+    dialog text is read only when a candidate rule has a text pattern. The
+    watcher also keeps a bounded registry of the windows its SAP handle used.
+
+    Example:
+        ```python
+        sap.windows.add_rule(title="Save Document", button="usr/btnSPOP-OPTION1")
+        sap.windows.add_rule(text="*does not exist*", key="ENTER")
+        sap.send_key("F11")  # matching popups are dismissed after the key
+        ```
+    """
+
+    def __init__(self, rules: Optional[list[PopupRule]] = None, maxsize: int = 8, max_rounds: int = 5) -> None:
+        self.maxsize: int = maxsize
+        self.max_rounds: int = max_rounds
+        self.rules: list[PopupRule] = []
+        self.registry: OrderedDict[str, Dispatch] = OrderedDict()
+        self.checks: int = 0
+        self.popups: int = 0
+        self.dismissed: int = 0
+        self.unmatched: int = 0
+        self.failed: int = 0
+        self._by_title: dict[str, list[PopupRule]] = {}
+        self._patterns: list[PopupRule] = []
+        for _rule in rules or []:
+            self.add(_rule)
+
+    def __repr__(self) -> str:
+        return f"WindowWatcher({len(self.rules)} rules, {self.dismissed}/{self.popups} popups dismissed)"
+
+    def __str__(self) -> str:
+        return f"WindowWatcher({len(self.rules)} rules, {self.dismissed}/{self.popups} popups dismissed)"
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def add(self, rule: PopupRule) -> PopupRule:
+        """Registers a rule, rules are tried in registration order with literal titles first"""
+        self.rules.append(rule)
+        if rule.exact_title:
+            self._by_title.setdefault(rule.title.casefold(), []).append(rule)
+        else:
+            self._patterns.append(rule)
+        return rule
+
+    def add_rule(
+        self,
+        title: Optional[str] = None,
+        text: Optional[str] = None,
+        key: Optional[str | int] = None,
+        button: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> PopupRule:
+        """Creates and registers a PopupRule, see PopupRule for the arguments"""
+        return self.add(PopupRule(title=title, text=text, key=key, button=button, name=name))
+
+    def clear(self) -> None:
+        """Removes every rule"""
+        self.rules.clear()
+        self._by_title.clear()
+        self._patterns.clear()
+
+    def remember(self, id: str, window: Dispatch) -> None:
+        """Keeps a window in the bounded registry, dropping the least recently used one when full"""
+        self.registry[id] = window
+        self.registry.move_to_end(id)
+        while len(self.registry) > self.maxsize:
+            self.registry.popitem(last=False)
+
+    def match(self, title: str, text: Any = None) -> PopupRule | None:
+        """
+        Returns the first rule matching a popup
+
+        Args:
+            title: Window title
+            text: Dialog text, or a callable returning it, called only if a candidate rule needs it
+
+        Returns:
+            The matching rule, None if no rule applies
+        """
+        _text = text
+        for _rule in self._by_title.get(title.casefold(), []) + self._patterns:
+            if _rule._text is not None and callable(_text):
+                _text = _text()
+            if _rule.matches(title, _text):
+                return _rule
+        return None
+
+    def open_popups(self, session: Dispatch) -> list[tuple[str, Dispatch]]:
+        """Returns (window id, window) of every modal window of a session, topmost first"""
+        _windows = session.Children
+        if _windows.Count <= 1:
+            return []
+        _popups = []
+        for _window in _windows:
+            _id = _window.Id.rsplit("/", 1)[-1]
+            if _id != "wnd[0]":
+                _popups.append((_id, _window))
+        return _popups[::-1]
+
+    def check(self, session: Dispatch) -> list[PopupMatch]:
+        """
+        Dismisses the open popups of a session that match a rule
+
+        Runs up to max_rounds rounds, since dismissing a popup can open the
+        next one. Stops at the first popup no rule applies to, and when the
+        popup a rule was applied to is still the topmost window afterwards,
+        told apart from a chained popup at the same id by its window handle.
+
+        Args:
+            session: The session to check
+
+        Returns:
+            One PopupMatch per popup seen, unmatched popups have no rule and popups
+            the rule did not close are not closed
+        """
+        self.checks += 1
+        _matches: list[PopupMatch] = []
+        _dispatched: tuple[str, Any] | None = None
+        for _ in range(self.max_rounds):
+            _popups = self.open_popups(session)
+            if not _popups:
+                break
+            _id, _window = _popups[0]
+            _instance = (_id, _window_handle(_window))
+            if _instance == _dispatched:
+                # The window the rule was applied to is still open, chained popups reusing the id have a new handle
+                _matches[-1].closed = False
+                self.dismissed -= 1
+                self.failed += 1
+                break
+            _title = _window.Text
+            self.popups += 1
+            _rule = self.match(_title, lambda w=_window: _read_dialog_text(w))
+            _matches.append(PopupMatch(_id, _title, _rule))
+            if _rule is None:
+                self.unmatched += 1
+                break
+            _rule.dispatch(_window)
+            _dispatched = _instance
+            self.dismissed += 1
+        return _matches
+
+    def stats(self) -> dict[str, int]:
+        """Returns the watcher counters as a dictionary"""
+        return {
+            "rules": len(self.rules),
+            "checks": self.checks,
+            "popups": self.popups,
+            "dismissed": self.dismissed,
+            "unmatched": self.unmatched,
+            "failed": self.failed,
+            "windows": len(self.registry),
+        }
+
+
+def _read_dialog_text(window: Dispatch) -> str:
+    try:
+        return window.PopupDialogText
+    except Exception as _:
+        return ""
+
+
+def _window_handle(window: Dispatch) -> Any:
+    try:
+        return window.Handle
+    except Exception as _:
+        return window
@@ -0,0 +1,2 @@
+from SapScript.Export.export import ExportStats, export_table  # noqa: F401
+from SapScript.Export.writers import ArrowWriter, BatchWriter, CsvWriter, JsonLinesWriter, ParquetWriter  # noqa: F401
@@ -0,0 +1,92 @@
+import time
+from pathlib import Path
+from typing import Optional
+from ..Gui.elements import Table
+from .writers import SUFFIXES, WRITERS
+
+
+class ExportStats:
+    """
+    ExportStats - Summary of a table export
+    """
+
+    def __init__(self, path: Path, fmt: str, rows: int, batches: int, seconds: float) -> None:
+        self.path: Path = path
+        self.format: str = fmt
+        self.rows: int = rows
+        self.batches: int = batches
+        self.seconds: float = seconds
+
+    def __repr__(self) -> str:
+        return f"ExportStats({self.path}, {self.rows} rows, {self.rows_per_second:.0f} rows/s)"
+
+    def __str__(self) -> str:
+        return f"Exported {self.rows} rows in {self.batches} batches to {self.path} ({self.rows_per_second:.0f} rows/s)"
+
+    @property
+    def rows_per_second(self) -> float:
+        """Returns the export throughput"""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def export_table(
+    table: Table,
+    path: str | Path,
+    fmt: Optional[str] = None,
+    columns: Optional[list[str | int]] = None,
+    batch_rows: int = 10000,
+    use_titles: bool = False,
+) -> ExportStats:
+    """
+    Streams the rows of a table into a CSV, JSON Lines, Parquet or Arrow file
+
+    Rows are read with Table.iter_rows and written in fixed-size batches, so at
+    most batch_rows rows are held in memory regardless of the table size.
+
+    Args:
+        table: The Table to export
+        path: Output file path
+        fmt: One of 'csv', 'jsonl', 'parquet' or 'arrow', defaults to the one matching the file suffix
+        columns: Column ids or zero-based column indices to export, defaults to all columns
+        batch_rows: Number of rows per written batch
+        use_titles: Use the displayed column titles instead of column ids as field names
+
+    Returns:
+        ExportStats with row count, batch count, elapsed time and rows per second
+
+    Raises:
+        ValueError: If the format is unknown or batch_rows is not positive
+
+    Example:
+        ```python
+        stats = export_table(table, "idocs.parquet", batch_rows=50000)
+        print(stats)
+        ```
+    """
+    path = Path(path)
+    fmt = fmt if fmt is not None else SUFFIXES.get(path.suffix.lower(), "")
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of: {', '.join(WRITERS)}")
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be a positive integer")
+    start = time.perf_counter()
+    table_columns = table.refresh_columns()
+    if columns is None:
+        indices = list(range(len(table_columns)))
+    else:
+        indices = [c if isinstance(c, int) else table_columns.ids.index(c) for c in columns]
+    names = table_columns.titles if use_titles else table_columns.ids
+    batches = 0
+    with WRITERS[fmt](path, [names[i] for i in indices]) as writer:
+        batch: list[tuple[str, ...]] = []
+        for row in table.iter_rows(columns=[table_columns.ids[i] for i in indices]):
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_batch(batch)
+                batches += 1
+                batch = []
+        if batch:
+            writer.write_batch(batch)
+            batches += 1
+        rows = writer.rows_written
+    return ExportStats(path=path, fmt=fmt, rows=rows, batches=batches, seconds=time.perf_counter() - start)
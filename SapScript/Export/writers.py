@@ -0,0 +1,155 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Self
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Parquet/Arrow export, install it with 'pip install pyarrow'") from e
+    return pyarrow
+
+
+class BatchWriter(ABC):
+    """
+    BatchWriter - Base class for writers that receive table rows in fixed-size batches
+    """
+
+    def __init__(self, path: str | Path, columns: list[str]) -> None:
+        self.path: Path = Path(path)
+        self.columns: list[str] = columns
+        self.rows_written: int = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self.path})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @abstractmethod
+    def write_batch(self, rows: list[tuple[str, ...]]) -> None:
+        """
+        Writes a batch of rows
+
+        Args:
+            rows: List of row tuples in column order
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flushes and closes the output file"""
+
+
+class CsvWriter(BatchWriter):
+    """
+    CsvWriter - Writes table rows to a CSV file with a header line
+    """
+
+    def __init__(self, path: str | Path, columns: list[str], delimiter: str = ",") -> None:
+        super().__init__(path, columns)
+        self._file = self.path.open(mode="w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self._writer.writerow(columns)
+
+    def write_batch(self, rows: list[tuple[str, ...]]) -> None:
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonLinesWriter(BatchWriter):
+    """
+    JsonLinesWriter - Writes table rows to a JSON Lines file, one object per row
+    """
+
+    def __init__(self, path: str | Path, columns: list[str]) -> None:
+        super().__init__(path, columns)
+        self._file = self.path.open(mode="w", encoding="utf-8")
+
+    def write_batch(self, rows: list[tuple[str, ...]]) -> None:
+        columns = self.columns
+        self._file.write("".join(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows))
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(BatchWriter):
+    """
+    ParquetWriter - Writes table rows to a Parquet file, one row group per batch
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str | Path, columns: list[str]) -> None:
+        super().__init__(path, columns)
+        pyarrow = _require_pyarrow()
+        from pyarrow import parquet  # type: ignore
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(c, pyarrow.string()) for c in columns])
+        self._writer = parquet.ParquetWriter(str(self.path), self._schema)
+
+    def write_batch(self, rows: list[tuple[str, ...]]) -> None:
+        arrays = [self._pyarrow.array(column, type=self._pyarrow.string()) for column in zip(*rows)]
+        self._writer.write_batch(self._pyarrow.record_batch(arrays, schema=self._schema))
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ArrowWriter(BatchWriter):
+    """
+    ArrowWriter - Writes table rows to an Arrow IPC file, one record batch per batch
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str | Path, columns: list[str]) -> None:
+        super().__init__(path, columns)
+        pyarrow = _require_pyarrow()
+        from pyarrow import ipc  # type: ignore
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(c, pyarrow.string()) for c in columns])
+        self._sink = pyarrow.OSFile(str(self.path), "wb")
+        self._writer = ipc.new_file(self._sink, self._schema)
+
+    def write_batch(self, rows: list[tuple[str, ...]]) -> None:
+        arrays = [self._pyarrow.array(column, type=self._pyarrow.string()) for column in zip(*rows)]
+        self._writer.write_batch(self._pyarrow.record_batch(arrays, schema=self._schema))
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+
+WRITERS: dict[str, type[BatchWriter]] = {
+    "csv": CsvWriter,
+    "jsonl": JsonLinesWriter,
+    "parquet": ParquetWriter,
+    "arrow": ArrowWriter,
+}
+
+SUFFIXES: dict[str, str] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
@@ -1,11 +1,107 @@
 from enum import Enum, auto
-from typing import Any, Generator
-import win32com.client  # type: ignore
+from typing import TYPE_CHECKING, Any, Generator, Optional
+from ..Backend.base import Dispatch
+
+if TYPE_CHECKING:
+    from .snapshot import ElementSnapshot
+
+
+#: GuiElement property -> scripting property it reads
+PROPERTY_MEMBERS: dict[str, str] = {
+    "id": "Id",
+    "type": "Type",
+    "name": "Name",
+    "text": "Text",
+    "tooltip": "Tooltip",
+    "changeable": "Changeable",
+    "container_type": "ContainerType",
+    "screen_left": "ScreenLeft",
+    "screen_top": "ScreenTop",
+    "left": "Left",
+    "top": "Top",
+    "width": "ScreenWidth",
+    "height": "ScreenHeight",
+    "handle": "Handle",
+    "icon_name": "IconName",
+    "key": "Key",
+}
+
+#: Properties read by GuiElement.fetch() and GuiElement.to_dict() when none are named
+DEFAULT_PROPERTIES: tuple[str, ...] = (
+    "id",
+    "type",
+    "name",
+    "text",
+    "tooltip",
+    "changeable",
+    "screen_left",
+    "screen_top",
+    "width",
+    "height",
+)
+
+_UNSET: Any = object()
+
+
+class ElementProperties:
+    """
+    ElementProperties - Property values of one element read by GuiElement.fetch()
+
+    Only the fetched properties are set, the others stay unset until fetched.
+    """
+
+    __slots__ = tuple(PROPERTY_MEMBERS)
+
+    def __repr__(self) -> str:
+        return f"ElementProperties({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+    def __str__(self) -> str:
+        return f"ElementProperties({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and getattr(self, name, _UNSET) is not _UNSET
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the fetched properties as a dictionary"""
+        return {n: v for n in self.__slots__ if (v := getattr(self, n, _UNSET)) is not _UNSET}
+
+
+class FetchStats:
+    """
+    FetchStats - Counters of property reads served by fetch() records versus reads over COM
+    """
+
+    def __init__(self) -> None:
+        self.fetches: int = 0
+        self.reads: int = 0
+        self.hits: int = 0
+        self.invalidations: int = 0
+
+    def __repr__(self) -> str:
+        return f"FetchStats({self.fetches} fetches, {self.reads} reads, {self.hits} hits)"
+
+    def __str__(self) -> str:
+        return f"{self.fetches} fetches read {self.reads} properties, {self.hits} reads served from records"
+
+    def as_dict(self) -> dict[str, int]:
+        """Returns the counters as a dictionary"""
+        return {"fetches": self.fetches, "reads": self.reads, "hits": self.hits, "invalidations": self.invalidations}
+
+    def reset(self) -> None:
+        """Sets every counter back to zero"""
+        self.fetches = self.reads = self.hits = self.invalidations = 0
+
+
+#: Process wide property fetch counters
+fetch_stats: FetchStats = FetchStats()
 
 
 class GuiElement:
-    def __init__(self, element: win32com.client.CDispatch) -> None:
-        self._element: win32com.client.CDispatch | None = element
+    def __init__(self, element: Dispatch) -> None:
+        self._element: Dispatch | None = element
+        self._type_name: str | None = None
+        self._properties: ElementProperties | None = None
+        self._specialized: bool = False
 
     def __repr__(self) -> str:
         return f"GuiElement({self._element})"
@@ -15,96 +111,236 @@ class GuiElement:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GuiElement):
+            if self._element is other._element:
+                return True
+            if self._properties is not None and other._properties is not None:
+                _id = getattr(self._properties, "id", _UNSET)
+                _other_id = getattr(other._properties, "id", _UNSET)
+                if _id is not _UNSET and _other_id is not _UNSET:
+                    return _id == _other_id
             return self._element == other._element
         return False
 
     @property
-    def element(self) -> win32com.client.CDispatch:
+    def element(self) -> Dispatch:
         return self._element
 
     @element.setter
-    def element(self, value: win32com.client.CDispatch) -> None:
+    def element(self, value: Dispatch) -> None:
         self._element = value
+        self._type_name = None
+        self._properties = None
+        self._specialized = False
+
+    def _get(self, name: str) -> Any:
+        _properties = self._properties
+        if _properties is not None:
+            _value = getattr(_properties, name, _UNSET)
+            if _value is not _UNSET:
+                fetch_stats.hits += 1
+                return _value
+        return getattr(self._element, PROPERTY_MEMBERS[name])
+
+    def fetch(self, *props: str) -> ElementProperties:
+        """
+        Reads properties once into the element's record, later reads of them are served from it
+
+        Properties already in the record are not read again until refresh() is
+        called, the element is re-bound, an action is run on it through Actions
+        or the ElementCache that returned it sees an action that may change the
+        screen. Elements from the uncached SAP.get_element are not tracked by any
+        cache, after the screen changed call refresh() or get the element again.
+        Properties the element does not support are recorded as None.
+
+        Args:
+            props: Property names, e.g. 'id', 'text' or 'changeable', defaults to DEFAULT_PROPERTIES
+
+        Returns:
+            The element's ElementProperties record
+
+        Raises:
+            ValueError: If a property name is unknown
+
+        Example:
+            ```python
+            element.fetch("id", "text", "changeable")
+            if element.changeable:
+                print(element.id, element.text)
+            ```
+        """
+        _names = props or DEFAULT_PROPERTIES
+        _properties = self._properties
+        if _properties is None:
+            _properties = self._properties = ElementProperties()
+        fetch_stats.fetches += 1
+        for _name in _names:
+            _member = PROPERTY_MEMBERS.get(_name)
+            if _member is None:
+                raise ValueError(f"Unknown property {_name}")
+            if getattr(_properties, _name, _UNSET) is not _UNSET:
+                fetch_stats.hits += 1
+                continue
+            fetch_stats.reads += 1
+            try:
+                _value = getattr(self._element, _member)
+            except Exception as _:
+                _value = None
+            setattr(_properties, _name, _value)
+        return _properties
+
+    def to_dict(self, *props: str) -> dict[str, Any]:
+        """
+        Returns properties of the element as a dictionary, fetching the missing ones
+
+        Args:
+            props: Property names, defaults to DEFAULT_PROPERTIES
+
+        Returns:
+            Dictionary of property name to value in the requested order
+        """
+        _names = props or DEFAULT_PROPERTIES
+        _properties = self.fetch(*_names)
+        return {n: getattr(_properties, n) for n in _names}
+
+    def specialize(self) -> "GuiElement":
+        """
+        Switches this wrapper to the class registered for its element type
+
+        Type, and SubType for shells, are read once. The wrapper only moves down
+        its own class hierarchy, a manually created Table stays a Table unless
+        the element is a grid view. Wrappers are never specialized implicitly,
+        call this or use wrap_element().
+
+        Returns:
+            This element, now an instance of the resolved class
+
+        Example:
+            ```python
+            grid = sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell").value.specialize()
+            data = grid.read_all()  # grid is now a GridView
+            ```
+        """
+        if not self._specialized:
+            _type = self.type_name
+            _sub_type = self._element.SubType if _type in _shell_types else None
+            _cls = element_class(_type, _sub_type)
+            if _cls is not type(self) and issubclass(_cls, type(self)):
+                self.__class__ = _cls
+            self._specialized = True
+        return self
+
+    def refresh(self) -> None:
+        """Drops the fetched property record, the next reads go to the element again"""
+        if self._properties is not None:
+            self._properties = None
+            fetch_stats.invalidations += 1
 
     @property
     def id(self) -> str:
-        return self._element.Id
+        return self._get("id")
 
     @property
     def type(self) -> str:
-        return self._element.Type
+        return self._get("type")
+
+    @property
+    def type_name(self) -> str:
+        """Returns the element type, read once and kept for the lifetime of this GuiElement"""
+        if self._type_name is None:
+            self._type_name = self._get("type")
+        return self._type_name
 
     @property
     def changeable(self) -> bool:
-        return self._element.Changeable
+        return self._get("changeable")
 
     @property
     def container_type(self) -> bool:
-        return self._element.ContainerType
+        return self._get("container_type")
 
     @property
     def name(self) -> str:
-        return self._element.Name
+        return self._get("name")
 
     @property
     def text(self) -> str:
-        return self._element.Text
+        return self._get("text")
 
     @text.setter
     def text(self, value: str) -> None:
         if self.changeable:
             self._element.Text = value
+            if self._properties is not None and "text" in self._properties:
+                self._properties.text = value
         else:
             raise ValueError("Element is not changeable")
 
     @property
     def tooltip(self) -> str:
-        return self._element.Tooltip
+        return self._get("tooltip")
 
     @property
     def screen_left(self) -> int:
-        return self._element.ScreenLeft
+        return self._get("screen_left")
 
     @property
     def screen_top(self) -> int:
-        return self._element.ScreenTop
+        return self._get("screen_top")
 
     @property
     def left(self) -> int:
-        return self._element.Left
+        return self._get("left")
 
     @property
     def top(self) -> int:
-        return self._element.Top
+        return self._get("top")
 
     @property
     def width(self) -> int:
-        return self._element.ScreenWidth
+        return self._get("width")
 
     @property
     def height(self) -> int:
-        return self._element.ScreenHeight
+        return self._get("height")
 
     @property
     def handle(self) -> int:
-        return self._element.Handle
+        return self._get("handle")
 
     @property
     def icon_name(self) -> str:
-        return self._element.IconName
+        return self._get("icon_name")
 
     @property
     def key(self) -> str:
-        return self._element.Key
+        return self._get("key")
 
     @property
-    def parent(self) -> win32com.client.CDispatch:
+    def parent(self) -> Dispatch:
         return self._element.Parent
 
     @property
-    def children(self) -> list[win32com.client.CDispatch]:
+    def children(self) -> list[Dispatch]:
         return self._element.Children
 
+    def snapshot(self, max_depth: Optional[int] = None, max_elements: Optional[int] = 10000) -> "ElementSnapshot":
+        """
+        Captures this element and its descendants into an indexed in-memory ElementSnapshot
+
+        Args:
+            max_depth: Maximum depth below this element to walk, defaults to unlimited
+            max_elements: Maximum number of elements to capture, None for unlimited
+
+        Returns:
+            ElementSnapshot of the subtree
+
+        Raises:
+            ValueError: If max_elements is less than 1
+        """
+        from .snapshot import take_snapshot
+
+        return take_snapshot(self._element, max_depth=max_depth, max_elements=max_elements)
+
 
 class TextElements(Enum):
     """
@@ -131,8 +367,10 @@ class Table(GuiElement):
     for interacting with table data, rows, and columns.
     """
 
-    def __init__(self, element: GuiElement) -> None:
-        super().__init__(element.element)
+    _columns: "TableColumns | None" = None
+
+    def __init__(self, element: GuiElement | Dispatch) -> None:
+        super().__init__(element.element if isinstance(element, GuiElement) else element)
 
     @property
     def rows_count(self) -> int:
@@ -154,6 +392,28 @@ class Table(GuiElement):
         """Returns the current column order"""
         return [x for x in self._element.ColumnOrder]
 
+    @property
+    def columns(self) -> "TableColumns":
+        """Returns the cached column metadata, built on first access"""
+        if self._columns is None:
+            self._columns = TableColumns(self._element)
+        return self._columns
+
+    def refresh_columns(self) -> "TableColumns":
+        """
+        Validates the column metadata cache against the current ColumnOrder
+
+        Costs a single ColumnOrder query, the cache is only rebuilt when the
+        column order has changed since it was built.
+
+        Returns:
+            The valid TableColumns cache
+        """
+        column_order = tuple(self._element.ColumnOrder)
+        if self._columns is None or self._columns.ids != column_order:
+            self._columns = TableColumns(self._element, column_order)
+        return self._columns
+
     @property
     def selected_rows(self) -> list[int]:
         """Returns the currently selected rows as a list of row indices"""
@@ -231,7 +491,7 @@ class Table(GuiElement):
         Returns:
             A list of column titles as strings
         """
-        return [self._element.GetDisplayedColumnTitle(i) for i in self._element.ColumnOrder]
+        return list(self.refresh_columns().titles)
 
     def scroll_to_row(self, row: int) -> None:
         """
@@ -240,10 +500,9 @@ class Table(GuiElement):
         Args:
             row: Zero-based row index to scroll to
         """
-        if hasattr(self._element, "VerticalScrollbar"):
+        if self.type_name == "GuiTableControl":
             self._element.VerticalScrollbar.Position = row
         else:
-            # Alternative method if no scrollbar is available
             self._element.FirstVisibleRow = row
 
     def double_click_cell(self, row: int, col: int) -> None:
@@ -295,6 +554,104 @@ class Table(GuiElement):
         """
         return [self.get_cell_value(row, col) for row in range(self.rows_count)]
 
+    def read_all(
+        self, columns: Optional[list[str | int]] = None, chunk_rows: Optional[int] = None
+    ) -> "TableData":
+        """
+        Reads the table in bulk, one column range at a time
+
+        Column ids, row count and visible row count are queried once up front
+        instead of once per row, and the grid is scrolled once per chunk so
+        lazily loaded rows are available before their cells are read.
+
+        Args:
+            columns: Column ids or zero-based column indices to read, defaults to all columns
+            chunk_rows: Number of rows read per batch, defaults to the visible row count
+
+        Returns:
+            TableData with one list of cell values per column and the number of COM calls made
+
+        Example:
+            ```python
+            data = table.read_all(columns=["DOCNUM", "STATUS"])
+            print(data["STATUS"][:10], data.com_calls)
+            ```
+        """
+        com_calls = 0
+        column_order = self.refresh_columns().ids
+        com_calls += 1
+        if columns is None:
+            column_ids = column_order
+        else:
+            column_ids = [column_order[c] if isinstance(c, int) else c for c in columns]
+        row_count = self._element.RowCount
+        com_calls += 1
+        if chunk_rows is None:
+            chunk_rows = self._element.VisibleRowCount
+            com_calls += 1
+        if not chunk_rows or chunk_rows < 1:
+            chunk_rows = max(row_count, 1)
+        data: dict[str, list[str]] = {c: [""] * row_count for c in column_ids}
+        get_cell_value = self._element.GetCellValue
+        for start in range(0, row_count, chunk_rows):
+            stop = min(start + chunk_rows, row_count)
+            if row_count > chunk_rows:
+                self._element.FirstVisibleRow = start
+                com_calls += 1
+            for col in column_ids:
+                values = data[col]
+                for row in range(start, stop):
+                    values[row] = get_cell_value(row, col)
+                com_calls += stop - start
+        return TableData(columns=data, row_count=row_count, com_calls=com_calls)
+
+    def iter_rows(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        step: Optional[int] = None,
+        columns: Optional[list[str | int]] = None,
+    ) -> Generator[tuple[str, ...], Any, None]:
+        """
+        Streams row values window by window, scrolling the grid so lazily loaded rows are filled
+
+        Rows are selected with slice semantics, so several extraction jobs can
+        split one grid, e.g. ``iter_rows(0, None, 2)`` and ``iter_rows(1, None, 2)``.
+        The grid is scrolled once per visible_row_count sized window and only one
+        row is held in memory at a time.
+
+        Args:
+            start: First row index, defaults to 0
+            stop: Row index to stop before, defaults to the row count
+            step: Row step, defaults to 1
+            columns: Column ids or zero-based column indices to read, defaults to all columns
+
+        Yields:
+            A tuple of cell values per row in the requested column order
+
+        Example:
+            ```python
+            for docnum, status in table.iter_rows(columns=["DOCNUM", "STATUS"]):
+                print(docnum, status)
+            ```
+        """
+        column_order = self.refresh_columns().ids
+        if columns is None:
+            column_ids = column_order
+        else:
+            column_ids = [column_order[c] if isinstance(c, int) else c for c in columns]
+        row_count = self._element.RowCount
+        window = self._element.VisibleRowCount or row_count
+        get_cell_value = self._element.GetCellValue
+        rows = range(*slice(start, stop, step).indices(row_count))
+        window_start = window_stop = 0
+        for row in rows:
+            if not window_start <= row < window_stop:
+                window_start = row if rows.step > 0 else max(row - window + 1, 0)
+                self._element.FirstVisibleRow = window_start
+                window_stop = window_start + window
+            yield tuple(get_cell_value(row, col) for col in column_ids)
+
     def find_row_by_value(self, col: int, value: str) -> int:
         """
         Finds the first row that has the specified value in the specified column
@@ -324,8 +681,9 @@ class Table(GuiElement):
                 print(row.ColumnName)  # Access column data using dot notation
             ```
         """
+        columns = self.refresh_columns()
         for row_index in range(self.rows_count):
-            yield TableRow(self, row_index)
+            yield TableRow(self, row_index, columns)
 
     def get_header_widths(self) -> list[dict[str, int]]:
         """
@@ -354,13 +712,225 @@ class Table(GuiElement):
             table.pprint()
             ```
         """
-        headers = self.get_column_titles()
-        print(" | ".join(headers))
-        print("-" * self.get_table_width())
-        row_data: list[dict] = [self.get_row_data(i) for i in range(self.rows_count)]
-        for row in row_data:
-            print(" | ".join([str(v) for _, v in row.items()]))
-        print("-" * self.get_table_width())
+        columns = self.refresh_columns()
+        table_width = sum(columns.widths) + len(columns) - 1
+        print(" | ".join(columns.titles))
+        print("-" * table_width)
+        for row in self.iter_rows():
+            print(" | ".join([str(v) for v in row]))
+        print("-" * table_width)
+
+
+class GridView(Table):
+    """
+    GridView - Class for SAP GUI ALV Grid View Elements (GuiShell with SubType GridView)
+    """
+
+    def scroll_to_row(self, row: int) -> None:
+        """
+        Scrolls the grid to make the specified row visible
+
+        Args:
+            row: Zero-based row index to scroll to
+        """
+        self._element.FirstVisibleRow = row
+
+    @property
+    def current_cell(self) -> tuple[int, str]:
+        """Returns the current cell as (row, column id)"""
+        return (self._element.CurrentCellRow, self._element.CurrentCellColumn)
+
+    def set_current_cell(self, row: int, col: str) -> None:
+        """
+        Makes a cell the current cell
+
+        Args:
+            row: Zero-based row index
+            col: Column id
+        """
+        self._element.SetCurrentCell(row, col)
+
+
+class TableControl(GuiElement):
+    """
+    TableControl - Class for SAP GUI Table Control Elements (GuiTableControl)
+
+    Table controls only hold the rows currently on screen, cells are read
+    through GetCell with the row relative to the first visible row.
+    """
+
+    @property
+    def row_count(self) -> int:
+        """Returns the number of rows of the table"""
+        return self._element.RowCount
+
+    @property
+    def visible_row_count(self) -> int:
+        """Returns the number of rows shown on screen"""
+        return self._element.VisibleRowCount
+
+    def get_cell(self, row: int, col: int) -> Dispatch:
+        """
+        Returns the element of a visible cell
+
+        Args:
+            row: Zero-based row index relative to the first visible row
+            col: Zero-based column index
+        """
+        return self._element.GetCell(row, col)
+
+    def get_cell_value(self, row: int, col: int) -> str:
+        """
+        Returns the text of a visible cell
+
+        Args:
+            row: Zero-based row index relative to the first visible row
+            col: Zero-based column index
+        """
+        return self._element.GetCell(row, col).Text
+
+    def scroll_to_row(self, row: int) -> None:
+        """
+        Scrolls the table to make the specified row the first visible row
+
+        Args:
+            row: Zero-based row index to scroll to
+        """
+        self._element.VerticalScrollbar.Position = row
+
+
+class TextField(GuiElement):
+    """
+    TextField - Class for SAP GUI Text, CText and Password Field Elements
+    """
+
+    @property
+    def max_length(self) -> int:
+        """Returns the maximum number of characters the field accepts"""
+        return self._element.MaxLength
+
+    @property
+    def numerical(self) -> bool:
+        """Returns whether the field only accepts numbers"""
+        return self._element.Numerical
+
+    @property
+    def required(self) -> bool:
+        """Returns whether the field is a required entry field"""
+        return self._element.Required
+
+    @property
+    def caret_position(self) -> int:
+        """Returns the position of the cursor in the field"""
+        return self._element.CaretPosition
+
+    @caret_position.setter
+    def caret_position(self, value: int) -> None:
+        self._element.CaretPosition = value
+
+
+class Statusbar(GuiElement):
+    """
+    Statusbar - Class for the SAP GUI Status Bar of a window
+    """
+
+    @property
+    def message_type(self) -> str:
+        """Returns the message type: S, W, E, A, I or an empty string"""
+        return self._element.MessageType
+
+    @property
+    def message_id(self) -> str:
+        """Returns the message class of the message"""
+        return self._element.MessageId
+
+    @property
+    def message_number(self) -> str:
+        """Returns the message number within its message class"""
+        return self._element.MessageNumber
+
+    @property
+    def message_parameter(self) -> str:
+        """Returns the first parameter of the message"""
+        return self._element.MessageParameter
+
+
+class Toolbar(GuiElement):
+    """
+    Toolbar - Class for SAP GUI Toolbar Controls (GuiShell with SubType ToolbarControl)
+    """
+
+    @property
+    def button_count(self) -> int:
+        """Returns the number of buttons in the toolbar"""
+        return self._element.ButtonCount
+
+    def press_button(self, id: str) -> None:
+        """
+        Presses a toolbar button
+
+        Args:
+            id: Function code of the button, e.g. '&MB_FILTER'
+        """
+        self._element.pressButton(id)
+
+    def press_context_button(self, id: str) -> None:
+        """
+        Opens the menu of a toolbar button
+
+        Args:
+            id: Function code of the button
+        """
+        self._element.pressContextButton(id)
+
+    def select_context_menu_item(self, id: str) -> None:
+        """
+        Selects an entry of the open button menu
+
+        Args:
+            id: Function code of the menu entry
+        """
+        self._element.selectContextMenuItem(id)
+
+
+class Tree(GuiElement):
+    """
+    Tree - Class for SAP GUI Tree Controls (GuiShell with SubType Tree)
+    """
+
+    @property
+    def selected_node(self) -> str:
+        """Returns the key of the selected node"""
+        return self._element.SelectedNode
+
+    def node_keys(self) -> list[str]:
+        """Returns the keys of every node of the tree"""
+        return list(self._element.GetAllNodeKeys())
+
+    def node_text(self, key: str) -> str:
+        """
+        Returns the text of a node
+
+        Args:
+            key: Node key
+        """
+        return self._element.GetNodeTextByKey(key)
+
+    def expand_node(self, key: str) -> None:
+        """Expands a node"""
+        self._element.ExpandNode(key)
+
+    def collapse_node(self, key: str) -> None:
+        """Collapses a node"""
+        self._element.CollapseNode(key)
+
+    def select_node(self, key: str) -> None:
+        """Selects a node"""
+        self._element.SelectNode(key)
+
+    def double_click_node(self, key: str) -> None:
+        """Double-clicks a node"""
+        self._element.DoubleClickNode(key)
 
 
 class TableRow:
@@ -368,12 +938,15 @@ class TableRow:
     TableRow - Represents a row in a Table with dot notation access to columns
 
     This class provides dot notation access to column values for a specific row.
+    It is a lightweight view that shares the column metadata cache of its Table.
     """
 
-    def __init__(self, table: Table, row_index: int) -> None:
+    __slots__ = ("_table", "_row_index", "_columns")
+
+    def __init__(self, table: Table, row_index: int, columns: Optional["TableColumns"] = None) -> None:
         self._table = table
         self._row_index = row_index
-        self._column_titles = table.get_column_titles()
+        self._columns = columns if columns is not None else table.columns
 
     def __getattr__(self, name: str) -> str:
         """
@@ -388,16 +961,187 @@ class TableRow:
         Raises:
             AttributeError: If the column name doesn't exist
         """
-        try:
-            col_index = self._column_titles.index(name)
-            return self._table.get_cell_value(self._row_index, col_index)
-        except ValueError:
+        col_index = self._columns.index.get(name)
+        if col_index is None:
             raise AttributeError(
-                f"'TableRow' object has no attribute '{name}'. Available columns: {', '.join(self._column_titles)}"
+                f"'TableRow' object has no attribute '{name}'. Available columns: {', '.join(self._columns.titles)}"
             )
+        return self._table.get_cell_value(self._row_index, self._columns.ids[col_index])
 
     def __repr__(self) -> str:
         return f"TableRow({self._row_index})"
 
     def __str__(self) -> str:
         return f"Row {self._row_index}: {self._table.get_row_data(self._row_index)}"
+
+
+class TableColumns:
+    """
+    TableColumns - Column metadata cache shared by a Table and its rows
+
+    Column ids are read once when the cache is built. Titles, widths and data
+    types are fetched on first access and then served from memory.
+    """
+
+    __slots__ = ("_element", "ids", "_titles", "_index", "_widths", "_types")
+
+    def __init__(self, element: Dispatch, ids: Optional[tuple[str, ...]] = None) -> None:
+        self._element = element
+        self.ids: tuple[str, ...] = ids if ids is not None else tuple(element.ColumnOrder)
+        self._titles: tuple[str, ...] | None = None
+        self._index: dict[str, int] | None = None
+        self._widths: tuple[int, ...] | None = None
+        self._types: tuple[str, ...] | None = None
+
+    def __repr__(self) -> str:
+        return f"TableColumns({', '.join(self.ids)})"
+
+    def __str__(self) -> str:
+        return f"TableColumns({', '.join(self.ids)})"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def titles(self) -> tuple[str, ...]:
+        """Returns the displayed column titles"""
+        if self._titles is None:
+            self._titles = tuple(self._element.GetDisplayedColumnTitle(c) for c in self.ids)
+        return self._titles
+
+    @property
+    def index(self) -> dict[str, int]:
+        """Returns a mapping of column title and column id to zero-based column index"""
+        if self._index is None:
+            index = {t: i for i, t in enumerate(self.titles)}
+            for i, c in enumerate(self.ids):
+                index.setdefault(c, i)
+            self._index = index
+        return self._index
+
+    @property
+    def widths(self) -> tuple[int, ...]:
+        """Returns the column widths"""
+        if self._widths is None:
+            self._widths = tuple(self._element.GetCellWidth(0, c) for c in self.ids)
+        return self._widths
+
+    @property
+    def types(self) -> tuple[str, ...]:
+        """Returns the column data types"""
+        if self._types is None:
+            self._types = tuple(self._element.GetColumnDataType(c) for c in self.ids)
+        return self._types
+
+
+class TableData:
+    """
+    TableData - Columnar result of a bulk Table read
+
+    Holds one list of cell values per column id together with the number of
+    COM calls made while reading them.
+    """
+
+    def __init__(self, columns: dict[str, list[str]], row_count: int, com_calls: int) -> None:
+        self.columns: dict[str, list[str]] = columns
+        self.row_count: int = row_count
+        self.com_calls: int = com_calls
+
+    def __repr__(self) -> str:
+        return f"TableData({self.row_count} rows, {len(self.columns)} columns, {self.com_calls} COM calls)"
+
+    def __str__(self) -> str:
+        return f"TableData({self.row_count} rows, {len(self.columns)} columns, {self.com_calls} COM calls)"
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __getitem__(self, column: str) -> list[str]:
+        return self.columns[column]
+
+    def __contains__(self, column: object) -> bool:
+        return column in self.columns
+
+    def rows(self) -> Generator[tuple[str, ...], Any, None]:
+        """
+        Yields the data row by row as tuples in column order
+        """
+        yield from zip(*self.columns.values())
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Returns the columns as NumPy arrays
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        try:
+            import numpy  # type: ignore
+        except ImportError as e:
+            raise ImportError("NumPy is required for TableData.to_numpy(), install it with 'pip install numpy'") from e
+        return {c: numpy.asarray(v) for c, v in self.columns.items()}
+
+
+#: Element type, or (type, sub type) for shells -> wrapper class
+ELEMENT_CLASSES: dict[str | tuple[str, str], type[GuiElement]] = {
+    "GuiTableControl": TableControl,
+    ("GuiShell", "GridView"): GridView,
+    ("GuiShell", "Tree"): Tree,
+    ("GuiShell", "ToolbarControl"): Toolbar,
+    "GuiTextField": TextField,
+    "GuiCTextField": TextField,
+    "GuiPasswordField": TextField,
+    "GuiStatusbar": Statusbar,
+}
+
+_shell_types: set[str] = {t[0] for t in ELEMENT_CLASSES if isinstance(t, tuple)}
+_element_classes: dict[tuple[str, str | None], type[GuiElement]] = {}
+
+
+def register_element_class(cls: type[GuiElement], type: str, sub_type: Optional[str] = None) -> None:
+    """
+    Registers the wrapper class of an element type
+
+    Args:
+        cls: GuiElement subclass to wrap the elements in
+        type: Element type, e.g. 'GuiComboBox'
+        sub_type: Sub type for shells, e.g. 'Calendar'
+    """
+    if sub_type is None:
+        ELEMENT_CLASSES[type] = cls
+    else:
+        ELEMENT_CLASSES[(type, sub_type)] = cls
+        _shell_types.add(type)
+    _element_classes.clear()
+
+
+def element_class(type: str, sub_type: Optional[str] = None) -> type[GuiElement]:
+    """
+    Returns the wrapper class of an element type, cached per (type, sub type)
+
+    Args:
+        type: Element type, e.g. 'GuiShell'
+        sub_type: Sub type for shells, e.g. 'GridView'
+
+    Returns:
+        The registered class, GuiElement if there is none
+    """
+    _key = (type, sub_type)
+    _cls = _element_classes.get(_key)
+    if _cls is None:
+        _cls = ELEMENT_CLASSES.get(_key) or ELEMENT_CLASSES.get(type) or GuiElement
+        _element_classes[_key] = _cls
+    return _cls
+
+
+def wrap_element(element: Dispatch) -> GuiElement:
+    """
+    Wraps a scripting object in the class registered for its type
+
+    Args:
+        element: The scripting object, e.g. the result of session.findById()
+
+    Returns:
+        An instance of the specialized class, e.g. GridView for an ALV grid
+    """
+    return GuiElement(element).specialize()
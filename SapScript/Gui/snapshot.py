@@ -0,0 +1,146 @@
+import time
+from collections import deque
+from typing import Any, Optional
+from bigtree import Node  # type: ignore
+from ..Backend.base import Dispatch
+from .elements import TextElements
+
+_TEXT_TYPES: frozenset[str] = frozenset(t.name for t in TextElements)
+
+
+def _read(element: Dispatch, name: str) -> Any:
+    try:
+        return getattr(element, name)
+    except Exception as _:
+        return None
+
+
+class ElementSnapshot:
+    """
+    ElementSnapshot - In-memory model of a GUI element subtree captured in one pass
+
+    Every element is stored once as a bigtree Node carrying its id, type,
+    element_name, text and changeable state, and indexed by id, by type and
+    by name so searches and diffs run locally instead of over COM.
+    """
+
+    def __init__(self, root: Node, elapsed: float, truncated: bool) -> None:
+        self.root: Node = root
+        self.elapsed: float = elapsed
+        self.truncated: bool = truncated
+        self.by_id: dict[str, Node] = {}
+        self.by_type: dict[str, list[Node]] = {}
+        self.by_name: dict[str, list[Node]] = {}
+        for node in (root, *root.descendants):
+            self.by_id[node.id] = node
+            self.by_type.setdefault(node.type, []).append(node)
+            self.by_name.setdefault(node.element_name, []).append(node)
+
+    def __repr__(self) -> str:
+        return f"ElementSnapshot({self.root.id}, {len(self)} elements, {self.elapsed * 1000:.1f} ms)"
+
+    def __str__(self) -> str:
+        return f"ElementSnapshot({self.root.id}, {len(self)} elements, {self.elapsed * 1000:.1f} ms)"
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self.by_id
+
+    def find(self, id: str) -> Node | None:
+        """Returns the node with the given element id, or None"""
+        return self.by_id.get(id)
+
+    def find_by_type(self, type: str | TextElements) -> list[Node]:
+        """Returns every node of the given element type"""
+        return self.by_type.get(type.name if isinstance(type, TextElements) else type, [])
+
+    def find_by_name(self, name: str) -> list[Node]:
+        """Returns every node with the given element name"""
+        return self.by_name.get(name, [])
+
+    def text_elements(self) -> list[Node]:
+        """Returns every node whose type is one of the TextElements kinds"""
+        return [node for node in self.by_id.values() if node.type in _TEXT_TYPES]
+
+    def changeable(self) -> list[Node]:
+        """Returns every node that is currently changeable"""
+        return [node for node in self.by_id.values() if node.changeable]
+
+    def diff(self, other: "ElementSnapshot") -> dict[str, list[str]]:
+        """
+        Compares this snapshot with a later one
+
+        Args:
+            other: The snapshot to compare against
+
+        Returns:
+            Dictionary with the ids that were 'added', 'removed' and 'changed' (text or changeable state)
+        """
+        return {
+            "added": [id for id in other.by_id if id not in self.by_id],
+            "removed": [id for id in self.by_id if id not in other.by_id],
+            "changed": [
+                id
+                for id, node in self.by_id.items()
+                if id in other.by_id
+                and (node.text != other.by_id[id].text or node.changeable != other.by_id[id].changeable)
+            ],
+        }
+
+    def show(self) -> None:
+        """Prints the snapshot as a tree of element ids"""
+        self.root.show()
+
+
+def take_snapshot(
+    element: Dispatch, max_depth: Optional[int] = None, max_elements: Optional[int] = 10000
+) -> ElementSnapshot:
+    """
+    Walks a GUI element subtree once, breadth first, into an ElementSnapshot
+
+    Args:
+        element: The COM element to start from
+        max_depth: Maximum depth below the start element to walk, defaults to unlimited
+        max_elements: Maximum number of elements to capture, defaults to 10000, None for unlimited
+
+    Returns:
+        ElementSnapshot with the captured tree, its indexes and the time the walk took
+
+    Raises:
+        ValueError: If max_elements is less than 1, the root is always captured
+    """
+    if max_elements is not None and max_elements < 1:
+        raise ValueError(f"max_elements must be at least 1, got {max_elements}")
+    start = time.perf_counter()
+    root: Node | None = None
+    count = 0
+    truncated = False
+    queue: deque[tuple[Dispatch, Node | None, int]] = deque([(element, None, 0)])
+    while queue:
+        if max_elements is not None and count >= max_elements:
+            truncated = True
+            break
+        current, parent, depth = queue.popleft()
+        id = current.Id
+        node = Node(
+            id.rsplit("/", 1)[-1],
+            parent=parent,
+            id=id,
+            type=current.Type,
+            element_name=current.Name,
+            text=_read(current, "Text"),
+            changeable=bool(_read(current, "Changeable")),
+        )
+        count += 1
+        if root is None:
+            root = node
+        if not _read(current, "ContainerType"):
+            continue
+        if max_depth is not None and depth >= max_depth:
+            truncated = True
+            continue
+        for child in current.Children:
+            queue.append((child, node, depth + 1))
+    return ElementSnapshot(root=root, elapsed=time.perf_counter() - start, truncated=truncated)
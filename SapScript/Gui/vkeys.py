@@ -1,4 +1,185 @@
-from enum import Enum, auto
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional
+
+#: SAP GUI virtual key combinations, the position in the tuple is the virtual key id
+VKEYS: tuple[str | None, ...] = (
+    "ENTER",
+    "F1",
+    "F2",
+    "F3",
+    "F4",
+    "F5",
+    "F6",
+    "F7",
+    "F8",
+    "F9",
+    "F10",
+    "F11",
+    "F12",
+    None,
+    "SHIFT+F2",
+    "SHIFT+F3",
+    "SHIFT+F4",
+    "SHIFT+F5",
+    "SHIFT+F6",
+    "SHIFT+F7",
+    "SHIFT+F8",
+    "SHIFT+F9",
+    "CTRL+SHIFT+0",
+    "SHIFT+F11",
+    "SHIFT+F12",
+    "CTRL+F1",
+    "CTRL+F2",
+    "CTRL+F3",
+    "CTRL+F4",
+    "CTRL+F5",
+    "CTRL+F6",
+    "CTRL+F7",
+    "CTRL+F8",
+    "CTRL+F9",
+    "CTRL+F10",
+    "CTRL+F11",
+    "CTRL+F12",
+    "CTRL+SHIFT+F1",
+    "CTRL+SHIFT+F2",
+    "CTRL+SHIFT+F3",
+    "CTRL+SHIFT+F4",
+    "CTRL+SHIFT+F5",
+    "CTRL+SHIFT+F6",
+    "CTRL+SHIFT+F7",
+    "CTRL+SHIFT+F8",
+    "CTRL+SHIFT+F9",
+    "CTRL+SHIFT+F10",
+    "CTRL+SHIFT+F11",
+    "CTRL+SHIFT+F12",
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    "CTRL+E",
+    "CTRL+F",
+    "CTRL+A",
+    "CTRL+D",
+    "CTRL+N",
+    "CTRL+O",
+    "SHIFT+DEL",
+    "CTRL+INS",
+    "SHIFT+INS",
+    "ALT+BACKSPACE",
+    "CTRL+PAGEUP",
+    "PAGEUP",
+    "PAGEDOWN",
+    "CTRL+PAGEDOWN",
+    "CTRL+G",
+    "CTRL+R",
+    "CTRL+P",
+    "CTRL+B",
+    "CTRL+K",
+    "CTRL+T",
+    "CTRL+Y",
+    "CTRL+X",
+    "CTRL+C",
+    "CTRL+V",
+    "SHIFT+F10",
+    None,
+    None,
+    "CTRL+#",
+)
+
+#: Spellings of single key tokens that map onto the names used in VKEYS
+TOKEN_ALIASES: dict[str, str] = {
+    "CONTROL": "CTRL",
+    "STRG": "CTRL",
+    "DELETE": "DEL",
+    "INSERT": "INS",
+    "ESCAPE": "ESC",
+    "RETURN": "ENTER",
+    "PGUP": "PAGEUP",
+    "PGDN": "PAGEDOWN",
+    "PAGEDN": "PAGEDOWN",
+    "BKSP": "BACKSPACE",
+    "HASH": "#",
+}
+
+#: Modifier order used for the canonical form of a key combination
+MODIFIERS: tuple[str, ...] = ("CTRL", "SHIFT", "ALT")
+
+#: Key combinations that SAP GUI maps onto another virtual key
+KEY_ALIASES: dict[str, str] = {
+    "CTRL+S": "F11",
+    "ESC": "F12",
+}
+
+
+@lru_cache(maxsize=1024)
+def normalize_key(key: str) -> str:
+    """
+    Returns the canonical spelling of a key combination
+
+    Upper cases, drops spaces, replaces token synonyms (CONTROL -> CTRL, DELETE -> DEL, ...)
+    and orders modifiers as CTRL, SHIFT, ALT, e.g. 'Shift + Control + f1' -> 'CTRL+SHIFT+F1'.
+    """
+    _tokens = [t for t in key.upper().replace(" ", "").split("+") if t]
+    _tokens = [TOKEN_ALIASES.get(t, t) for t in _tokens]
+    _modifiers = sorted((t for t in _tokens if t in MODIFIERS), key=MODIFIERS.index)
+    return "+".join(_modifiers + [t for t in _tokens if t not in MODIFIERS])
+
+
+def _member_name(key: str) -> str:
+    return key.replace("+", "_").replace("#", "HASH")
+
+
+#: Virtual key ids as an IntEnum, e.g. VKey.ENTER == 0, VKey.CTRL_SHIFT_F1 == 37, VKey.CTRL_S == VKey.F11
+VKey = IntEnum(
+    "VKey",
+    [(_member_name(k), i) for i, k in enumerate(VKEYS) if k is not None]
+    + [(_member_name(a), VKEYS.index(k)) for a, k in KEY_ALIASES.items()],
+)
+
+#: Canonical key combination -> VKey, precomputed once per process
+KEYMAP: dict[str, VKey] = {normalize_key(k): VKey(i) for i, k in enumerate(VKEYS) if k is not None}
+KEYMAP.update({normalize_key(a): KEYMAP[k] for a, k in KEY_ALIASES.items()})
+
+
+@lru_cache(maxsize=1024)
+def get_key_id(key: str | int) -> Optional[VKey]:
+    """
+    Resolves a key combination or virtual key id to its VKey
+
+    Args:
+        key: A combination such as 'ENTER', 'ctrl + s', 'SHIFT+CONTROL+F1', or a numeric id as int or str
+
+    Returns:
+        The VKey, or None if the key is unknown
+    """
+    if isinstance(key, int):
+        _id = key
+    else:
+        _key = key.strip()
+        if not _key.isdigit():
+            return KEYMAP.get(normalize_key(_key))
+        _id = int(_key)
+    if 0 <= _id < len(VKEYS) and VKEYS[_id] is not None:
+        return VKey(_id)
+    return None
 
 
 class VKeys:
@@ -7,121 +188,7 @@ class VKeys:
     """
 
     def __init__(self) -> None:
-        self.vkeys = [
-            "ENTER",
-            "F1",
-            "F2",
-            "F3",
-            "F4",
-            "F5",
-            "F6",
-            "F7",
-            "F8",
-            "F9",
-            "F10",
-            "F11",
-            "F12",
-            None,
-            "SHIFT+F2",
-            "SHIFT+F3",
-            "SHIFT+F4",
-            "SHIFT+F5",
-            "SHIFT+F6",
-            "SHIFT+F7",
-            "SHIFT+F8",
-            "SHIFT+F9",
-            "CTRL+SHIFT+0",
-            "SHIFT+F11",
-            "SHIFT+F12",
-            "CTRL+F1",
-            "CTRL+F2",
-            "CTRL+F3",
-            "CTRL+F4",
-            "CTRL+F5",
-            "CTRL+F6",
-            "CTRL+F7",
-            "CTRL+F8",
-            "CTRL+F9",
-            "CTRL+F10",
-            "CTRL+F11",
-            "CTRL+F12",
-            "CTRL+SHIFT+F1",
-            "CTRL+SHIFT+F2",
-            "CTRL+SHIFT+F3",
-            "CTRL+SHIFT+F4",
-            "CTRL+SHIFT+F5",
-            "CTRL+SHIFT+F6",
-            "CTRL+SHIFT+F7",
-            "CTRL+SHIFT+F8",
-            "CTRL+SHIFT+F9",
-            "CTRL+SHIFT+F10",
-            "CTRL+SHIFT+F11",
-            "CTRL+SHIFT+F12",
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            "CTRL+E",
-            "CTRL+F",
-            "CTRL+A",
-            "CTRL+D",
-            "CTRL+N",
-            "CTRL+O",
-            "SHIFT+DEL",
-            "CTRL+INS",
-            "SHIFT+INS",
-            "ALT+BACKSPACE",
-            "CTRL+PAGEUP",
-            "PAGEUP",
-            "PAGEDOWN",
-            "CTRL+PAGEDOWN",
-            "CTRL+G",
-            "CTRL+R",
-            "CTRL+P",
-            "CTRL+B",
-            "CTRL+K",
-            "CTRL+T",
-            "CTRL+Y",
-            "CTRL+X",
-            "CTRL+C",
-            "CTRL+V",
-            "SHIFT+F10",
-            None,
-            None,
-            "CTRL+#",
-        ]
-
-    def get_key_id(self, key: str) -> int:
-        _id = None
-        _key: str = str(key.strip())
-        if not _key.isdigit():
-            _search_comb: str = _key.upper()
-            _search_comb = _search_comb.replace(" ", "")
-            _search_comb = _search_comb.replace("CONTROL", "CTRL")
-            _search_comb = _search_comb.replace("DELETE", "DEL")
-            _search_comb = _search_comb.replace("INSERT", "INS")
-            try:
-                _id = self.vkeys.index(_search_comb)
-            except ValueError:
-                if _search_comb == "CTRL+S":
-                    _id = 11
-                elif _search_comb == "ESC":
-                    _id = 12
-        return _id
+        self.vkeys: tuple[str | None, ...] = VKEYS
+
+    def get_key_id(self, key: str | int) -> Optional[VKey]:
+        return get_key_id(key)
@@ -0,0 +1,227 @@
+import bisect
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+
+class SystemRecord:
+    """
+    SystemRecord - One SAP Logon entry with its resolved message server, router and workspace
+    """
+
+    __slots__ = (
+        "uuid",
+        "name",
+        "sid",
+        "type",
+        "server",
+        "host",
+        "message_server",
+        "router",
+        "workspace",
+        "node",
+    )
+
+    def __init__(
+        self,
+        uuid: str,
+        name: str,
+        sid: str | None = None,
+        type: str | None = None,
+        server: str | None = None,
+        message_server: str | None = None,
+        router: str | None = None,
+        workspace: str | None = None,
+        node: str | None = None,
+    ) -> None:
+        self.uuid: str = uuid
+        self.name: str = name
+        self.sid: str | None = sid.upper() if sid else None
+        self.type: str | None = type
+        self.server: str | None = server
+        self.host: str | None = server.rsplit(":", 1)[0].lower() if server else None
+        self.message_server: str | None = message_server
+        self.router: str | None = router
+        self.workspace: str | None = workspace
+        self.node: str | None = node
+
+    def __repr__(self) -> str:
+        return f"SystemRecord({self.name}, {self.sid}, {self.server})"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.sid}) {self.server or self.message_server or ''}".rstrip()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the record as a dictionary"""
+        return {f: getattr(self, f) for f in self.__slots__}
+
+
+class SystemCatalog:
+    """
+    SystemCatalog - SAP Logon entries of a landscape indexed by name, SID, server and workspace
+
+    Lookups by name, uuid, SID, server or workspace/node are single dictionary
+    lookups. Names are also kept sorted, so prefix searches use bisection and
+    only glob patterns with leading or inner wildcards scan the entries.
+
+    Example:
+        ```python
+        catalog = Systems().catalog
+        catalog.resolve("PRD").name
+        [r.name for r in catalog.search("ERP*")]
+        ```
+    """
+
+    def __init__(self, records: list[SystemRecord]) -> None:
+        self.records: list[SystemRecord] = records
+        self.by_name: dict[str, SystemRecord] = {}
+        self.by_uuid: dict[str, SystemRecord] = {}
+        self.by_sid: dict[str, list[SystemRecord]] = {}
+        self.by_server: dict[str, list[SystemRecord]] = {}
+        self.by_workspace: dict[str, list[SystemRecord]] = {}
+        self.by_node: dict[tuple[str, str], list[SystemRecord]] = {}
+        for _record in records:
+            self.by_name.setdefault(_record.name.casefold(), _record)
+            self.by_uuid.setdefault(_record.uuid, _record)
+            if _record.sid:
+                self.by_sid.setdefault(_record.sid, []).append(_record)
+            if _record.server:
+                self.by_server.setdefault(_record.server.lower(), []).append(_record)
+                if _record.host != _record.server.lower():
+                    self.by_server.setdefault(_record.host, []).append(_record)
+            if _record.workspace:
+                self.by_workspace.setdefault(_record.workspace, []).append(_record)
+                if _record.node:
+                    self.by_node.setdefault((_record.workspace, _record.node), []).append(_record)
+        self._names: list[str] = sorted(self.by_name)
+
+    def __repr__(self) -> str:
+        return f"SystemCatalog({len(self.records)} systems)"
+
+    def __str__(self) -> str:
+        return f"SystemCatalog({len(self.records)} systems)"
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[SystemRecord]:
+        return iter(self.records)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.resolve(key) is not None
+
+    @classmethod
+    def from_files(cls, files: list[dict[str, Any]]) -> "SystemCatalog":
+        """
+        Builds the catalog in one pass over the parsed landscape file and its includes
+
+        Args:
+            files: Output of parse_landscape for every file, the landscape file first
+        """
+        _message_servers = {m.get("uuid"): m for f in files for m in f.get("messageservers", [])}
+        _routers = {r.get("uuid"): r for f in files for r in f.get("routers", [])}
+        _items: dict[str, tuple[str | None, str | None]] = {}
+        for _file in files:
+            for _service_id, _workspace, _node in _file.get("items", []):
+                _items.setdefault(_service_id, (_workspace, _node))
+        _records = []
+        for _file in files:
+            for _service in _file["services"]:
+                _uuid = _service.get("uuid", _service["name"])
+                _message_server = _message_servers.get(_service.get("msid"))
+                _router = _routers.get(_service.get("routerid"))
+                _workspace, _node = _items.get(_uuid, (None, None))
+                _records.append(
+                    SystemRecord(
+                        uuid=_uuid,
+                        name=_service["name"],
+                        sid=_service.get("systemid"),
+                        type=_service.get("type"),
+                        server=_service.get("server"),
+                        message_server=_message_server.get("host", _message_server.get("name")) if _message_server else None,
+                        router=_router.get("router") if _router else None,
+                        workspace=_workspace,
+                        node=_node,
+                    )
+                )
+        return cls(_records)
+
+    def get(self, name: str) -> SystemRecord | None:
+        """Returns the entry with this name, ignoring case"""
+        return self.by_name.get(name.casefold())
+
+    def resolve(self, key: str) -> SystemRecord | None:
+        """
+        Returns the entry for a name, uuid or SID, in that order
+
+        Args:
+            key: SAP Logon entry name, entry uuid or system id
+
+        Returns:
+            The matching entry, the first one of the SID if several share it, None if there is none
+        """
+        _record = self.by_name.get(key.casefold()) or self.by_uuid.get(key)
+        if _record is None:
+            _records = self.by_sid.get(key.upper())
+            _record = _records[0] if _records else None
+        return _record
+
+    def server(self, server: str) -> list[SystemRecord]:
+        """Returns the entries of an application server, given as 'host:port' or host"""
+        return self.by_server.get(server.lower(), [])
+
+    def workspace(self, workspace: str, node: Optional[str] = None) -> list[SystemRecord]:
+        """Returns the entries of a workspace, or of one node of it"""
+        if node is None:
+            return self.by_workspace.get(workspace, [])
+        return self.by_node.get((workspace, node), [])
+
+    def prefix(self, prefix: str) -> list[SystemRecord]:
+        """Returns the entries whose name starts with prefix, ignoring case, in name order"""
+        _prefix = prefix.casefold()
+        _start = bisect.bisect_left(self._names, _prefix)
+        _stop = bisect.bisect_left(self._names, _prefix + "\U0010ffff", lo=_start)
+        return [self.by_name[n] for n in self._names[_start:_stop]]
+
+    def search(self, pattern: str, field: str = "name") -> list[SystemRecord]:
+        """
+        Returns the entries whose field matches a glob pattern, ignoring case
+
+        Args:
+            pattern: Glob pattern, e.g. 'ERP*', '*PRD*' or 'S?4'
+            field: Record field to match, e.g. 'name', 'sid', 'server' or 'workspace'
+
+        Returns:
+            The matching entries, in name order for name patterns
+        """
+        _pattern = pattern.casefold()
+        if field == "name":
+            _literal = _pattern.rstrip("*")
+            if not any(c in _literal for c in "*?["):
+                return self.prefix(_literal) if _literal != _pattern else ([r] if (r := self.get(_pattern)) else [])
+            _match = _compile(_pattern)
+            return [self.by_name[n] for n in self._names if _match(n)]
+        _match = _compile(_pattern)
+        return [r for r in self.records if (v := getattr(r, field)) is not None and _match(v.casefold())]
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern: str) -> Any:
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+@lru_cache(maxsize=1)
+def default_catalog() -> SystemCatalog | None:
+    """
+    Returns the catalog of the default SAP Logon landscape file, loaded once per process
+
+    Returns:
+        The catalog, None if there is no readable landscape file
+    """
+    from .systems import Systems
+
+    try:
+        return Systems().catalog
+    except Exception as _:
+        return None
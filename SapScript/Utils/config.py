@@ -0,0 +1,31 @@
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+
+def load_config(path: str | Path = ".env") -> Mapping[str, str | None]:
+    """
+    Returns the values of a .env file, read once per process and resolved path
+
+    python-dotenv is imported on the first call. The returned mapping is shared
+    by every caller and read only, call load_config.cache_clear() after editing
+    the file to read it again.
+
+    Args:
+        path: The .env file, relative paths are resolved against the current directory
+
+    Returns:
+        Read only mapping of the variables in the file, empty if the file does not exist
+    """
+    return _load(Path(path).resolve())
+
+
+@lru_cache(maxsize=8)
+def _load(path: Path) -> Mapping[str, str | None]:
+    from dotenv import dotenv_values  # type: ignore
+
+    return MappingProxyType(dict(dotenv_values(path)))
+
+
+load_config.cache_clear = _load.cache_clear  # type: ignore[attr-defined]
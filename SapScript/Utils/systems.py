@@ -1,90 +1,255 @@
+import hashlib
+import json
 import os
-from pathlib import Path
-from typing import Optional
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from .catalog import SystemCatalog
+
+#: Version of the on-disk parse cache format, bump when the cached content changes
+CACHE_VERSION: int = 2
+
+
+def default_cache_dir() -> Path:
+    """Returns the directory the parsed landscape files are cached in"""
+    _base = os.environ.get("LOCALAPPDATA")
+    return (Path(_base) if _base else Path.home() / ".cache") / "sap_script" / "landscape"
+
+
+def default_landscape_file() -> Path:
+    """Returns the SAP Logon landscape file of the current user"""
+    _base = os.environ.get("APPDATA")
+    return (Path(_base) if _base else Path.home() / "AppData" / "Roaming") / "SAP" / "Common" / "SAPUILandscape.xml"
+
+
+def include_path(url: str) -> Path:
+    """
+    Converts the url of an Includes entry to a local or UNC path
+
+    Args:
+        url: The url attribute, e.g. 'file:///C:/SAP/landscape.xml' or 'file://server/share/landscape.xml',
+            a drive letter in the host part as in 'file://C:/SAP/landscape.xml' is read as a local path
+
+    Returns:
+        The path of the include file
+    """
+    if not url.startswith("file:"):
+        return Path(url)
+    from urllib.request import url2pathname
+
+    _url = urlparse(url)
+    _netloc = _url.netloc
+    if len(_netloc) == 2 and _netloc[0].isalpha() and _netloc[1] in ":|":
+        return Path(url2pathname(f"/{_netloc}{_url.path}"))
+    if _netloc:
+        return Path(f"//{_netloc}{url2pathname(_url.path)}")
+    return Path(url2pathname(_url.path))
+
+
+def parse_landscape(path: Path) -> dict[str, Any]:
+    """
+    Extracts the entries of one landscape file needed to build the system catalog
+
+    The file is read incrementally with iterparse and every element is cleared
+    once handled, so only the extracted attributes are kept in memory.
+
+    Args:
+        path: The landscape XML file
+
+    Returns:
+        {'services': [attributes of every Services child], 'includes': [include urls],
+        'items': [[serviceid, workspace, node] of every workspace item],
+        'messageservers': [attributes], 'routers': [attributes]}
+    """
+    _data: dict[str, list[Any]] = {"services": [], "includes": [], "items": [], "messageservers": [], "routers": []}
+    _lists = {"Services": _data["services"], "Messageservers": _data["messageservers"], "Routers": _data["routers"]}
+    _stack: list[str] = []
+    _workspace: str | None = None
+    _node: str | None = None
+    for _event, _element in ET.iterparse(path, events=("start", "end")):
+        _tag = _element.tag
+        if _event == "start":
+            _stack.append(_tag)
+            if _tag == "Workspace":
+                _workspace = _element.attrib.get("name")
+            elif _tag == "Node":
+                _node = _element.attrib.get("name")
+            continue
+        _stack.pop()
+        _parent = _stack[-1] if _stack else None
+        if _parent in _lists:
+            _lists[_parent].append(dict(_element.attrib))
+            _element.clear()
+        elif _parent == "Includes":
+            _data["includes"].append(_element.attrib["url"])
+            _element.clear()
+        elif _tag == "Item" and "serviceid" in _element.attrib:
+            _data["items"].append([_element.attrib["serviceid"], _workspace, _node if _parent == "Node" else None])
+            _element.clear()
+        elif _tag == "Node":
+            _node = None
+        elif _tag == "Workspace":
+            _workspace = None
+            _element.clear()
+        elif _parent == "Landscape":
+            _element.clear()
+    return _data
 
 
 class Systems:
-    def __init__(self, landscape_file: Optional[str | Path] = None) -> None:
-        self._landscape_file: str | Path | None = (
-            landscape_file
-            if landscape_file is not None
-            else Path(
-                f"C:/Users/{os.getlogin()}/AppData/Roaming/SAP/Common/SAPUILandscape.xml"
-            )
-        )
+    """
+    Systems - The SAP systems of the SAP Logon landscape file and its includes
+
+    Every file is parsed once with iterparse and the result is cached on disk,
+    keyed by the file's path, modification time and size, so unchanged files
+    are not parsed again on later runs. Include files are loaded in parallel.
+
+    Example:
+        ```python
+        systems = Systems()
+        print(systems.available_systems())
+        print(systems.by_sid["PRD"][0]["server"])
+        ```
+    """
+
+    def __init__(
+        self,
+        landscape_file: Optional[str | Path] = None,
+        use_cache: bool = True,
+        cache_dir: Optional[str | Path] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self._landscape_file: Path = Path(landscape_file) if landscape_file is not None else default_landscape_file()
+        self.use_cache: bool = use_cache
+        self.cache_dir: Path = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_workers: int = max_workers
         self._available_systems: list[str] = []
-        self._landscape_xml: ET.ElementTree | None = None
-        self.landscape_xml_root: ET.Element | None = None
         self._includes: list[str] = []
+        self.services: dict[str, dict[str, str]] = {}
+        self.by_sid: dict[str, list[dict[str, str]]] = {}
+        self.parsed_files: int = 0
+        self.cached_files: int = 0
+        self._files: list[dict[str, Any]] = []
+        self._catalog: "SystemCatalog | None" = None
+        self._lock = threading.Lock()
+        self._landscape_xml_root: ET.Element | None = None
         self.load_landscape_file()
         self.parse_landscape_file()
 
     def __repr__(self) -> str:
-        if isinstance(self.landscape_xml_root, ET.ElementTree):
-            return ET.tostring(element=self.landscape_xml_root, encoding="unicode")
-        return "No landscape file loaded"
+        return f"Systems({self._landscape_file}, {len(self._available_systems)} systems)"
 
     def __str__(self) -> str:
-        if isinstance(self.landscape_xml_root, ET.ElementTree):
-            return ET.tostring(element=self.landscape_xml_root, encoding="unicode")
-        return "No landscape file loaded"
+        return f"Systems({self._landscape_file}, {len(self._available_systems)} systems)"
 
     def load_landscape_file(self) -> None:
         if not self._landscape_file.exists():
             raise ValueError(
                 f"No landscape specified and no file found, at default location: {self._landscape_file}, please specify a valid landscape file."
             )
+
+    def _cache_file(self, path: Path) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(str(path.resolve()).encode()).hexdigest()}.json"
+
+    def _load(self, path: Path) -> dict[str, Any]:
+        """Returns the parsed content of a landscape file, from the disk cache if the file is unchanged"""
+        _stat = path.stat()
+        _key = [CACHE_VERSION, str(path.resolve()), _stat.st_mtime_ns, _stat.st_size]
+        _cache_file = self._cache_file(path)
+        if self.use_cache:
+            try:
+                _cached = json.loads(_cache_file.read_text(encoding="utf-8"))
+                if _cached["key"] == _key:
+                    with self._lock:
+                        self.cached_files += 1
+                    return _cached["data"]
+            except (OSError, ValueError, KeyError):
+                pass
+        _data = parse_landscape(path)
+        with self._lock:
+            self.parsed_files += 1
+        if self.use_cache:
+            try:
+                _cache_file.parent.mkdir(parents=True, exist_ok=True)
+                _tmp = _cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                _tmp.write_text(json.dumps({"key": _key, "data": _data}), encoding="utf-8")
+                os.replace(_tmp, _cache_file)
+            except OSError:
+                pass
+        return _data
+
+    def _load_include(self, url: str) -> dict[str, Any]:
         try:
-            self._landscape_xml = ET.parse(source=self._landscape_file.open(mode="r"))
+            return self._load(include_path(url))
         except Exception as _:
-            raise ValueError(
-                f"Error parsing landscape file, at path: {self._landscape_file}"
-            )
+            raise ValueError(f"Error parsing include file: {url}")
 
     def parse_landscape_file(self) -> None:
-        if not isinstance(self._landscape_xml, ET.ElementTree):
+        try:
+            _data = self._load(self._landscape_file)
+        except Exception as _:
             raise ValueError(
-                "No landscape file loaded, run load_landscape(value='path/to/landscape.xml') first."
+                f"Error parsing landscape file, at path: {self._landscape_file}"
             )
-        self.landscape_xml_root = self._landscape_xml.getroot()
-        for child in self.landscape_xml_root:
-            if child.tag == "Services":
-                self._available_systems = [gc.attrib["name"] for gc in child]
-            elif child.tag == "Includes":
-                for include in child:
-                    self._includes.append(include.attrib["url"])
-        if self._includes is not None:
-            for include in self._includes:
-                if include.startswith("file://"):
-                    include = include[5:]
-                    try:
-                        include = open(file=include, mode="r")
-                    except Exception as _:
-                        raise ValueError(f"Error opening include file: {include}")
-                try:
-                    include_xml = ET.parse(source=include)
-                    include_root = include_xml.getroot()
-                    for child in include_root:
-                        if child.tag == "Services":
-                            self._available_systems.extend(
-                                [gc.attrib["name"] for gc in child]
-                            )
-                except Exception as _:
-                    raise ValueError(f"Error parsing include file: {include}")
+        self._includes = _data["includes"]
+        _files = [_data]
+        if self._includes:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self._includes))) as _pool:
+                _files.extend(_pool.map(self._load_include, self._includes))
+        self._files = _files
+        self._catalog = None
+        self._landscape_xml_root = None
+        self._available_systems = []
+        self.services = {}
+        self.by_sid = {}
+        for _file in _files:
+            for _service in _file["services"]:
+                self._available_systems.append(_service["name"])
+                self.services.setdefault(_service["name"], _service)
+                if "systemid" in _service:
+                    self.by_sid.setdefault(_service["systemid"].upper(), []).append(_service)
 
     def available_systems(self) -> list[str]:
-        if isinstance(self._available_systems, list):
-            return self._available_systems
-        elif isinstance(self._landscape_xml, ET.ElementTree):
-            self.parse_landscape_file()
-            return self._available_systems
-        else:
-            try:
-                self.load_landscape_file()
-                self.parse_landscape_file()
-                return self._available_systems
-            except Exception as _:
-                raise ValueError(
-                    "No landscape file loaded, run load_landscape(value='path/to/landscape.xml') first."
-                )
+        return self._available_systems
+
+    @property
+    def landscape_xml_root(self) -> ET.Element:
+        """
+        Returns the root element of the landscape file, parsed on first access
+
+        The systems are read without building the element tree, it is only
+        built for callers that use this attribute.
+        """
+        if self._landscape_xml_root is None:
+            self._landscape_xml_root = ET.parse(self._landscape_file).getroot()
+        return self._landscape_xml_root
+
+    @property
+    def catalog(self) -> "SystemCatalog":
+        """Returns the indexed SystemCatalog of the landscape, built on first use"""
+        if self._catalog is None:
+            from .catalog import SystemCatalog
+
+            self._catalog = SystemCatalog.from_files(self._files)
+        return self._catalog
+
+    def get_service(self, name: str) -> dict[str, str] | None:
+        """
+        Returns the attributes of a Services entry by its name, or by SID if no name matches
+
+        Args:
+            name: The entry name as shown in SAP Logon, or a system id
+
+        Returns:
+            The attributes of the entry, None if there is none
+        """
+        _service = self.services.get(name)
+        if _service is None:
+            _services = self.by_sid.get(name.upper())
+            _service = _services[0] if _services else None
+        return _service
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from SapScript.Core.sap import SAP  # noqa: F401
-from SapScript.Gui.vkeys import VKeys  # noqa: F401
-from SapScript.Utils.systems import Systems  # noqa: F401
 import sys
 
+# typing is not imported at runtime, it is a noticeable share of the import time
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from SapScript.Core.sap import SAP  # noqa: F401
+    from SapScript.Gui.vkeys import VKeys  # noqa: F401
+    from SapScript.Utils.systems import Systems  # noqa: F401
+
 #: The release version
 version = "0.0.1"
 __version__ = version
@@ -15,3 +19,33 @@ MIN_PYTHON_VERSION_STR = ".".join([str(v) for v in MIN_PYTHON_VERSION])
 if sys.version_info < MIN_PYTHON_VERSION:
     msg = f"sap_script {version} requires Python {MIN_PYTHON_VERSION_STR} or newer."
     raise Exception(msg)
+
+#: Public name -> module it is imported from on first access
+_LAZY: dict[str, str] = {
+    "SAP": "SapScript.Core.sap",
+    "VKeys": "SapScript.Gui.vkeys",
+    "Systems": "SapScript.Utils.systems",
+}
+
+#: Subpackages, imported on first attribute access like the public names
+_SUBPACKAGES: frozenset[str] = frozenset({"Backend", "Core", "Export", "Gui", "Utils"})
+
+__all__ = ["SAP", "VKeys", "Systems", "version", "__version__"]
+
+
+def __getattr__(name: str) -> object:
+    # PEP 562: the modules behind the public names are imported on first use
+    _module = _LAZY.get(name)
+    if _module is None and name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    if _module is None:
+        return importlib.import_module(f"{__name__}.{name}")
+    _value = getattr(importlib.import_module(_module), name)
+    globals()[name] = _value
+    return _value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY) | _SUBPACKAGES)
@@ -0,0 +1,145 @@
+def _simulated_screen() -> object:
+    from SapScript.Backend import Button, Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen(
+            "ZACT",
+            "SAPLZACT",
+            100,
+            elements=[
+                Field("txtNAME"),
+                Field("chkFLAG", type="GuiCheckBox"),
+                Field("chkOTHER", type="GuiCheckBox"),
+                Button("btnGO"),
+            ],
+        ),
+        transaction="ZACT",
+    )
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZACT")
+    return _sap, _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that the actions reach the scripting object and call the right member
+    """
+    from SapScript.Core.action import Actions
+    from SapScript.Gui.elements import GuiElement
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _name = GuiElement(_sap.session.findById("wnd[0]/usr/txtNAME"))
+    _button = GuiElement(_sap.session.findById("wnd[0]/usr/btnGO"))
+
+    # Execute tests
+    _sim.reset_counters()
+    assert Actions.press(_button)._success
+    assert Actions.set_focus(_name)._success
+    assert Actions.select(_name)._success
+    assert (_sim.calls["Press"], _sim.calls["SetFocus"], _sim.calls["Select"]) == (1, 1, 1)
+    assert Actions.run(_name, "set_text", "ABC")._success
+    assert _name.element.Text == "ABC"
+    _result = Actions.call_function(_name, "SetFocus")
+    assert _result._success
+    assert _sim.calls["SetFocus"] == 2
+    try:
+        Actions.call_function(_name, "NoSuchMethod")
+        assert False
+    except ValueError as _:
+        pass
+    try:
+        Actions.run(_name, "set_text", 1)
+        assert False
+    except TypeError as _:
+        pass
+    try:
+        Actions.run(_name, "no_such_action")
+        assert False
+    except ValueError as _:
+        pass
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that type specific overrides apply and the element type is read once per element
+    """
+    from SapScript.Core.action import ActionSpec, Actions, register_action, resolve_action, ACTIONS, TYPE_ACTIONS
+    from SapScript.Gui.elements import GuiElement
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _flag = GuiElement(_sap.session.findById("wnd[0]/usr/chkFLAG"))
+    _name = GuiElement(_sap.session.findById("wnd[0]/usr/txtNAME"))
+
+    # Execute tests
+    _sim.reset_counters()
+    assert Actions.select(_flag)._success
+    assert Actions.select(_flag)._success
+    assert _flag.element.Selected is True
+    assert _sim.calls["Select"] == 0
+    assert _sim.calls["Type"] == 1
+    Actions.press(_name)
+    assert _sim.calls["Type"] == 1
+    assert resolve_action("select", "GuiCheckBox") is TYPE_ACTIONS[("select", "GuiCheckBox")]
+    assert resolve_action("select", "GuiTextField") is ACTIONS["select"]
+    register_action("clear", ActionSpec("Text", kind="set", value=""), types=["GuiTextField"])
+    try:
+        _name.element.Text = "X"
+        assert Actions.run(_name, "clear")._success
+        assert _name.element.Text == ""
+    finally:
+        del TYPE_ACTIONS[("clear", "GuiTextField")]
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that batch runs every item and reports the failures in one Result
+    """
+    from SapScript.Core.action import Actions
+    from SapScript.Gui.elements import GuiElement
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _name = GuiElement(_sap.session.findById("wnd[0]/usr/txtNAME"))
+    _flag = GuiElement(_sap.session.findById("wnd[0]/usr/chkFLAG"))
+    _other = GuiElement(_sap.session.findById("wnd[0]/usr/chkOTHER"))
+    _button = GuiElement(_sap.session.findById("wnd[0]/usr/btnGO"))
+
+    # Execute tests
+    _result = Actions.batch([(_name, "set_text", ("ABC",)), (_flag, "check"), (_other, "uncheck"), (_button, "press")])
+    assert _result.ok
+    assert (_result.value.total, _result.value.succeeded, _result.value.failed) == (4, 4, 0)
+    assert _name.element.Text == "ABC" and _flag.element.Selected is True
+    _result = Actions.batch([(_name, "set_text", (1,)), (_name, "bogus"), (_button, "press")])
+    assert not _result.ok
+    assert isinstance(_result.error, TypeError)
+    assert (_result.value.succeeded, _result.value.failed, _result.value.skipped) == (1, 2, 0)
+    _result = Actions.batch([(_name, "bogus"), (_button, "press")], stop_on_error=True)
+    assert (_result.value.succeeded, _result.value.failed, _result.value.skipped) == (0, 1, 1)
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that values written through actions are not hidden by a previously fetched property record
+    """
+    from SapScript.Core.action import Actions
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _name = _sap.get_element("wnd[0]/usr/txtNAME").value
+    _cached = _sap.get_element("wnd[0]/usr/txtNAME", cached=True).value
+    _name.element.Text = "ABC"
+
+    # Execute tests
+    _name.fetch("text")
+    _cached.fetch("text")
+    assert Actions.run(_name, "set_text", "XYZ")._success
+    assert _name.text == "XYZ"
+    assert Actions.batch([(_cached, "set_text", ("UVW",))]).ok
+    assert _cached.text == "UVW"
+    _name.fetch("text")
+    assert Actions.batch([(_name, "set_text", (1,))]).value.failed == 1
+    assert _name.text == "UVW"
@@ -0,0 +1,119 @@
+def _simulator(**kwargs: object) -> object:
+    from SapScript.Backend import Button, Field, Grid, SimScreen, SimulatorBackend
+
+    _sim = SimulatorBackend(**kwargs)
+    _sim.add_screen(
+        SimScreen(
+            "VA02_INITIAL",
+            "SAPMV45A",
+            102,
+            title="Change Sales Order",
+            elements=[
+                Field("ctxtVBAK-VBELN"),
+                Field("txtVBAK-ERNAM", text="CREATOR", changeable=False),
+                Button("btnOVERVIEW", screen="VA02_OVERVIEW"),
+                Grid("cntlGRID1/shellcont/shell", ["POSNR", "MATNR"], 60, visible_rows=15, lazy=True),
+            ],
+            keys={0: "VA02_OVERVIEW"},
+        ),
+        transaction="VA02",
+    )
+    _sim.add_screen(SimScreen("VA02_OVERVIEW", "SAPMV45A", 4001, message=("S", "Order overview")))
+    return _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that SAP connects, opens a session and window through the simulator backend
+    """
+    # Prepare test data
+    from SapScript.Core.sap import SAP
+
+    _sim = _simulator()
+
+    # Execute tests
+    _sap = SAP("DEV", backend=_sim)
+    assert _sap.connection.Description == "DEV"
+    assert _sap.session.Id == "/app/con[0]/ses[0]"
+    assert _sap.window.Type == "GuiMainWindow"
+    assert _sap.get_session_info().value.Program == "SAPLSMTR_NAVIGATION"
+    assert not SAP("NOPE", backend=_sim).get_connection().ok
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test transactions, field writes, virtual keys and the status bar against the simulator
+    """
+    # Prepare test data
+    from SapScript.Core.sap import SAP
+
+    _sap = SAP("DEV", backend=_simulator())
+
+    # Execute tests
+    assert _sap.start_transaction("VA02").ok
+    assert _sap.session.Info.ScreenNumber == 102
+    _order = _sap.get_element("wnd[0]/usr/ctxtVBAK-VBELN").value
+    _order.text = "4711"
+    assert _order.text == "4711"
+    try:
+        _sap.get_element("wnd[0]/usr/txtVBAK-ERNAM").value.text = "OTHER"
+        assert False
+    except ValueError:
+        pass
+    assert not _sap.get_element("wnd[0]/usr/txtMISSING").ok
+    assert _sap.send_key("ENTER").ok
+    assert _sap.session.Info.ScreenNumber == 4001
+    assert _sap.session.findById("wnd[0]/sbar").Text == "Order overview"
+    assert _sap.send_key("F3").ok
+    assert _sap.session.Info.Transaction == "SESSION_MANAGER"
+    _sap.start_transaction("ZZ99")
+    assert _sap.session.findById("wnd[0]/sbar").MessageType == "E"
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that every scripting call is counted and delayed by the configured latency
+    """
+    # Prepare test data
+    import time
+    from SapScript.Core.sap import SAP
+    from SapScript.Gui.elements import Table
+
+    _sim = _simulator(member_latency={"GetCellValue": 0.001})
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("VA02")
+    _table = Table(element=_sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell").value)
+
+    # Execute tests
+    _sim.reset_counters()
+    _start = time.perf_counter()
+    _rows = list(_table.iter_rows())
+    _elapsed = time.perf_counter() - _start
+    assert len(_rows) == 60
+    assert all(all(r) for r in _rows)
+    assert _sim.calls["GetCellValue"] == 120
+    assert _sim.calls["FirstVisibleRow"] == 4
+    assert _elapsed >= 0.12
+    assert _sim.total_calls == 120 + 4 + 3
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test the process-wide default backend and case-insensitive member names
+    """
+    # Prepare test data
+    from SapScript.Backend import SimulatorBackend, Win32Backend, get_backend, set_backend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+
+    # Execute tests
+    set_backend(_sim)
+    try:
+        _sap = SAP("QAS")
+        assert _sap.backend is _sim
+        assert _sap.connection.description == "QAS"
+        assert len(_sap.app.connections) == 1
+    finally:
+        set_backend(None)
+    assert isinstance(get_backend(), Win32Backend)
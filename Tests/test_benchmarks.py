@@ -0,0 +1,59 @@
+def test_1() -> None:
+    """
+    _summary_ : Test that no benchmarked hot path needs more scripting calls or round trips than its baseline
+    """
+    # Prepare test data
+    import json
+    from pathlib import Path
+    from Benchmarks import compare, run_benchmarks
+
+    _baseline = json.loads((Path(__file__).parents[1] / "Benchmarks" / "baseline.json").read_text())
+
+    # Execute tests
+    _results = run_benchmarks(latency=0.0, allocations=False)
+    assert set(_results["benchmarks"]) == set(_baseline)
+    assert compare(_results, _baseline) == []
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that benchmark results are machine-readable and include timing, call counts and allocations
+    """
+    # Prepare test data
+    import json
+    from Benchmarks import compare, run_benchmarks
+
+    # Execute tests
+    _results = json.loads(json.dumps(run_benchmarks(latency=0.0, names=["table.read_all", "sap.get_element"])))
+    _read_all = _results["benchmarks"]["table.read_all"]
+    assert _read_all["seconds"] >= 0
+    assert _read_all["calls"] == sum(_read_all["calls_by_member"].values())
+    assert _read_all["peak_bytes"] > 0
+    assert compare(_results, {"table.read_all": {"calls": _read_all["calls"] - 1}}) != []
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that the temporary landscape files of the systems benchmarks are removed after the run
+    """
+    # Prepare test data
+    from pathlib import Path
+    from Benchmarks import suite
+
+    _created: list[Path] = []
+    _landscape_files = suite._landscape_files
+
+    def _tracked() -> Path:
+        _landscape = _landscape_files()
+        _created.append(_landscape.parent)
+        return _landscape
+
+    # Execute tests
+    suite._landscape_files = _tracked
+    try:
+        suite.run_benchmarks(latency=0.0, names=["systems.parse", "systems.parse.cached"], allocations=False)
+    finally:
+        suite._landscape_files = _landscape_files
+    assert len(_created) == 2
+    assert not any(p.exists() for p in _created)
+    assert suite._temp_dirs == []
@@ -0,0 +1,118 @@
+class FakeInfo:
+    """
+    _summary_ : Stand-in for the GuiSessionInfo COM object
+    """
+
+    def __init__(self) -> None:
+        self.Program = "SAPLSMTR_NAVIGATION"
+        self.ScreenNumber = 100
+
+
+class FakeSession:
+    """
+    _summary_ : Stand-in for a GuiSession COM object that counts findById calls
+    """
+
+    def __init__(self) -> None:
+        self.Info = FakeInfo()
+        self.find_calls = 0
+
+    def findById(self, id: str) -> object:
+        self.find_calls += 1
+        return f"<{id}>"
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that repeated lookups of the same ids only call findById once per id
+    """
+    # Prepare test data
+    from SapScript.Core.cache import ElementCache
+
+    _session = FakeSession()
+    _cache = ElementCache()
+    _ids = [f"wnd[0]/usr/txtFIELD{i}" for i in range(30)]
+
+    # Execute tests
+    for _ in range(10):
+        for _id in _ids:
+            assert _cache.get(_session, _id).element == f"<{_id}>"
+    assert _session.find_calls == 30
+    assert _cache.misses == 30
+    assert _cache.hits == 270
+    assert _cache.hit_rate == 0.9
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that the cache evicts the least recently used id when full
+    """
+    # Prepare test data
+    from SapScript.Core.cache import ElementCache
+
+    _session = FakeSession()
+    _cache = ElementCache(maxsize=2)
+
+    # Execute tests
+    _cache.get(_session, "a")
+    _cache.get(_session, "b")
+    _cache.get(_session, "a")
+    _cache.get(_session, "c")
+    assert "a" in _cache
+    assert "b" not in _cache
+    assert len(_cache) == 2
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that a dirty cache is only dropped when the screen actually changed
+    """
+    # Prepare test data
+    from SapScript.Core.cache import ElementCache
+
+    _session = FakeSession()
+    _cache = ElementCache()
+    _cache.get(_session, "wnd[0]/usr/txtA")
+
+    # Execute tests
+    _cache.mark_dirty()
+    _cache.get(_session, "wnd[0]/usr/txtA")
+    assert _session.find_calls == 1
+
+    _cache.mark_dirty()
+    _session.Info.ScreenNumber = 200
+    _cache.get(_session, "wnd[0]/usr/txtA")
+    assert _session.find_calls == 2
+    assert _cache.invalidations == 1
+
+    _cache.get(FakeSession(), "wnd[0]/usr/txtA")
+    assert _cache.invalidations == 2
+    assert _cache.stats()["misses"] == 3
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that get_element is uncached by default and sees navigation done outside SAP methods
+    """
+    # Prepare test data
+    from SapScript.Backend import Button, Field, SimScreen, SimulatorBackend
+    from SapScript.Core.action import Actions
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(SimScreen("A", "SAPLZA", 100, elements=[Field("txtX", text="a"), Button("btnNEXT", screen="B")]), transaction="ZA")
+    _sim.add_screen(SimScreen("B", "SAPLZA", 200, elements=[Field("txtX", text="b")]))
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZA")
+
+    # Execute tests
+    assert _sap.get_element("wnd[0]/usr/txtX", cached=True).value.text == "a"
+    assert Actions.press(_sap.get_element("wnd[0]/usr/btnNEXT").value)._success
+    assert _sap.get_element("wnd[0]/usr/txtX").value.text == "b"
+    _sap.element_cache.mark_dirty()
+    assert _sap.get_element("wnd[0]/usr/txtX", cached=True).value.text == "b"
+    _sap.start_transaction("ZA")
+    assert _sap.fill({"wnd[0]/usr/txtX": "c"}).ok
+    Actions.press(_sap.get_element("wnd[0]/usr/btnNEXT").value)
+    assert _sap.fill({"wnd[0]/usr/txtX": "d"}).value.written == 1
+    assert _sap.session.findById("wnd[0]/usr/txtX").Text == "d"
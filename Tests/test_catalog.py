@@ -0,0 +1,100 @@
+def _write_landscape(directory: object, services: int = 3000) -> object:
+    from pathlib import Path
+
+    _dir = Path(directory)
+    (_dir / "include.xml").write_text(
+        '<?xml version="1.0"?><Landscape><Services>'
+        + "".join(
+            f'<Service type="SAPGUI" uuid="i{i}" name="ERP {i:04d}" systemid="E{i % 50:02d}" server="erp{i}.corp:32{i % 100:02d}"/>'
+            for i in range(services)
+        )
+        + "</Services></Landscape>"
+    )
+    _landscape = _dir / "SAPUILandscape.xml"
+    _landscape.write_text(
+        '<?xml version="1.0"?><Landscape>'
+        '<Workspaces><Workspace uuid="w0" name="Local"><Node uuid="n0" name="Finance"><Item uuid="x0" serviceid="s0"/></Node>'
+        '<Item uuid="x1" serviceid="s1"/></Workspace></Workspaces>'
+        '<Services><Service type="SAPGUI" uuid="s0" name="DEV" systemid="DEV" server="dev.corp:3200"/>'
+        '<Service type="SAPGUI" uuid="s1" name="Production" systemid="PRD" msid="m0" routerid="r0"/></Services>'
+        '<Messageservers><Messageserver uuid="m0" name="PRD" host="prd-ms.corp" port="3600"/></Messageservers>'
+        '<Routers><Router uuid="r0" name="Corp" router="/H/saprouter.corp/S/3299"/></Routers>'
+        f'<Includes><Include url="{(_dir / "include.xml").as_uri()}" index="0"/></Includes></Landscape>'
+    )
+    return _landscape
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that the catalog resolves names, SIDs, servers and workspaces of a large landscape
+    """
+    # Prepare test data
+    import tempfile
+    from SapScript.Utils.systems import Systems
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        _catalog = Systems(landscape_file=_write_landscape(_tmp), use_cache=False).catalog
+
+    # Execute tests
+    assert len(_catalog) == 3002
+    _production = _catalog.resolve("PRD")
+    assert _production.name == "Production"
+    assert _production.message_server == "prd-ms.corp"
+    assert _production.router == "/H/saprouter.corp/S/3299"
+    assert (_production.workspace, _production.node) == ("Local", None)
+    assert _catalog.resolve("production") is _production
+    assert _catalog.resolve("s1") is _production
+    assert _catalog.resolve("DEV").node == "Finance"
+    assert [r.name for r in _catalog.workspace("Local", "Finance")] == ["DEV"]
+    assert len(_catalog.workspace("Local")) == 2
+    assert [r.name for r in _catalog.server("ERP17.corp")] == ["ERP 0017"]
+    assert [r.name for r in _catalog.server("erp17.corp:3217")] == ["ERP 0017"]
+    assert len(_catalog.by_sid["E07"]) == 60
+    assert _catalog.resolve("NOPE") is None
+    assert "dev" in _catalog and "NOPE" not in _catalog
+    assert not hasattr(_production, "__dict__")
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test prefix and glob searches over names and other fields
+    """
+    # Prepare test data
+    import tempfile
+    from SapScript.Utils.systems import Systems
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        _catalog = Systems(landscape_file=_write_landscape(_tmp, services=120), use_cache=False).catalog
+
+    # Execute tests
+    assert [r.name for r in _catalog.search("erp 001*")] == [f"ERP {i:04d}" for i in range(10, 20)]
+    assert [r.name for r in _catalog.prefix("ERP 011")] == [f"ERP {i:04d}" for i in range(110, 120)]
+    assert [r.name for r in _catalog.search("*uct*")] == ["Production"]
+    assert [r.name for r in _catalog.search("ERP 00?7")] == [f"ERP 00{i}7" for i in range(10)]
+    assert [r.name for r in _catalog.search("dev")] == ["DEV"]
+    assert len(_catalog.search("*")) == 122
+    assert len(_catalog.search("E0[12]", field="sid")) == 6
+    assert [r.name for r in _catalog.search("dev.*", field="server")] == ["DEV"]
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that SAP connects to the SAP Logon entry a SID resolves to through the catalog
+    """
+    # Prepare test data
+    from SapScript.Backend import SimulatorBackend
+    from SapScript.Core.sap import SAP
+    from SapScript.Utils.catalog import SystemCatalog, SystemRecord
+
+    _sim = SimulatorBackend(systems=["Development", "Production"])
+    _catalog = SystemCatalog([SystemRecord("s0", "Development", "DEV"), SystemRecord("s1", "Production", "PRD")])
+
+    # Execute tests
+    _sap = SAP("PRD", backend=_sim, catalog=_catalog)
+    assert _sap.system.name == "Production"
+    assert _sap.connection.Description == "Production"
+    assert _sap.session.Info.SystemName == "Production"
+    _again = SAP("production", backend=_sim, catalog=_catalog)
+    assert _again.connection.Id == _sap.connection.Id
+    assert SAP("DEV", backend=_sim, catalog=_catalog).connection.Id == "/app/con[1]"
+    assert not SAP("QAS", backend=_sim, catalog=_catalog).get_connection().ok
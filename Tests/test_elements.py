@@ -0,0 +1,210 @@
+def _simulated_screen() -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen("ZPROP", "SAPLZPROP", 100, elements=[Field("txtNAME", text="ABC"), Field("txtCITY", text="Berlin")]),
+        transaction="ZPROP",
+    )
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZPROP")
+    return _sap, _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that fetch reads each property once and later reads are served from the record
+    """
+    from SapScript.Gui.elements import DEFAULT_PROPERTIES, GuiElement, fetch_stats
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _element = GuiElement(_sap.session.findById("wnd[0]/usr/txtNAME"))
+    fetch_stats.reset()
+
+    # Execute tests
+    _sim.reset_counters()
+    for _ in range(3):
+        [getattr(_element, p) for p in DEFAULT_PROPERTIES]
+    assert _sim.total_calls == 3 * len(DEFAULT_PROPERTIES)
+    _sim.reset_counters()
+    _record = _element.fetch()
+    for _ in range(3):
+        _values = [getattr(_element, p) for p in DEFAULT_PROPERTIES]
+    assert _sim.total_calls == len(DEFAULT_PROPERTIES)
+    assert _values[:4] == ["/app/con[0]/ses[0]/wnd[0]/usr/txtNAME", "GuiTextField", "txtNAME", "ABC"]
+    assert "text" in _record and "handle" not in _record
+    assert fetch_stats.reads == len(DEFAULT_PROPERTIES)
+    assert fetch_stats.hits == 3 * len(DEFAULT_PROPERTIES)
+    _sim.reset_counters()
+    assert _element.to_dict("text", "handle") == {"text": "ABC", "handle": 0}
+    assert _sim.total_calls == 1
+    try:
+        _element.fetch("bogus")
+        assert False
+    except ValueError as _:
+        pass
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that the record follows writes and is dropped by refresh and round trips
+    """
+    from SapScript.Gui.elements import GuiElement
+
+    # Prepare test data
+    _sap, _sim = _simulated_screen()
+    _element = _sap.get_element("wnd[0]/usr/txtNAME", cached=True).value
+    _element.fetch("text", "changeable")
+
+    # Execute tests
+    _element.text = "XYZ"
+    assert _element.text == "XYZ"
+    _element.element.Text = "changed behind the record"
+    assert _element.text == "XYZ"
+    _element.refresh()
+    assert _element.text == "changed behind the record"
+    _element.fetch("text")
+    _element.element.Text = "after round trip"
+    _sap.send_key("ENTER")
+    assert _element.text == "after round trip"
+    _other = GuiElement(_sap.session.findById("wnd[0]/usr/txtNAME"))
+    _other.fetch("id")
+    _element.fetch("id")
+    _sim.reset_counters()
+    assert _element == _other
+    assert _sim.total_calls == 0
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that the fetch benchmark needs fewer calls than separate property reads
+    """
+    from Benchmarks.suite import run_benchmarks
+
+    # Prepare test data
+    _results = run_benchmarks(names=["element.properties", "element.fetch"], allocations=False)["benchmarks"]
+
+    # Execute tests
+    assert _results["element.fetch"]["calls"] * 3 == _results["element.properties"]["calls"]
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that elements specialize only when asked and read Type and SubType once
+    """
+    from SapScript.Backend import Grid, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+    from SapScript.Gui.elements import GridView, GuiElement, Statusbar, TextField, wrap_element
+
+    # Prepare test data
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen("ZGRID", "SAPLZGRID", 100, elements=[Grid("cntlGRID1/shellcont/shell", ["A", "B"], [["1", "2"]] * 60)]),
+        transaction="ZGRID",
+    )
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZGRID")
+
+    # Execute tests
+    _grid = _sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell", cached=True).value
+    assert type(_grid) is GuiElement
+    _sim.reset_counters()
+    assert not hasattr(_grid, "read_all")
+    assert _sim.calls["Type"] == 0
+    assert type(_grid) is GuiElement
+    assert _grid.specialize() is _grid
+    assert isinstance(_grid, GridView)
+    assert _grid.read_all().columns["A"][59] == "1"
+    assert (_sim.calls["Type"], _sim.calls["SubType"]) == (1, 1)
+    _grid.scroll_to_row(40)
+    _grid.scroll_to_row(50)
+    assert (_sim.calls["Type"], _sim.calls["SubType"]) == (1, 1)
+    assert _grid.element.FirstVisibleRow == 50
+    assert _sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell", cached=True).value is _grid
+    _sbar = wrap_element(_sap.session.findById("wnd[0]/sbar"))
+    assert isinstance(_sbar, Statusbar) and _sbar.message_type == ""
+    _okcd = _sap.get_element("wnd[0]/tbar[0]/okcd").value
+    try:
+        _okcd.no_such_attribute
+        assert False
+    except AttributeError as _:
+        pass
+    assert type(_okcd) is GuiElement
+    assert not isinstance(wrap_element(_sap.session.findById("wnd[0]/titl")), TextField)
+
+
+def test_5() -> None:
+    """
+    _summary_ : Test the cached type to class mapping, registrations and table control scrolling
+    """
+    from SapScript.Gui.elements import ELEMENT_CLASSES, GuiElement, TableControl, Tree, element_class, register_element_class, wrap_element
+
+    # Prepare test data
+    class _Scrollbar:
+        Position = 0
+
+    class _Cell:
+        def __init__(self, text: str) -> None:
+            self.Text = text
+
+    class _TableControl:
+        Type = "GuiTableControl"
+        RowCount = 40
+        VisibleRowCount = 10
+        VerticalScrollbar = _Scrollbar()
+
+        def GetCell(self, row: int, col: int) -> _Cell:
+            return _Cell(f"{row}:{col}")
+
+    class _ComboBox(GuiElement):
+        pass
+
+    # Execute tests
+    assert element_class("GuiShell", "Tree") is Tree
+    assert element_class("GuiShell", "Calendar") is GuiElement
+    assert element_class("GuiTableControl") is TableControl
+    register_element_class(_ComboBox, "GuiComboBox")
+    try:
+        assert element_class("GuiComboBox") is _ComboBox
+    finally:
+        del ELEMENT_CLASSES["GuiComboBox"]
+    _table = wrap_element(_TableControl())
+    assert type(_table) is TableControl
+    assert (_table.row_count, _table.visible_row_count) == (40, 10)
+    assert _table.get_cell_value(2, 1) == "2:1"
+    _table.scroll_to_row(12)
+    assert _TableControl.VerticalScrollbar.Position == 12
+
+
+def test_6() -> None:
+    """
+    _summary_ : Test that get_element returns the specialized wrapper when asked, cached or not
+    """
+    from SapScript.Backend import Grid, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+    from SapScript.Gui.elements import GridView, GuiElement, TextField
+
+    # Prepare test data
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen("ZGRID", "SAPLZGRID", 100, elements=[Grid("cntlGRID1/shellcont/shell", ["A"], [["1"]] * 3)]),
+        transaction="ZGRID",
+    )
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZGRID")
+    _id = "wnd[0]/usr/cntlGRID1/shellcont/shell"
+
+    # Execute tests
+    _sim.reset_counters()
+    assert type(_sap.get_element(_id).value) is GuiElement
+    assert _sim.calls["Type"] == 0
+    _grid = _sap.get_element(_id, specialize=True).value
+    assert isinstance(_grid, GridView)
+    assert _grid.read_all().columns["A"] == ["1", "1", "1"]
+    _cached = _sap.get_element(_id, cached=True, specialize=True).value
+    assert isinstance(_cached, GridView)
+    assert _sap.get_element(_id, cached=True, specialize=True).value is _cached
+    assert isinstance(_sap.get_element("wnd[0]/tbar[0]/okcd", specialize=True).value, GuiElement)
+    assert not isinstance(_sap.get_element("wnd[0]/titl", specialize=True).value, TextField)
@@ -0,0 +1,147 @@
+class SimulatedSession:
+    """
+    _summary_ : Stand-in for a GuiSession COM object whose transactions take a fixed time
+
+    intervals records the start and end of every transaction across all sessions.
+    """
+
+    intervals: list[tuple[float, float]] = []
+
+    def __init__(self, number: int, latency: float = 0.0) -> None:
+        self.Id = f"/app/con[0]/ses[{number}]"
+        self.Parent = None
+        self.latency = latency
+        self.transactions: list[str] = []
+
+    def findById(self, id: str) -> object:
+        return f"{self.Id}/{id}"
+
+    def StartTransaction(self, Transaction: str) -> None:
+        import time
+
+        _start = time.perf_counter()
+        time.sleep(self.latency)
+        SimulatedSession.intervals.append((_start, time.perf_counter()))
+        self.transactions.append(Transaction)
+
+
+class SimulatedConnection:
+    """
+    _summary_ : Stand-in for a GuiConnection COM object that opens sessions on CreateSession
+    """
+
+    class _Children:
+        def __init__(self, connection: "SimulatedConnection") -> None:
+            self._connection = connection
+
+        @property
+        def Count(self) -> int:
+            return len(self._connection.sessions)
+
+        def __call__(self, index: int) -> SimulatedSession:
+            _session = self._connection.sessions[index]
+            _session.CreateSession = self._connection.create_session
+            return _session
+
+    def __init__(self) -> None:
+        self.sessions = [SimulatedSession(0)]
+        self.Children = SimulatedConnection._Children(self)
+
+    def create_session(self) -> None:
+        self.sessions.append(SimulatedSession(len(self.sessions)))
+
+
+def _peak_overlap(intervals: list[tuple[float, float]]) -> int:
+    """
+    _summary_ : Returns the largest number of intervals that run at the same time
+    """
+    _events = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    _active = _peak = 0
+    for _, _delta in _events:
+        _active += _delta
+        _peak = max(_peak, _active)
+    return _peak
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that jobs run across all sessions and results come back in job order
+    """
+    # Prepare test data
+    from SapScript.Core.executor import Job, SessionExecutor
+
+    _sessions = [SimulatedSession(i, latency=0.01) for i in range(3)]
+    _executor = SessionExecutor(sessions=_sessions, sid="TST")
+    _jobs = [Job(f"ZT{i:02d}", [lambda sap, i=i: (sap.session.Id, i)]) for i in range(9)]
+
+    # Execute tests
+    _results = _executor.run(_jobs)
+    assert all(r.ok for r in _results)
+    assert [r.value[0][1] for r in _results] == list(range(9))
+    assert sum(_executor.jobs_per_session) == 9
+    assert sorted(t for s in _sessions for t in s.transactions) == [f"ZT{i:02d}" for i in range(9)]
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that jobs on several simulated sessions with artificial latency overlap in time
+    """
+    # Prepare test data
+    from SapScript.Core.executor import Job, SessionExecutor
+
+    _jobs = [Job("VA02") for _ in range(12)]
+
+    # Execute tests
+    SimulatedSession.intervals = []
+    _serial = SessionExecutor(sessions=[SimulatedSession(0, latency=0.05)])
+    _serial.run(_jobs)
+    assert _peak_overlap(SimulatedSession.intervals) == 1
+    assert _serial.jobs_per_session == [12]
+
+    SimulatedSession.intervals = []
+    _sessions = [SimulatedSession(i, latency=0.05) for i in range(4)]
+    _parallel = SessionExecutor(sessions=_sessions)
+    _parallel.run(_jobs)
+    assert _peak_overlap(SimulatedSession.intervals) > 1
+    assert sum(_parallel.jobs_per_session) == 12
+    assert sum(len(s.transactions) for s in _sessions) == 12
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that failing steps and broken sessions surface as per-job error Results
+    """
+    # Prepare test data
+    from SapScript.Core.executor import Job, SessionExecutor
+
+    def _broken(session: object, sid: str) -> object:
+        raise RuntimeError("session lost")
+
+    # Execute tests
+    _results = SessionExecutor(sessions=[SimulatedSession(0)]).run([Job("MM02", [lambda sap: 1 / 0]), Job("MM03")])
+    assert not _results[0].ok
+    assert isinstance(_results[0].error, ZeroDivisionError)
+    assert _results[1].ok
+
+    _executor = SessionExecutor(sessions=[SimulatedSession(0)], handle_factory=_broken)
+    _results = _executor.run([Job("MM03")])
+    assert not _results[0].ok
+    assert not _executor.session_errors[0].ok
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test opening sessions on a connection and running jobs asynchronously
+    """
+    # Prepare test data
+    import asyncio
+    from SapScript.Core.executor import Job, SessionExecutor
+
+    _connection = SimulatedConnection()
+
+    # Execute tests
+    _executor = SessionExecutor.from_connection(_connection, sessions=4, sid="TST")
+    assert len(_executor.sessions) == 4
+    _results = asyncio.run(_executor.run_async([Job("SE16") for _ in range(8)]))
+    assert len(_results) == 8
+    assert all(r.ok for r in _results)
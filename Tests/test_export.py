@@ -0,0 +1,88 @@
+def test_1() -> None:
+    """
+    _summary_ : Test streaming a table to CSV and JSON Lines in fixed-size batches
+    """
+    # Prepare test data
+    import csv
+    import json
+    import tempfile
+    from pathlib import Path
+    from SapScript.Export import export_table
+    from SapScript.Gui.elements import GuiElement, Table
+    from Tests.test_table import FakeGrid
+
+    _table = Table(element=GuiElement(element=FakeGrid(rows=25, columns=3, visible_rows=10)))
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        # Execute tests
+        _stats = export_table(_table, Path(_tmp) / "grid.csv", batch_rows=10)
+        assert _stats.format == "csv"
+        assert _stats.rows == 25
+        assert _stats.batches == 3
+        assert _stats.rows_per_second > 0
+        with open(_stats.path, newline="") as f:
+            _rows = list(csv.reader(f))
+        assert _rows[0] == ["COL0", "COL1", "COL2"]
+        assert _rows[25] == ["24:COL0", "24:COL1", "24:COL2"]
+
+        _stats = export_table(_table, Path(_tmp) / "grid.jsonl", columns=["COL2", 0], use_titles=True)
+        with open(_stats.path) as f:
+            _lines = [json.loads(line) for line in f]
+        assert len(_lines) == 25
+        assert _lines[3] == {"Title COL2": "3:COL2", "Title COL0": "3:COL0"}
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test exporting a table to Parquet and Arrow when pyarrow is installed
+    """
+    # Prepare test data
+    import tempfile
+    from pathlib import Path
+    import pytest
+    from SapScript.Export import export_table
+    from SapScript.Gui.elements import GuiElement, Table
+    from Tests.test_table import FakeGrid
+
+    pytest.importorskip("pyarrow")
+    from pyarrow import ipc, parquet
+
+    _table = Table(element=GuiElement(element=FakeGrid(rows=25, columns=2, visible_rows=10)))
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        # Execute tests
+        _stats = export_table(_table, Path(_tmp) / "grid.parquet", batch_rows=10)
+        _parquet = parquet.read_table(_stats.path)
+        assert _parquet.num_rows == 25
+        assert _parquet.column_names == ["COL0", "COL1"]
+        assert parquet.ParquetFile(_stats.path).num_row_groups == 3
+
+        _stats = export_table(_table, Path(_tmp) / "grid.arrow", batch_rows=10)
+        _arrow = ipc.open_file(str(_stats.path)).read_all()
+        assert _arrow.column("COL1").to_pylist()[24] == "24:COL1"
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that an unknown export format is rejected and writers must implement the batch interface
+    """
+    # Prepare test data
+    import tempfile
+    from pathlib import Path
+    import pytest
+    from SapScript.Export import export_table
+    from SapScript.Export.writers import BatchWriter
+    from SapScript.Gui.elements import GuiElement, Table
+    from Tests.test_table import FakeGrid
+
+    _table = Table(element=GuiElement(element=FakeGrid(rows=1, columns=1)))
+
+    # Execute tests
+    with pytest.raises(ValueError):
+        export_table(_table, "grid.xlsx")
+    with pytest.raises(ValueError):
+        export_table(_table, "grid.csv", fmt="xlsx")
+    with tempfile.TemporaryDirectory() as _tmp:
+        assert export_table(_table, Path(_tmp) / "grid.txt", fmt="csv").format == "csv"
+    with pytest.raises(TypeError):
+        BatchWriter("grid.csv", ["COL0"])
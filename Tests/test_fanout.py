@@ -0,0 +1,122 @@
+class FakeSAP:
+    """
+    _summary_ : Stand-in for a SAP instance created by an injected backend factory in the worker process
+    """
+
+    def __init__(self, sid: str) -> None:
+        import os
+
+        self.sid = sid
+        self.pid = os.getpid()
+        self.transactions: list[str] = []
+
+    def start_transaction(self, value: str) -> object:
+        from SapScript.Core.result import Result
+
+        self.transactions.append(value)
+        return Result(message=f"Transaction {value} started.")
+
+
+def fake_factory(sid: str) -> FakeSAP:
+    if sid == "BAD":
+        raise ConnectionError(f"Cannot connect to {sid}")
+    return FakeSAP(sid)
+
+
+def job_identity(sap: FakeSAP) -> tuple[str, int]:
+    return sap.sid, sap.pid
+
+
+def job_fail(sap: FakeSAP) -> None:
+    raise ValueError("posting failed")
+
+
+def job_crash(sap: FakeSAP) -> None:
+    import os
+
+    os._exit(3)
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that (sid, job) items fan out to worker processes that each own the SAP instance of their sids
+    """
+    # Prepare test data
+    from SapScript.Core.fanout import ProcessRunner
+
+    _runner = ProcessRunner(processes=2, sap_factory=fake_factory, queue_size=2)
+    _items = [(sid, job_identity) for _ in range(10) for sid in ("DEV", "QAS", "PRD")]
+
+    # Execute tests
+    _results = list(_runner.run(_items))
+    assert sorted(i for i, _, _ in _results) == list(range(30))
+    assert all(r.ok for _, _, r in _results)
+    _pids = {sid: {r.value[1] for _, s, r in _results if s == sid} for sid in ("DEV", "QAS", "PRD")}
+    assert all(len(p) == 1 for p in _pids.values())
+    assert _pids["DEV"] == _pids["PRD"]
+    assert _pids["DEV"] != _pids["QAS"]
+    assert sum(s.jobs for s in _runner.worker_stats) == 30
+    assert sorted(s.sids for s in _runner.worker_stats) == [["DEV", "PRD"], ["QAS"]]
+    assert all(s.jobs_per_second > 0 for s in _runner.worker_stats)
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that failing jobs, Job objects and unreachable systems come back as Results
+    """
+    # Prepare test data
+    from SapScript.Core.executor import Job
+    from SapScript.Core.fanout import ProcessRunner
+
+    _runner = ProcessRunner(processes=2, sap_factory=fake_factory)
+    _items = [("DEV", job_fail), ("BAD", job_identity), ("DEV", Job("VA01"))]
+
+    # Execute tests
+    _results = {i: r for i, _, r in _runner.run(_items)}
+    assert isinstance(_results[0].error, ValueError)
+    assert isinstance(_results[1].error, ConnectionError)
+    assert _results[2].ok
+    assert sum(s.errors for s in _runner.worker_stats) == 2
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that a job that cannot be pickled comes back as a failed Result instead of being dropped
+    """
+    # Prepare test data
+    from SapScript.Core.fanout import ProcessRunner
+
+    _runner = ProcessRunner(processes=1, sap_factory=fake_factory)
+    _items = [("DEV", job_identity), ("DEV", lambda sap: 1), ("DEV", job_identity)]
+
+    # Execute tests
+    _results = {i: r for i, _, r in _runner.run(_items)}
+    assert sorted(_results) == [0, 1, 2]
+    assert _results[0].ok and _results[2].ok
+    assert not _results[1].ok
+    assert isinstance(_results[1].error, TypeError)
+    assert sum(s.jobs for s in _runner.worker_stats) == 2
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that the running and queued jobs of a crashed worker come back as failed Results
+    """
+    # Prepare test data
+    import os
+    from SapScript.Core.fanout import ProcessRunner
+
+    _runner = ProcessRunner(processes=2, sap_factory=fake_factory, queue_size=2)
+    _items = [("DEV", job_identity), ("DEV", job_crash)] + [("DEV", job_identity)] * 6 + [("QAS", job_identity)] * 4
+
+    # Execute tests
+    _results = {}
+    for _index, _sid, _result in _runner.run(_items):
+        assert _index not in _results
+        _results[_index] = _result
+    assert sorted(_results) == list(range(12))
+    # The result of job 0 may still be in the crashed worker's queue buffer and be lost with it
+    assert all(not _results[i].ok for i in range(1, 8))
+    assert all(_results[i].ok for i in range(8, 12))
+    _crashed = next(s for s in _runner.worker_stats if s.errors)
+    assert _crashed.pid not in (None, os.getpid())
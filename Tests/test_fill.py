@@ -0,0 +1,80 @@
+def _simulated_sap() -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen(
+            "ZMASS",
+            "SAPLZMASS",
+            100,
+            elements=[Field(f"txtFIELD{i:02}") for i in range(20)] + [Field("txtLOCKED", text="X", changeable=False)],
+        ),
+        transaction="ZMASS",
+    )
+    _sap = SAP("DEV", backend=_sim)
+    _sap.start_transaction("ZMASS")
+    return _sap, _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that fill writes every field, sends the commit key and reports the COM calls it made
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+    _values = {f"wnd[0]/usr/txtFIELD{i:02}": i for i in range(20)}
+
+    # Execute tests
+    _sim.reset_counters()
+    _result = _sap.fill(_values, commit_key="ENTER")
+    assert _result.ok
+    _stats = _result.value
+    assert (_stats.fields, _stats.written, _stats.skipped) == (20, 20, 0)
+    assert _sim.calls["findById"] == 20
+    assert _sim.calls["Changeable"] == 20
+    assert _sim.calls["sendVKey"] == 1
+    assert _sap.session.findById("wnd[0]/usr/txtFIELD07").Text == "7"
+    assert _stats.com_calls == 83
+    assert _stats.com_calls_saved == -23
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that repeated fills of the same screen reuse ids and changeability and skip matching fields
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+    _values = {f"wnd[0]/usr/txtFIELD{i:02}": "A" for i in range(20)}
+    _sap.fill(_values, commit_key="ENTER")
+
+    # Execute tests
+    _sim.reset_counters()
+    _values["wnd[0]/usr/txtFIELD03"] = "B"
+    _stats = _sap.fill(_values, commit_key="ENTER").value
+    assert (_stats.written, _stats.skipped) == (1, 19)
+    assert _sim.calls["findById"] == 0
+    assert _sim.calls["Changeable"] == 0
+    assert _stats.com_calls == 24
+    assert _stats.com_calls_saved == 36
+    _sim.reset_counters()
+    _stats = _sap.fill(_values, skip_unchanged=False).value
+    assert (_stats.written, _stats.com_calls) == (20, 23)
+    assert _stats.com_calls == _sim.total_calls
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that writing a non-changeable field fails unless it already holds the value
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+
+    # Execute tests
+    assert _sap.fill({"wnd[0]/usr/txtLOCKED": "X"}).value.skipped == 1
+    _result = _sap.fill({"wnd[0]/usr/txtFIELD00": "1", "wnd[0]/usr/txtLOCKED": "Y"}, commit_key="ENTER")
+    assert not _result.ok
+    assert isinstance(_result.error, ValueError)
+    assert _result.value.written == 1
+    assert "txtLOCKED" in _result.message
+    assert _sim.calls["sendVKey"] == 0
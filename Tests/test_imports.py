@@ -0,0 +1,93 @@
+#: Microseconds `import SapScript` may take, generous so slow CI machines pass
+IMPORT_BUDGET_US: int = 50000
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    _run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    _times = {}
+    for _line in _run.stderr.splitlines():
+        if _line.startswith("import time:") and "|" in _line:
+            _, _cumulative, _name = _line[len("import time:") :].split("|")
+            if _cumulative.strip().isdigit():
+                _times[_name.strip()] = int(_cumulative)
+    return _times
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that import SapScript stays within its time budget and imports none of the heavy modules
+    """
+    # Prepare test data
+    _times = _import_times("import SapScript")
+
+    # Execute tests
+    assert _times["SapScript"] < IMPORT_BUDGET_US
+    for _module in ("SapScript.Core.sap", "SapScript.Utils.systems", "SapScript.Backend", "dotenv", "win32com"):
+        assert _module not in _times, _module
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that importing SAP defers dotenv, win32com, the simulator and the instrumentation
+    """
+    # Prepare test data
+    # Modules loaded through importlib.import_module are not timed, so SAP's module is imported directly
+    _times = _import_times("import SapScript.Core.sap")
+
+    # Execute tests
+    assert "SapScript.Core.sap" in _times
+    for _module in ("dotenv", "win32com", "urllib.request", "SapScript.Backend.simulator", "SapScript.Backend.instrument"):
+        assert _module not in _times, _module
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that the lazy names resolve and that the config is read once per process and path
+    """
+    import os
+    import tempfile
+    from pathlib import Path
+    import SapScript
+    from SapScript.Core.sap import SAP
+    from SapScript.Utils.config import load_config
+
+    # Prepare test data
+    _cwd = os.getcwd()
+
+    # Execute tests
+    assert SapScript.SAP is SAP
+    assert {"SAP", "VKeys", "Systems", "Core"} <= set(dir(SapScript))
+    try:
+        SapScript.NoSuchName
+        assert False
+    except AttributeError as _:
+        pass
+    with tempfile.TemporaryDirectory() as _tmp:
+        Path(_tmp, ".env").write_text("SAP_USER=ALICE\n")
+        os.chdir(_tmp)
+        try:
+            _config = load_config()
+            assert _config["SAP_USER"] == "ALICE"
+            Path(_tmp, ".env").write_text("SAP_USER=BOB\n")
+            assert load_config() is _config
+            assert load_config(Path(_tmp) / ".env") is _config
+            try:
+                _config["SAP_USER"] = "EVE"
+                assert False
+            except TypeError as _:
+                pass
+            load_config.cache_clear()
+            assert load_config()["SAP_USER"] == "BOB"
+        finally:
+            os.chdir(_cwd)
+            load_config.cache_clear()
@@ -0,0 +1,108 @@
+def _simulator() -> object:
+    from SapScript.Backend import Field, Grid, SimScreen, SimulatorBackend
+
+    _sim = SimulatorBackend(member_latency={"sendVKey": 0.002})
+    _sim.add_screen(
+        SimScreen(
+            "VA02_INITIAL",
+            "SAPMV45A",
+            102,
+            elements=[Field("ctxtVBAK-VBELN"), Grid("cntlGRID1/shellcont/shell", ["POSNR", "MATNR"], 5)],
+        ),
+        transaction="VA02",
+    )
+    return _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that the instrumented backend records every scripting call with its element id
+    """
+    # Prepare test data
+    from SapScript.Backend import Instrumentation, InstrumentedBackend, SummarySink
+    from SapScript.Core.sap import SAP
+    from SapScript.Gui.elements import Table
+
+    _sim = _simulator()
+    _instrumentation = Instrumentation([SummarySink()])
+    _sap = SAP("DEV", backend=InstrumentedBackend(_sim, _instrumentation))
+
+    # Execute tests
+    _sim.reset_counters()
+    _summary = _instrumentation.summary
+    _calls = _summary.calls
+    _sap.start_transaction("VA02")
+    _sap.get_element("wnd[0]/usr/ctxtVBAK-VBELN").value.text = "4711"
+    _table = Table(element=_sap.get_element("wnd[0]/usr/cntlGRID1/shellcont/shell").value)
+    assert len(_table.read_all()) == 5
+    assert _summary.calls - _calls == _sim.total_calls
+    assert _summary.by_site[("wnd[0]/usr/ctxtVBAK-VBELN", "Text")].count == 1
+    assert _summary.by_site[("wnd[0]/usr/cntlGRID1/shellcont/shell", "GetCellValue")].count == 10
+    assert _summary.by_member["StartTransaction"].count == 1
+    assert _sap.session.Info.Transaction == "VA02"
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that sap.profile instruments only the block, reports the slowest call sites and writes a trace
+    """
+    # Prepare test data
+    import io
+    import json
+    import tempfile
+    from pathlib import Path
+    from SapScript.Backend import JsonLinesSink
+    from SapScript.Backend.instrument import InstrumentedObject
+    from SapScript.Core.sap import SAP
+
+    _sap = SAP("DEV", backend=_simulator())
+    _output = io.StringIO()
+
+    # Execute tests
+    with tempfile.TemporaryDirectory() as _tmp:
+        _trace = Path(_tmp) / "trace.jsonl"
+        with _sap.profile(top=3, sinks=[JsonLinesSink(_trace)], file=_output) as _instrumentation:
+            assert isinstance(_sap.session, InstrumentedObject)
+            _sap.start_transaction("VA02")
+            for _ in range(3):
+                _sap.send_key("ENTER")
+            _sap.fill({"wnd[0]/usr/ctxtVBAK-VBELN": "1"})
+        _events = [json.loads(line) for line in _trace.read_text().splitlines()]
+    assert not isinstance(_sap.session, InstrumentedObject)
+    _top = _instrumentation.summary.top(1)[0]
+    assert _top[0] == ("window", "sendVKey")
+    assert _top[1].count == 3
+    assert _top[1].percentile(50) >= 0.002
+    assert len(_events) == _instrumentation.summary.calls
+    assert {"time", "member", "id", "kind", "seconds", "error"} == set(_events[0])
+    _report = _output.getvalue().splitlines()
+    assert len(_report) == 2 + 3
+    assert _report[2].endswith("window.sendVKey")
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that errors are recorded, a disabled instrumentation records nothing and histograms bucket latencies
+    """
+    # Prepare test data
+    import pytest
+    from SapScript.Backend import Histogram, Instrumentation, SummarySink
+    from SapScript.Backend.instrument import instrument
+
+    _sim = _simulator()
+    _instrumentation = Instrumentation([SummarySink()])
+    _session = instrument(_sim.connect("DEV").Children(0), _instrumentation, "session")
+
+    # Execute tests
+    with pytest.raises(Exception):
+        _session.findById("wnd[0]/usr/txtMISSING")
+    assert _instrumentation.summary.errors == 1
+    _instrumentation.enabled = False
+    assert _session.findById("wnd[0]/titl").Text == "SAP Easy Access"
+    assert _instrumentation.summary.calls == 1
+    _histogram = Histogram()
+    for _seconds in (0.000001, 0.0001, 0.0001, 0.01):
+        _histogram.observe(_seconds)
+    assert _histogram.count == 4
+    assert _histogram.percentile(50) <= 0.000128
+    assert _histogram.percentile(100) == 0.01
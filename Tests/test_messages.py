@@ -0,0 +1,80 @@
+def _simulated_sap(capture_messages: bool = True) -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(SimScreen("ZORDER", "SAPLZORDER", 100, elements=[Field("txtORDER")], keys={0: "ZSAVED"}), transaction="ZORDER")
+    _sim.add_screen(SimScreen("ZSAVED", "SAPLZORDER", 200, message=("S", "Order 4711 saved", "ZO", "001")))
+    _sim.add_screen(SimScreen("ZLOCK", "SAPLZORDER", 300, message=("E", "Order is locked", "ZO", "042"), popup="Information"), transaction="ZLOCK")
+    _sap = SAP("DEV", backend=_sim, capture_messages=capture_messages)
+    return _sap, _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that status bar messages and popups are captured after each action
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+
+    # Execute tests
+    assert _sap.start_transaction("ZORDER").ok
+    assert len(_sap.messages) == 0
+    _seq = _sap.messages.seq
+    assert _sap.send_key("ENTER").ok
+    _event = _sap.messages.last()
+    assert (_event.kind, _event.type, _event.id, _event.number, _event.text) == ("status", "S", "ZO", "001", "Order 4711 saved")
+    assert _event.action == "send_key ENTER" and not _event.is_error
+    assert _sap.messages.since(_seq) == [_event]
+    _sap.start_transaction("ZLOCK")
+    assert [e.kind for e in _sap.messages.since(_seq + 1)] == ["status", "popup"]
+    assert _sap.messages.last(kind="popup").text == "Information"
+    assert _sap.messages.last(kind="popup").window == "wnd[1]"
+    assert [e.text for e in _sap.messages.errors()] == ["Order is locked"]
+    assert _sap.messages.counts == {"S": 1, "E": 1, "popup": 1}
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that capture is off by default and costs four calls on a quiet screen
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap(capture_messages=False)
+    _sap.start_transaction("ZORDER")
+
+    # Execute tests
+    _sap.send_key("ENTER")
+    assert len(_sap.messages) == 0
+    _sap.start_transaction("ZORDER")
+    _sim.reset_counters()
+    _result = _sap.read_messages()
+    assert _result.ok and _result.value == []
+    assert _sim.total_calls == 4
+    _sap.send_key("ENTER")
+    _sim.reset_counters()
+    assert len(_sap.read_messages(popups=False).value) == 1
+    assert _sim.total_calls == 5
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that the message log is bounded and keeps counting dropped events
+    """
+    from SapScript.Core.messages import MessageLog
+
+    # Prepare test data
+    _log = MessageLog(maxsize=3)
+
+    # Execute tests
+    for _i in range(5):
+        _log.append("step", "status", "wnd[0]", "W" if _i % 2 else "E", text=f"message {_i}")
+    assert len(_log) == 3 and _log.total == 5 and _log.dropped == 2
+    assert [e.seq for e in _log] == [2, 3, 4]
+    assert [e.text for e in _log.since(1)] == ["message 2", "message 3", "message 4"]
+    assert [e.text for e in _log.since(4)] == ["message 4"]
+    assert [e.text for e in _log.filter(type="W")] == ["message 3"]
+    assert _log.counts == {"E": 3, "W": 2}
+    _log.resize(1)
+    assert [e.seq for e in _log] == [4]
+    _log.clear()
+    assert not _log and _log.total == 0
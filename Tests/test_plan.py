@@ -0,0 +1,179 @@
+def _simulated_sap() -> object:
+    from SapScript.Backend import Field, Grid, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(
+        SimScreen(
+            "VA02_INITIAL",
+            "SAPMV45A",
+            102,
+            elements=[Field("ctxtVBAK-VBELN"), Field("txtVBAK-VKORG")],
+            keys={0: "VA02_OVERVIEW"},
+        ),
+        transaction="VA02",
+    )
+    _sim.add_screen(
+        SimScreen(
+            "VA02_OVERVIEW",
+            "SAPMV45A",
+            4001,
+            elements=[Grid("cntlITEMS/shellcont/shell", ["POSNR", "MATNR"], 3)],
+            message=("S", "Order loaded"),
+        )
+    )
+    return SAP("DEV", backend=_sim), _sim
+
+
+def _change_order_plan() -> object:
+    from SapScript.Core.plan import Plan, Step
+
+    return Plan(
+        "change_order",
+        [
+            Step("transaction", code="VA02"),
+            Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value="{order}"),
+            Step("set", id="wnd[0]/usr/txtVBAK-VKORG", value=1000),
+            Step("key", key="enter"),
+            Step("read", id="wnd[0]/sbar", name="status"),
+            Step("table", id="wnd[0]/usr/cntlITEMS/shellcont/shell", name="items", columns=["MATNR"]),
+        ],
+    )
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test running a plan with parameters, outputs and per-step timings
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+    _plan = _change_order_plan()
+
+    # Execute tests
+    _result = _plan.run(_sap, {"order": "4711"})
+    assert _result.ok
+    _run = _result.value
+    assert _run.outputs == {"status": "Order loaded", "items": {"MATNR": ["0:MATNR", "1:MATNR", "2:MATNR"]}}
+    assert len(_run.timings) == 6
+    assert all(t >= 0 for t in _run.timings)
+    assert _run.failed_step is None
+    assert _plan.runs == 1
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that element ids are resolved once per screen however many steps use them
+    """
+    # Prepare test data
+    from SapScript.Core.plan import Plan, Step
+
+    _sap, _sim = _simulated_sap()
+    _sap.start_transaction("VA02")
+    _plan = Plan("fill", [Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value=str(i)) for i in range(20)])
+
+    # Execute tests
+    _sim.reset_counters()
+    for _ in range(10):
+        assert _plan.run(_sap).ok
+    assert _sim.calls["findById"] == 10
+    assert _sim.calls["Text"] == 200
+    assert len(_plan.average_step_seconds()) == 20
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that plans round-trip through JSON and are validated once when created
+    """
+    # Prepare test data
+    import tempfile
+    from pathlib import Path
+    import pytest
+    from SapScript.Core.plan import Plan, Step
+
+    _plan = _change_order_plan()
+
+    # Execute tests
+    _copy = Plan.from_json(_plan.to_json())
+    assert _copy.to_dict() == _plan.to_dict()
+    with tempfile.TemporaryDirectory() as _tmp:
+        _plan.save(Path(_tmp) / "plan.json")
+        assert Plan.load(Path(_tmp) / "plan.json").to_dict() == _plan.to_dict()
+    with pytest.raises(ValueError):
+        Plan("bad", [Step("key", key="CTRL+Q")])
+    with pytest.raises(ValueError):
+        Plan("bad", [Step("set", id="wnd[0]/usr/txtA")])
+    with pytest.raises(ValueError):
+        Plan("bad", [Step("jump")])
+    with pytest.raises(ValueError):
+        Plan("bad", [Step("read", id="a", name="x"), Step("read", id="b", name="x")])
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that a failing step is reported with its index and the timings so far
+    """
+    # Prepare test data
+    from SapScript.Core.plan import Plan, Step
+
+    _sap, _sim = _simulated_sap()
+    _plan = Plan(
+        "typo",
+        [
+            Step("transaction", code="VA02"),
+            Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value="4711"),
+            Step("set", id="wnd[0]/usr/txtVBAK-VKORGX", value="1000"),
+        ],
+    )
+
+    # Execute tests
+    _result = _plan.run(_sap)
+    assert not _result.ok
+    assert _result.value.failed_step == 2
+    assert "step 2 (set)" in _result.message
+    assert _plan.runs == 0
+
+
+def test_5() -> None:
+    """
+    _summary_ : Test that empty and literal brace values are written as given and validation leaves the steps unchanged
+    """
+    # Prepare test data
+    from SapScript.Core.plan import Plan, Step
+
+    _sap, _sim = _simulated_sap()
+    _sap.start_transaction("VA02")
+    _steps = [
+        Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value=""),
+        Step("set", id="wnd[0]/usr/txtVBAK-VKORG", value=1000),
+    ]
+    _plan = Plan("clear", _steps)
+
+    # Execute tests
+    assert _steps[0].value == "" and _steps[1].value == 1000
+    assert _plan.run(_sap).ok
+    assert _sap.session.findById("wnd[0]/usr/ctxtVBAK-VBELN").Text == ""
+    assert _sap.session.findById("wnd[0]/usr/txtVBAK-VKORG").Text == "1000"
+    _plan = Plan("braces", [Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value="a{b"), Step("set", id="wnd[0]/usr/txtVBAK-VKORG", value="{{{org}}}")])
+    assert _plan.run(_sap, {"org": "1000"}).ok
+    assert _sap.session.findById("wnd[0]/usr/ctxtVBAK-VBELN").Text == "a{b"
+    assert _sap.session.findById("wnd[0]/usr/txtVBAK-VKORG").Text == "{1000}"
+
+
+def test_6() -> None:
+    """
+    _summary_ : Test that a Step shared between two plans leaves both plans runnable
+    """
+    # Prepare test data
+    from SapScript.Core.plan import Plan, Step
+
+    _sap, _sim = _simulated_sap()
+    _enter = Step("key", key="ENTER")
+    _first = Plan("first", [Step("transaction", code="VA02"), Step("set", id="wnd[0]/usr/ctxtVBAK-VBELN", value="{order}"), _enter])
+    _second = Plan("second", [Step("transaction", code="VA02"), _enter, Step("read", id="wnd[0]/sbar", name="status")])
+
+    # Execute tests
+    assert not hasattr(_enter, "_slot")
+    assert _first.run(_sap, {"order": "4711"}).ok
+    assert _second.run(_sap).value.outputs["status"] == "Order loaded"
+    assert _first.run(_sap, {"order": "4712"}).ok
+    assert _first.to_dict()["steps"][2] == {"op": "key", "key": "ENTER"}
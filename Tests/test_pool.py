@@ -0,0 +1,131 @@
+def _simulated_pool(**kwargs: object) -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.pool import SessionPool
+    from SapScript.Utils.catalog import SystemCatalog
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(SimScreen("VA02_INITIAL", "SAPMV45A", 102, elements=[Field("ctxtVBAK-VBELN")]), transaction="VA02")
+    return SessionPool(backend=_sim, catalog=SystemCatalog([]), **kwargs), _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that released sessions are reset to easy access and reused by the next lease
+    """
+    # Prepare test data
+    _pool, _sim = _simulated_pool()
+
+    # Execute tests
+    with _pool.lease("DEV") as _sap:
+        assert _sap.start_transaction("VA02").ok
+        _session_id = _sap.session.Id
+    assert _pool.idle("DEV") == 1
+    with _pool.lease("DEV") as _sap:
+        assert _sap.session.Id == _session_id
+        assert _sap.session.Info.Transaction == "SESSION_MANAGER"
+    assert (_pool.stats.leases, _pool.stats.hits, _pool.stats.misses) == (2, 1, 1)
+    assert _pool.stats.hit_rate == 0.5
+    assert _pool.stats.max_lease_seconds >= _pool.stats.average_lease_seconds > 0
+    assert len(_sim.application.Children) == 1
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that concurrent leases get their own sessions and wait for a release at the session limit
+    """
+    # Prepare test data
+    import threading
+    import time
+    import pytest
+
+    _pool, _sim = _simulated_pool(max_sessions=2)
+
+    # Execute tests
+    _first = _pool.lease("DEV")
+    _second = _pool.lease("DEV")
+    assert _first.session_id != _second.session_id
+    assert _pool.in_use("DEV") == 2
+    with pytest.raises(TimeoutError):
+        _pool.lease("DEV", timeout=0.05)
+    threading.Timer(0.05, _first.release).start()
+    _start = time.perf_counter()
+    _third = _pool.lease("DEV", timeout=2)
+    assert time.perf_counter() - _start < 1
+    assert _third.session_id == _first.session_id
+    _second.release()
+    _third.release()
+    _first.release()
+    assert _pool.stats.releases == 3
+    assert (_pool.in_use("DEV"), _pool.idle("DEV")) == (0, 2)
+    _other = _pool.lease("QAS")
+    assert _other.sap.connection.Description == "QAS"
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that idle sessions are evicted after the idle timeout and the last one closes the connection
+    """
+    # Prepare test data
+    _now = [0.0]
+    _pool, _sim = _simulated_pool(idle_timeout=60, clock=lambda: _now[0])
+    _leases = [_pool.lease("DEV") for _ in range(3)]
+    for _lease in _leases:
+        _lease.release()
+        _now[0] += 10
+
+    # Execute tests
+    assert len(_sim.application.Children(0).Children) == 3
+    assert _pool.evict_idle(now=65) == 1
+    assert _pool.idle("DEV") == 2
+    assert _pool.evict_idle(now=200) == 2
+    assert _pool.stats.evictions == 3
+    assert len(_sim.application.Children) == 0
+    with _pool.lease("DEV") as _sap:
+        assert _sap.session.Info.SystemName == "DEV"
+    assert _pool.stats.misses == 4
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that a pooled session that fails the health check is dropped and replaced
+    """
+    # Prepare test data
+    _pool, _sim = _simulated_pool()
+    with _pool.lease("DEV"):
+        pass
+    with _pool.lease("DEV") as _sap:
+        _sap.session.CreateSession()
+    _broken = _pool._idle["DEV"][0][0]
+    _broken.session.Close()
+    _connection = _sim.application.Children(0)
+    _user_id = _connection.Children(0).Id
+
+    # Execute tests
+    with _pool.lease("DEV") as _sap:
+        assert _sap.session.Id != _user_id
+    assert len(_connection.Children) == 2
+    assert _user_id in [s.Id for s in _connection.Children]
+    assert _pool.stats.health_failures == 1
+    assert _pool.idle("DEV") == 1
+
+
+def test_5() -> None:
+    """
+    _summary_ : Test that the pool never leases sessions or closes a connection it did not open
+    """
+    # Prepare test data
+    from SapScript.Core.sap import SAP
+    from SapScript.Utils.catalog import SystemCatalog
+
+    _pool, _sim = _simulated_pool()
+    _own = SAP("DEV", backend=_sim, catalog=SystemCatalog([]))
+    _foreign_id = _own.session.Id
+
+    # Execute tests
+    assert _own.connection_opened
+    with _pool.lease("DEV") as _sap:
+        assert _sap.session.Id != _foreign_id
+        assert not _sap.connection_opened
+    assert _pool.evict_idle(now=float("inf")) == 1
+    assert len(_sim.application.Children) == 1
+    assert [s.Id for s in _sim.application.Children(0).Children] == [_foreign_id]
@@ -0,0 +1,97 @@
+def test_1() -> None:
+    """
+    _summary_ : Test that Result is an immutable slotted object and successes leave the error log untouched
+    """
+    # Prepare test data
+    from SapScript.Core.result import OK, Result, error_list
+
+    _total = error_list.total
+
+    # Execute tests
+    _result = Result(value=1, message="done")
+    assert _result.ok and _result.value == 1
+    assert not hasattr(_result, "__dict__")
+    try:
+        _result.ok = False
+        assert False
+    except AttributeError:
+        pass
+    assert OK.ok and OK.value is None
+    assert error_list.total == _total
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that the error log is bounded, counts per error class and keeps no exception alive
+    """
+    # Prepare test data
+    import gc
+    import weakref
+    from SapScript.Core.result import ErrorLog, Result, error_list
+
+    class ComError(Exception):
+        pass
+
+    _log = ErrorLog(maxsize=3)
+    error_list.clear()
+
+    # Execute tests
+    for _i in range(5):
+        _log.append(ValueError(_i))
+    _log.append(KeyError("x"), "Error getting element.")
+    assert len(_log) == 3
+    assert (_log.total, _log.dropped) == (6, 3)
+    assert _log.counts == {"ValueError": 5, "KeyError": 1}
+    assert [r.text for r in _log] == ["3", "4", "'x'"]
+    assert str(_log[-1]) == "Error getting element. KeyError: 'x'"
+
+    _error = ComError("COM failure")
+    _ref = weakref.ref(_error)
+    _result = Result(error=_error, message="Error sending key.")
+    assert not _result.ok
+    del _error, _result
+    gc.collect()
+    assert _ref() is None
+    assert error_list.counts == {"ComError": 1}
+    error_list.resize(1)
+    assert error_list.maxsize == 1 and len(error_list) == 1
+    error_list.resize(1000)
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that Results survive pickling without logging their error a second time
+    """
+    # Prepare test data
+    import pickle
+    from SapScript.Core.result import Result, error_list
+
+    _result = Result(value=[1, 2], error=RuntimeError("lost"), message="Job 3 was not run.")
+    _total = error_list.total
+
+    # Execute tests
+    _copy = pickle.loads(pickle.dumps(_result))
+    assert (_copy.ok, _copy.value, _copy.message) == (False, [1, 2], "Job 3 was not run.")
+    assert isinstance(_copy.error, RuntimeError)
+    assert error_list.total == _total
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that success paths without a value return shared Results instead of allocating
+    """
+    # Prepare test data
+    from SapScript.Backend import SimulatorBackend
+    from SapScript.Core.fanout import _run_job
+    from SapScript.Core.result import OK
+    from SapScript.Core.sap import SAP
+
+    _first = SAP("DEV", backend=SimulatorBackend())
+    _second = SAP("DEV", backend=SimulatorBackend())
+
+    # Execute tests
+    assert _run_job(lambda sap: None, None) is OK
+    assert _run_job(lambda sap: 1, None).value == 1
+    _closed = _first.close_window()
+    assert _closed.ok and _closed.message == "Window closed."
+    assert _second.close_window() is _closed
@@ -0,0 +1,118 @@
+class FakeElement:
+    """
+    _summary_ : Stand-in for a GUI element COM object that counts property reads
+    """
+
+    reads = 0
+
+    def __init__(self, id: str, type: str, text: str = "", changeable: bool = False, children: list | None = None) -> None:
+        self._props = {
+            "Id": id,
+            "Type": type,
+            "Name": id.rsplit("/", 1)[-1].split("[")[0],
+            "Text": text,
+            "Changeable": changeable,
+            "ContainerType": children is not None,
+            "Children": children or [],
+        }
+
+    def __getattr__(self, name: str) -> object:
+        FakeElement.reads += 1
+        return self._props[name]
+
+
+def _fake_window(user: str = "") -> FakeElement:
+    _wnd = "/app/con[0]/ses[0]/wnd[0]"
+    return FakeElement(
+        _wnd,
+        "GuiMainWindow",
+        children=[
+            FakeElement(f"{_wnd}/titl", "GuiTitlebar", text="SAP"),
+            FakeElement(
+                f"{_wnd}/usr",
+                "GuiUserArea",
+                children=[
+                    FakeElement(f"{_wnd}/usr/txtRSYST-BNAME", "GuiTextField", text=user, changeable=True),
+                    FakeElement(f"{_wnd}/usr/pwdRSYST-BCODE", "GuiPasswordField", changeable=True),
+                    FakeElement(f"{_wnd}/usr/lblRSYST-BNAME", "GuiLabel", text="User"),
+                ],
+            ),
+            FakeElement(f"{_wnd}/sbar", "GuiStatusbar"),
+        ],
+    )
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that a snapshot captures the whole tree with id, type and name indexes
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, TextElements
+    from SapScript.Gui.snapshot import ElementSnapshot
+
+    _window = GuiElement(element=_fake_window(user="DEVELOPER"))
+
+    # Execute tests
+    _snapshot = _window.snapshot()
+    assert isinstance(_snapshot, ElementSnapshot)
+    assert len(_snapshot) == 7
+    assert not _snapshot.truncated
+    assert _snapshot.elapsed >= 0
+    _user = _snapshot.find("/app/con[0]/ses[0]/wnd[0]/usr/txtRSYST-BNAME")
+    assert _user.text == "DEVELOPER"
+    assert _user.changeable
+    assert _user.parent.id == "/app/con[0]/ses[0]/wnd[0]/usr"
+    assert [n.id for n in _snapshot.find_by_type(TextElements.GuiLabel)] == ["/app/con[0]/ses[0]/wnd[0]/usr/lblRSYST-BNAME"]
+    assert len(_snapshot.find_by_name("sbar")) == 1
+    assert len(_snapshot.text_elements()) == 5
+    assert len(_snapshot.changeable()) == 2
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test the depth and element limits of a snapshot and that lookups afterwards are local
+    """
+    # Prepare test data
+    import pytest
+    from SapScript.Gui.elements import GuiElement
+
+    _window = GuiElement(element=_fake_window())
+
+    # Execute tests
+    _snapshot = _window.snapshot(max_depth=1)
+    assert len(_snapshot) == 4
+    assert _snapshot.truncated
+    _snapshot = _window.snapshot(max_elements=3)
+    assert len(_snapshot) == 3
+    assert _snapshot.truncated
+    _snapshot = _window.snapshot(max_elements=1)
+    assert len(_snapshot) == 1
+    assert _snapshot.truncated
+    with pytest.raises(ValueError):
+        _window.snapshot(max_elements=0)
+    with pytest.raises(ValueError):
+        _window.snapshot(max_elements=-1)
+
+    _reads = FakeElement.reads
+    _snapshot.find_by_type("GuiTitlebar")
+    _snapshot.find("/app/con[0]/ses[0]/wnd[0]/usr")
+    assert FakeElement.reads == _reads
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test diffing two snapshots of the same screen
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement
+
+    _before = GuiElement(element=_fake_window()).snapshot()
+    _after = GuiElement(element=_fake_window(user="DEVELOPER")).snapshot(max_depth=1)
+
+    # Execute tests
+    _diff = _before.diff(_after)
+    assert _diff["added"] == []
+    assert len(_diff["removed"]) == 3
+    assert _diff["changed"] == []
+    _diff = _before.diff(GuiElement(element=_fake_window(user="DEVELOPER")).snapshot())
+    assert _diff["changed"] == ["/app/con[0]/ses[0]/wnd[0]/usr/txtRSYST-BNAME"]
@@ -1,16 +1,39 @@
+def _default_landscape(directory: object) -> object:
+    import os
+    from pathlib import Path
+
+    _common = Path(directory) / "SAP" / "Common"
+    _common.mkdir(parents=True)
+    _landscape = _write_landscape(directory)
+    os.replace(_landscape, _common / "SAPUILandscape.xml")
+    return _common / "SAPUILandscape.xml"
+
+
 def test_1() -> None:
     """
     _summary_ : Test instantiation of Systems class with no landscape file
     """
     # Prepare test data
-    from ..SapScript.Utils.systems import Systems
+    import os
+    import tempfile
+    from pathlib import Path
+    from SapScript.Utils.systems import Systems
 
-    # Execute test
-    _systems = Systems()
-    assert isinstance(_systems, Systems)
-    assert _systems._landscape_file is None
-    assert _systems._available_systems == None
-    assert _systems._landscape_xml is None
+    _appdata = os.environ.get("APPDATA")
+    with tempfile.TemporaryDirectory() as _tmp:
+        _landscape = _default_landscape(_tmp)
+        os.environ["APPDATA"] = _tmp
+        try:
+            # Execute test
+            _systems = Systems(cache_dir=Path(_tmp) / "cache")
+            assert isinstance(_systems, Systems)
+            assert _systems._landscape_file == _landscape
+            assert len(_systems.available_systems()) == 8
+        finally:
+            if _appdata is None:
+                del os.environ["APPDATA"]
+            else:
+                os.environ["APPDATA"] = _appdata
 
 
 def test_2() -> None:
@@ -18,19 +41,19 @@ def test_2() -> None:
     _summary_ : Test instantiation of Systems class with known working landscape file example
     """
     # Prepare test data
-    from ..SapScript.Utils.systems import Systems
-
-    # Execute tests
-    _systems = Systems(landscape_file="private\landscape.xml")
-    assert isinstance(_systems, Systems)
-    assert _systems._landscape_file == "landscape.xml"
-    assert _systems._available_systems is None
-    assert _systems._landscape_xml is None
+    import tempfile
+    from pathlib import Path
+    from SapScript.Utils.systems import Systems
 
-    # Clean up test data
-    import os
+    with tempfile.TemporaryDirectory() as _tmp:
+        _landscape = _write_landscape(_tmp)
 
-    os.remove("landscape.xml")
+        # Execute tests
+        _systems = Systems(landscape_file=str(_landscape), cache_dir=Path(_tmp) / "cache")
+        assert isinstance(_systems, Systems)
+        assert _systems._landscape_file == _landscape
+        assert _systems._includes == [(Path(_tmp) / f"include{n}.xml").as_uri() for n in range(2)]
+        assert _systems.landscape_xml_root.tag == "Landscape"
 
 
 def test_3() -> None:
@@ -38,20 +61,29 @@ def test_3() -> None:
     _summary_: Test the load_landscape method of the Systems class without providing a value for landscape_file so default is used.
     """
     # Prepare test data
-    from ..SapScript.Utils.systems import Systems
+    import os
+    import tempfile
+    import pytest
     from pathlib import Path
+    from SapScript.Utils.systems import Systems, default_landscape_file
 
-    _systems = Systems()
-    assert isinstance(_systems, Systems)
-    assert _systems._landscape_file is None
-    assert _systems._available_systems == None
-    assert _systems._landscape_xml is None
-
-    # Execute tests
-    _systems.load_landscape_file()
-    assert isinstance(_systems._landscape_xml, Path)
-    assert _systems._landscape_xml.exists()
-    assert _systems._landscape_xml.is_file()
+    _appdata = os.environ.get("APPDATA")
+    with tempfile.TemporaryDirectory() as _tmp:
+        os.environ["APPDATA"] = _tmp
+        try:
+            # Execute tests
+            assert default_landscape_file() == Path(_tmp) / "SAP" / "Common" / "SAPUILandscape.xml"
+            with pytest.raises(ValueError):
+                Systems(cache_dir=Path(_tmp) / "cache")
+            _default_landscape(_tmp)
+            _systems = Systems(cache_dir=Path(_tmp) / "cache")
+            _systems.load_landscape_file()
+            assert _systems._landscape_file.is_file()
+        finally:
+            if _appdata is None:
+                del os.environ["APPDATA"]
+            else:
+                os.environ["APPDATA"] = _appdata
 
 
 def test_4() -> None:
@@ -59,20 +91,121 @@ def test_4() -> None:
     _summary_: Test the available_systems method of the Systems class with the default landscape file.
     """
     # Prepare test data
-    from ..SapScript.Utils.systems import Systems
+    import os
+    import tempfile
     from pathlib import Path
+    from SapScript.Utils.systems import Systems
+
+    _appdata = os.environ.get("APPDATA")
+    with tempfile.TemporaryDirectory() as _tmp:
+        _default_landscape(_tmp)
+        os.environ["APPDATA"] = _tmp
+        try:
+            _systems = Systems(cache_dir=Path(_tmp) / "cache")
+
+            # Execute tests
+            _available_systems = _systems.available_systems()
+            assert isinstance(_available_systems, list)
+            assert _available_systems == ["Production", "Production 2"] + [f"INC{n} {i}" for n in range(2) for i in range(3)]
+        finally:
+            if _appdata is None:
+                del os.environ["APPDATA"]
+            else:
+                os.environ["APPDATA"] = _appdata
+
+
+def _write_landscape(directory: object, services: int = 3) -> object:
+    from pathlib import Path
+
+    _dir = Path(directory)
+    for _n in range(2):
+        (_dir / f"include{_n}.xml").write_text(
+            '<?xml version="1.0"?><Landscape><Services>'
+            + "".join(
+                f'<Service type="SAPGUI" uuid="i{_n}-{i}" name="INC{_n} {i}" systemid="I{_n}{i}" server="inc{_n}-{i}:3200"/>'
+                for i in range(services)
+            )
+            + "</Services></Landscape>"
+        )
+    _landscape = _dir / "SAPUILandscape.xml"
+    _landscape.write_text(
+        '<?xml version="1.0"?><Landscape><Workspaces><Workspace name="Local"><Item serviceid="s0"/></Workspace></Workspaces>'
+        '<Services><Service type="SAPGUI" uuid="s0" name="Production" systemid="PRD" server="prd:3200"/>'
+        '<Service type="SAPGUI" uuid="s1" name="Production 2" systemid="prd" server="prd2:3200"/></Services>'
+        "<Includes>"
+        + "".join(f'<Include url="{(_dir / f"include{_n}.xml").as_uri()}" index="{_n}"/>' for _n in range(2))
+        + "</Includes></Landscape>"
+    )
+    return _landscape
+
 
-    _systems = Systems()
-    assert isinstance(_systems, Systems)
-    assert _systems._landscape_file is None
-    assert _systems._available_systems == None
-    assert _systems._landscape_xml is None
+def test_5() -> None:
+    """
+    _summary_: Test that the landscape and its includes are parsed and indexed by name and SID.
+    """
+    # Prepare test data
+    import tempfile
+    from SapScript.Utils.systems import Systems
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        _landscape = _write_landscape(_tmp)
+
+        # Execute tests
+        _systems = Systems(landscape_file=str(_landscape), use_cache=False)
+        assert _systems.available_systems()[:3] == ["Production", "Production 2", "INC0 0"]
+        assert len(_systems.available_systems()) == 8
+        assert [s["server"] for s in _systems.by_sid["PRD"]] == ["prd:3200", "prd2:3200"]
+        assert _systems.get_service("INC1 2")["systemid"] == "I12"
+        assert _systems.get_service("i01")["name"] == "INC0 1"
+        assert _systems.get_service("NOPE") is None
+        assert _systems.parsed_files == 3
+
+
+def test_6() -> None:
+    """
+    _summary_: Test that unchanged files are served from the disk cache and changed ones are parsed again.
+    """
+    # Prepare test data
+    import os
+    import tempfile
+    from pathlib import Path
+    from SapScript.Utils.systems import Systems
+
+    with tempfile.TemporaryDirectory() as _tmp:
+        _landscape = _write_landscape(_tmp)
+        _cache = Path(_tmp) / "cache"
+
+        # Execute tests
+        _first = Systems(landscape_file=_landscape, cache_dir=_cache)
+        assert (_first.parsed_files, _first.cached_files) == (3, 0)
+        _second = Systems(landscape_file=_landscape, cache_dir=_cache)
+        assert (_second.parsed_files, _second.cached_files) == (0, 3)
+        assert _second.available_systems() == _first.available_systems()
+
+        _include = Path(_tmp) / "include1.xml"
+        _include.write_text(_include.read_text().replace("INC1 0", "CHANGED"))
+        os.utime(_include, ns=(_include.stat().st_atime_ns, _include.stat().st_mtime_ns + 1_000_000))
+        _third = Systems(landscape_file=_landscape, cache_dir=_cache)
+        assert (_third.parsed_files, _third.cached_files) == (1, 2)
+        assert "CHANGED" in _third.available_systems()
+
+
+def test_7() -> None:
+    """
+    _summary_: Test include urls with a drive letter as host and the lazily parsed landscape_xml_root.
+    """
+    # Prepare test data
+    import tempfile
+    from pathlib import Path
+    from SapScript.Utils.systems import Systems, include_path
 
     # Execute tests
-    _systems.load_landscape_file()
-    assert isinstance(_systems._landscape_xml, Path)
-    assert _systems._landscape_xml.exists()
-    assert _systems._landscape_xml.is_file()
-    _available_systems = _systems.available_systems()
-    assert isinstance(_available_systems, list)
-    print(_available_systems)
+    assert include_path("file://C:/SAP/include.xml") == include_path("file:///C:/SAP/include.xml")
+    assert include_path("file://server/share/include.xml") == Path("//server/share/include.xml")
+    with tempfile.TemporaryDirectory() as _tmp:
+        _systems = Systems(landscape_file=_write_landscape(_tmp), use_cache=False)
+        assert _systems._landscape_xml_root is None
+        _root = _systems.landscape_xml_root
+        assert _root.tag == "Landscape"
+        assert [s.attrib["name"] for s in _root.find("Services")] == ["Production", "Production 2"]
+        assert _systems.landscape_xml_root is _root
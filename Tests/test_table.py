@@ -0,0 +1,267 @@
+class FakeGrid:
+    """
+    _summary_ : Stand-in for a SAP GUI grid view COM object that counts every call made against it
+    """
+
+    def __init__(self, rows: int = 50, columns: int = 4, visible_rows: int = 20) -> None:
+        self.Id = "/app/con[0]/ses[0]/wnd[0]/usr/cntlGRID1/shellcont/shell"
+        self.Type = "GuiShell"
+        self.Changeable = False
+        self._column_ids = [f"COL{c}" for c in range(columns)]
+        self._rows = rows
+        self._visible_rows = visible_rows
+        self._first_visible_row = 0
+        self.calls = 0
+
+    @property
+    def RowCount(self) -> int:
+        self.calls += 1
+        return self._rows
+
+    @property
+    def ColumnCount(self) -> int:
+        self.calls += 1
+        return len(self._column_ids)
+
+    @property
+    def VisibleRowCount(self) -> int:
+        self.calls += 1
+        return self._visible_rows
+
+    @property
+    def ColumnOrder(self) -> list[str]:
+        self.calls += 1
+        return list(self._column_ids)
+
+    @property
+    def FirstVisibleRow(self) -> int:
+        self.calls += 1
+        return self._first_visible_row
+
+    @FirstVisibleRow.setter
+    def FirstVisibleRow(self, value: int) -> None:
+        self.calls += 1
+        self._first_visible_row = value
+
+    def GetCellValue(self, row: int, column: str) -> str:
+        self.calls += 1
+        return f"{row}:{column}"
+
+    def GetDisplayedColumnTitle(self, column: str) -> str:
+        self.calls += 1
+        return f"Title {column}"
+
+    def GetCellWidth(self, row: int, column: str) -> int:
+        self.calls += 1
+        return 10
+
+    def GetColumnDataType(self, column: str) -> str:
+        self.calls += 1
+        return "C"
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that read_all returns every cell as columnar data
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table, TableData
+
+    _grid = FakeGrid(rows=45, columns=3, visible_rows=20)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    _data = _table.read_all()
+    assert isinstance(_data, TableData)
+    assert len(_data) == 45
+    assert list(_data.columns) == ["COL0", "COL1", "COL2"]
+    assert _data["COL1"][0] == "0:COL1"
+    assert _data["COL2"][44] == "44:COL2"
+    assert list(_data.rows())[3] == ("3:COL0", "3:COL1", "3:COL2")
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that read_all reports the COM calls it made and needs fewer than the per-cell path
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _grid = FakeGrid(rows=45, columns=3, visible_rows=20)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    _data = _table.read_all()
+    assert _data.com_calls == _grid.calls
+    _bulk_calls = _grid.calls
+
+    _grid.calls = 0
+    _rows = [_table.get_row_data(i) for i in range(_table.rows_count)]
+    assert [list(r.values()) for r in _rows] == list(list(r) for r in _data.rows())
+    assert _bulk_calls < _grid.calls
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test read_all with a column subset, column indices and an explicit chunk size
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _grid = FakeGrid(rows=10, columns=4, visible_rows=20)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    _data = _table.read_all(columns=["COL3", 0], chunk_rows=4)
+    assert list(_data.columns) == ["COL3", "COL0"]
+    assert _data["COL0"] == [f"{r}:COL0" for r in range(10)]
+    assert _grid._first_visible_row == 8
+    # ColumnOrder + RowCount + one scroll per chunk + one read per cell
+    assert _data.com_calls == 2 + 3 + 2 * 10
+
+
+class LazyFakeGrid(FakeGrid):
+    """
+    _summary_ : Grid stand-in that only loads rows once they have been scrolled into view, with per-call latency
+    """
+
+    def __init__(self, rows: int = 50, columns: int = 4, visible_rows: int = 20, latency: float = 0.0) -> None:
+        super().__init__(rows=rows, columns=columns, visible_rows=visible_rows)
+        self._loaded: set[int] = set(range(min(rows, visible_rows)))
+        self._latency = latency
+        self.scrolls = 0
+
+    @property
+    def FirstVisibleRow(self) -> int:
+        self.calls += 1
+        return self._first_visible_row
+
+    @FirstVisibleRow.setter
+    def FirstVisibleRow(self, value: int) -> None:
+        import time
+
+        self.calls += 1
+        self.scrolls += 1
+        time.sleep(self._latency)
+        self._first_visible_row = value
+        self._loaded.update(range(value, min(value + self._visible_rows, self._rows)))
+
+    def GetCellValue(self, row: int, column: str) -> str:
+        self.calls += 1
+        if row not in self._loaded:
+            return ""
+        return f"{row}:{column}"
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that iter_rows scrolls once per visible window and reads rows the plain per-row path misses
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _grid = LazyFakeGrid(rows=95, columns=2, visible_rows=20)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    assert _table.get_row_data(50) == {"COL0": "", "COL1": ""}
+    _rows = list(_table.iter_rows())
+    assert len(_rows) == 95
+    assert all(all(v) for v in _rows)
+    assert _rows[94] == ("94:COL0", "94:COL1")
+    assert _grid.scrolls == 5
+
+
+def test_5() -> None:
+    """
+    _summary_ : Test the start/stop/step slice API of iter_rows for splitting one grid across jobs
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _table = Table(element=GuiElement(element=LazyFakeGrid(rows=30, columns=1, visible_rows=10)))
+
+    # Execute tests
+    _even = [r[0] for r in _table.iter_rows(0, None, 2)]
+    _odd = [r[0] for r in _table.iter_rows(1, None, 2)]
+    assert sorted(_even + _odd, key=lambda v: int(v.split(":")[0])) == [f"{r}:COL0" for r in range(30)]
+    assert [r[0] for r in _table.iter_rows(5, 8)] == ["5:COL0", "6:COL0", "7:COL0"]
+    assert [r[0] for r in _table.iter_rows(29, 24, -2)] == ["29:COL0", "27:COL0", "25:COL0"]
+    assert list(_table.iter_rows(columns=[0]))[-1] == ("29:COL0",)
+
+
+def test_6() -> None:
+    """
+    _summary_ : Benchmark iter_rows against scrolling to every row on a simulated lazy-loading grid
+    """
+    # Prepare test data
+    import time
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _rows, _latency = 400, 0.001
+
+    # Execute tests
+    _grid = LazyFakeGrid(rows=_rows, columns=3, visible_rows=25, latency=_latency)
+    _table = Table(element=GuiElement(element=_grid))
+    _start = time.perf_counter()
+    _streamed = sum(1 for _ in _table.iter_rows())
+    _streamed_time = time.perf_counter() - _start
+    _streamed_scrolls = _grid.scrolls
+
+    _grid = LazyFakeGrid(rows=_rows, columns=3, visible_rows=25, latency=_latency)
+    _table = Table(element=GuiElement(element=_grid))
+    _start = time.perf_counter()
+    for _row in range(_rows):
+        _table.scroll_to_row(_row)
+        _table.get_row_data(_row)
+    _per_row_time = time.perf_counter() - _start
+
+    assert _streamed == _rows
+    assert _streamed_time < _per_row_time
+    assert _streamed_scrolls == 16
+    assert _grid.scrolls == _rows
+
+
+def test_7() -> None:
+    """
+    _summary_ : Test that column titles are fetched once per Table and shared by every TableRow
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _grid = FakeGrid(rows=50, columns=4)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    _values = [getattr(row, "Title COL2") for row in _table]
+    assert _values == [f"{r}:COL2" for r in range(50)]
+    # ColumnOrder + 4 titles + RowCount + one read per row
+    assert _grid.calls == 1 + 4 + 1 + 50
+    assert [row.COL1 for row in _table][7] == "7:COL1"
+    assert _table.columns.widths == (10, 10, 10, 10)
+    assert _table.columns.types == ("C", "C", "C", "C")
+    try:
+        next(iter(_table)).MISSING
+        assert False
+    except AttributeError as e:
+        assert "Title COL0" in str(e)
+
+
+def test_8() -> None:
+    """
+    _summary_ : Test that the column metadata cache is rebuilt when ColumnOrder changes
+    """
+    # Prepare test data
+    from SapScript.Gui.elements import GuiElement, Table
+
+    _grid = FakeGrid(rows=3, columns=3)
+    _table = Table(element=GuiElement(element=_grid))
+
+    # Execute tests
+    _columns = _table.refresh_columns()
+    assert _columns.titles == ("Title COL0", "Title COL1", "Title COL2")
+    assert _table.refresh_columns() is _columns
+    _grid._column_ids = ["COL2", "COL0", "COL1"]
+    assert _table.refresh_columns() is not _columns
+    assert _table.get_column_titles() == ["Title COL2", "Title COL0", "Title COL1"]
+    assert getattr(next(iter(_table)), "Title COL2") == "0:COL2"
@@ -0,0 +1,53 @@
+def test_1() -> None:
+    """
+    _summary_ : Test resolving key combinations, synonyms and modifier permutations to VKey ids
+    """
+    # Prepare test data
+    from SapScript.Gui.vkeys import VKey, VKeys
+
+    _keys = VKeys()
+
+    # Execute tests
+    assert _keys.get_key_id("ENTER") is VKey.ENTER
+    assert _keys.get_key_id(" f3 ") == 3
+    assert _keys.get_key_id("Control + F10") is VKey.CTRL_F10
+    assert _keys.get_key_id("SHIFT+CTRL+F1") is _keys.get_key_id("CTRL+SHIFT+F1") is VKey.CTRL_SHIFT_F1
+    assert _keys.get_key_id("shift+delete") is VKey.SHIFT_DEL
+    assert _keys.get_key_id("CTRL+INSERT") is VKey.CTRL_INS
+    assert _keys.get_key_id("ctrl+s") is VKey.F11
+    assert _keys.get_key_id("ESC") == _keys.get_key_id("escape") == 12
+    assert _keys.get_key_id("CTRL+#") == 97
+    assert _keys.get_key_id("CTRL+Q") is None
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that numeric virtual key ids resolve to VKey and undefined ids to None
+    """
+    # Prepare test data
+    from SapScript.Gui.vkeys import VKey, get_key_id
+
+    # Execute tests
+    assert get_key_id("0") is VKey.ENTER
+    assert get_key_id(" 71 ") is VKey.CTRL_F
+    assert get_key_id(37) is VKey.CTRL_SHIFT_F1
+    assert get_key_id(13) is None
+    assert get_key_id("150") is None
+    assert isinstance(get_key_id("F8"), int)
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that the precomputed keymap resolves the same ids as a linear search over the key table
+    """
+    # Prepare test data
+    from SapScript.Gui.vkeys import VKEYS, VKeys
+
+    _keys = ["ENTER", "F3", "Shift + F4", "CONTROL+F10", "SHIFT+DELETE", "CTRL+#"]
+
+    def _linear(key: str) -> int:
+        _search = key.strip().upper().replace(" ", "").replace("CONTROL", "CTRL").replace("DELETE", "DEL")
+        return list(VKEYS).index(_search.replace("INSERT", "INS"))
+
+    # Execute tests
+    assert [_linear(k) for k in _keys] == [VKeys().get_key_id(k) for k in _keys]
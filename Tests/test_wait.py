@@ -0,0 +1,73 @@
+def _simulated_sap(busy_time: float) -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend(busy_time=busy_time)
+    _sim.add_screen(
+        SimScreen("VA02_INITIAL", "SAPMV45A", 102, elements=[Field("ctxtVBAK-VBELN")], keys={0: "VA02_OVERVIEW"}),
+        transaction="VA02",
+    )
+    _sim.add_screen(SimScreen("VA02_OVERVIEW", "SAPMV45A", 4001))
+    return SAP("DEV", backend=_sim)
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that wait_until_idle returns as soon as a busy session becomes idle and records the wait
+    """
+    # Prepare test data
+    _sap = _simulated_sap(busy_time=0.1)
+
+    # Execute tests
+    assert _sap.start_transaction("VA02").ok
+    assert _sap.session.Busy
+    _result = _sap.wait_until_idle(timeout=2)
+    assert _result.ok
+    assert 0.09 <= _result.value < 0.5
+    assert not _sap.session.Busy
+    assert _sap.wait_until_idle().value < 0.01
+    assert _sap.waits.count["idle"] == 2
+    assert _sap.waits.max_seconds["idle"] == _result.value
+    assert _sap.send_key("ENTER", wait=True).ok
+    assert not _sap.session.Busy
+    assert _sap.waits.count["idle"] == 3
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test waiting for a screen and an element, and that waits time out with a TimeoutError
+    """
+    # Prepare test data
+    _sap = _simulated_sap(busy_time=0.05)
+
+    # Execute tests
+    _sap.start_transaction("VA02")
+    assert _sap.wait_for_screen("SAPMV45A", "0102", timeout=2).ok
+    assert _sap.wait_for_element("wnd[0]/usr/ctxtVBAK-VBELN").value.type == "GuiTextField"
+    _result = _sap.wait_for_screen("SAPMV45A", 4001, timeout=0.1)
+    assert not _result.ok
+    assert isinstance(_result.error, TimeoutError)
+    assert not _sap.wait_for_element("wnd[1]/usr/btnSPOP-OPTION1", timeout=0.1).ok
+    assert _sap.waits.timeouts == {"screen": 1, "element": 1}
+    _sap.send_key("ENTER")
+    assert _sap.wait_for_screen("SAPMV45A", 4001, timeout=2).ok
+    assert _sap.waits.count["screen"] == 3
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test that poll backs off exponentially and never sleeps when the condition already holds
+    """
+    # Prepare test data
+    from unittest import mock
+    from SapScript.Core import wait
+
+    _checks = iter([False, False, False, False, True])
+
+    # Execute tests
+    with mock.patch.object(wait.time, "sleep") as _sleep:
+        assert wait.poll(lambda: next(_checks), initial_delay=0.01, max_delay=0.03)[0] is True
+        assert [round(c.args[0], 3) for c in _sleep.call_args_list] == [0.01, 0.02, 0.03, 0.03]
+        _sleep.reset_mock()
+        assert wait.poll(lambda: "ready")[0] == "ready"
+        _sleep.assert_not_called()
@@ -0,0 +1,164 @@
+def _simulated_sap() -> object:
+    from SapScript.Backend import Field, SimScreen, SimulatorBackend
+    from SapScript.Core.sap import SAP
+
+    _sim = SimulatorBackend()
+    _sim.add_screen(SimScreen("ZORDER", "SAPLZORDER", 100, elements=[Field("txtORDER")]), transaction="ZORDER")
+    _sim.add_screen(SimScreen("ZSAVE", "SAPLZORDER", 200, popup=("Save Document", "Do you want to save the changes?")), transaction="ZSAVE")
+    _sim.add_screen(SimScreen("ZINFO", "SAPLZORDER", 300, popup="Information"), transaction="ZINFO")
+    _sim.add_screen(SimScreen("ZODD", "SAPLZORDER", 400, popup="Unexpected"), transaction="ZODD")
+    _sap = SAP("DEV", backend=_sim)
+    return _sap, _sim
+
+
+def test_1() -> None:
+    """
+    _summary_ : Test that popups matching a rule are dismissed after the action with a key or a button
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+    _sap.windows.add_rule(title="save document", text="*save the changes*", button="usr/btnSPOP-OPTION1")
+    _sap.windows.add_rule(title="Info*", key="ENTER")
+
+    # Execute tests
+    assert _sap.start_transaction("ZSAVE").ok
+    assert _sap.session.Children.Count == 1
+    assert _sim.calls["Press"] == 1
+    assert _sap.start_transaction("ZINFO").ok
+    assert _sap.session.Children.Count == 1
+    assert _sim.calls["sendVKey"] == 1
+    assert (_sap.windows.popups, _sap.windows.dismissed, _sap.windows.unmatched) == (2, 2, 0)
+    _sim.reset_counters()
+    _sap.start_transaction("ZORDER")
+    assert _sim.calls["Children"] == 1 and _sim.calls["Text"] == 0
+
+
+def test_2() -> None:
+    """
+    _summary_ : Test that a popup without a rule is reported and left open
+    """
+    # Prepare test data
+    _sap, _sim = _simulated_sap()
+    _sap.windows.add_rule(title="Information", key="ENTER")
+
+    # Execute tests
+    _started = _sap.start_transaction("ZODD")
+    assert not _started.ok and "wnd[1] 'Unexpected'" in _started.message
+    assert _sap.current_transaction == "ZODD"
+    assert _sap.session.Children.Count == 2
+    _result = _sap.dismiss_popups()
+    assert not _result.ok and isinstance(_result.error, LookupError)
+    assert [(m.window, m.title, m.dismissed) for m in _result.value] == [("wnd[1]", "Unexpected", False)]
+    _sap.windows.add_rule(title="Unexpected", key="F12", name="cancel unexpected")
+    _result = _sap.dismiss_popups()
+    assert _result.ok and _result.value[0].rule.name == "cancel unexpected"
+    assert _sap.session.Children.Count == 1
+
+
+def test_3() -> None:
+    """
+    _summary_ : Test the rule index, rule validation and the bounded window registry
+    """
+    from SapScript.Core.windows import PopupRule, WindowWatcher
+
+    # Prepare test data
+    _watcher = WindowWatcher(maxsize=2)
+    _exact = _watcher.add_rule(title="Information", key="ENTER")
+    _pattern = _watcher.add_rule(title="*", text="*locked*", key="F12")
+    _texts = []
+
+    # Execute tests
+    assert _watcher.match("INFORMATION") is _exact
+    assert _watcher.match("Warning", lambda: _texts.append(1) or "Order is locked") is _pattern
+    assert _watcher.match("Warning", lambda: "Order saved") is None
+    assert _texts == [1]
+    assert _watcher.match("Information", lambda: _texts.append(2) or "") is _exact
+    assert _texts == [1]
+    for _args in ({"key": "ENTER"}, {"title": "X"}, {"title": "X", "key": "ENTER", "button": "usr/btnOK"}, {"title": "X", "key": "NOKEY"}):
+        try:
+            PopupRule(**_args)
+            assert False
+        except ValueError as _:
+            pass
+    for _i in range(5):
+        _watcher.remember(f"wnd[{_i}]", object())
+    assert list(_watcher.registry) == ["wnd[3]", "wnd[4]"]
+
+
+def test_4() -> None:
+    """
+    _summary_ : Test that a rule that does not close its popup is applied once and reported
+    """
+    from SapScript.Core.windows import WindowWatcher
+
+    # Prepare test data
+    class _Window:
+        def __init__(self, id: str, text: str) -> None:
+            self.Id = f"/app/con[0]/ses[0]/{id}"
+            self.Text = text
+            self.keys: list[int] = []
+
+        def sendVKey(self, key: int) -> None:
+            self.keys.append(key)
+
+    class _Children(list):
+        @property
+        def Count(self) -> int:
+            return len(self)
+
+    class _Session:
+        def __init__(self) -> None:
+            self.popup = _Window("wnd[1]", "Stuck")
+            self.Children = _Children([_Window("wnd[0]", "Main"), self.popup])
+
+    _session = _Session()
+    _watcher = WindowWatcher(max_rounds=5)
+    _watcher.add_rule(title="Stuck", key="ENTER", name="enter on stuck")
+
+    # Execute tests
+    _matches = _watcher.check(_session)
+    assert _session.popup.keys == [0]
+    assert len(_matches) == 1 and not _matches[0].dismissed and not _matches[0].closed
+    assert _matches[0].rule.name == "enter on stuck"
+    assert (_watcher.popups, _watcher.dismissed, _watcher.failed) == (1, 0, 1)
+
+
+def test_5() -> None:
+    """
+    _summary_ : Test that chained popups with the same id and title are each dismissed and not taken for a stuck popup
+    """
+    from SapScript.Core.windows import WindowWatcher
+
+    # Prepare test data
+    class _Children(list):
+        @property
+        def Count(self) -> int:
+            return len(self)
+
+    class _Session:
+        def __init__(self, popups: int) -> None:
+            self.Children = _Children([_Window(self, "wnd[0]", "Main", 1)])
+            self.queued = [_Window(self, "wnd[1]", "Information", 2 + i) for i in range(popups)]
+            self.Children.append(self.queued.pop(0))
+
+    class _Window:
+        def __init__(self, session: _Session, id: str, text: str, handle: int) -> None:
+            self.session = session
+            self.Id = f"/app/con[0]/ses[0]/{id}"
+            self.Text = text
+            self.Handle = handle
+
+        def sendVKey(self, key: int) -> None:
+            self.session.Children.remove(self)
+            if self.session.queued:
+                self.session.Children.append(self.session.queued.pop(0))
+
+    _session = _Session(popups=2)
+    _watcher = WindowWatcher()
+    _watcher.add_rule(title="Information", key="ENTER")
+
+    # Execute tests
+    _matches = _watcher.check(_session)
+    assert [(m.window, m.title, m.dismissed) for m in _matches] == [("wnd[1]", "Information", True)] * 2
+    assert _session.Children.Count == 1
+    assert (_watcher.popups, _watcher.dismissed, _watcher.failed) == (2, 2, 0)
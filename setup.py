@@ -31,7 +31,7 @@ setup(
     },
     python_requires=">=3.13",
     install_requires=[
-        "pywin32>=308",
+        "pywin32>=308; sys_platform == 'win32'",
         "pluggy>=1.5.0",
         "bigtree==0.25.1",
         "colorama==0.4.6",
@@ -42,6 +42,12 @@ setup(
     extras_require={
         "dev": [
             "pytest>=8.3.5",
-        ]
+        ],
+        "arrow": [
+            "pyarrow>=15.0.0",
+        ],
+        "otel": [
+            "opentelemetry-api>=1.20.0",
+        ],
     },
 )